@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 from typing import Any
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from .config.migration import async_migrate_config_entry
 from .config.schemas import MerakiConfigSchema
 from .const import (
+    ATTR_NETWORK_ID,
     CONF_API_KEY,
     CONF_AUTO_DISCOVERY,
     CONF_DISCOVERY_INTERVAL,
@@ -40,6 +44,7 @@ from .const import (
     ORG_HUB_SUFFIX,
     SEMI_STATIC_DATA_REFRESH_INTERVAL,
     SENSOR_TYPE_MT,
+    SERVICE_FORCE_REFRESH,
     STATIC_DATA_REFRESH_INTERVAL,
 )
 from .coordinator import MerakiSensorCoordinator
@@ -82,14 +87,44 @@ def _setup_logging():
 # Initialize logging configuration
 _setup_logging()
 
+FORCE_REFRESH_SCHEMA = vol.Schema({vol.Optional(ATTR_NETWORK_ID): cv.string})
+
+
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register integration services once.
 
-    The MT-only build exposes no user-facing services (the former camera-RTSP
-    and switch-PoE services were removed with MV/MS support). Kept as a no-op so
-    the setup call site is stable.
+    ``force_refresh`` bypasses the readings cache: each organization fetches
+    one fresh snapshot and refreshes its coordinators from it, optionally only
+    those of the network given by ``network_id``.
     """
-    return
+    if hass.services.has_service(DOMAIN, SERVICE_FORCE_REFRESH):
+        return
+
+    async def _async_force_refresh(call: ServiceCall) -> None:
+        network_id = call.data.get(ATTR_NETWORK_ID)
+        refreshes = []
+        for domain_data in hass.data.get(DOMAIN, {}).values():
+            org_hub = domain_data.get("organization_hub")
+            coordinators = [
+                coordinator
+                for coordinator in domain_data.get("coordinators", {}).values()
+                if network_id is None or coordinator.hub.network_id == network_id
+            ]
+            if org_hub is not None and coordinators:
+                refreshes.append(org_hub.async_force_refresh(coordinators))
+
+        if network_id is not None and not refreshes:
+            raise ServiceValidationError(
+                f"No Meraki network with ID {network_id} has MT sensors to refresh"
+            )
+        await asyncio.gather(*refreshes)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORCE_REFRESH,
+        _async_force_refresh,
+        schema=FORCE_REFRESH_SCHEMA,
+    )
 
 
 def _build_startup_summary(
@@ -298,6 +333,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Failed to set up organization hub")
             return False
 
+        # Request only readings metrics that still have an enabled entity
+        entry.async_on_unload(org_hub.async_track_enabled_metrics())
+
         # Initialize domain data storage
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN][entry.entry_id] = {
@@ -360,6 +398,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     hub_id,
                     DEVICE_TYPE_SCAN_INTERVALS.get(hub.device_type, scan_interval),
                 )
+                # Hubs with door/water/button sensors tick at the fast-lane
+                # cadence; the full-metric readings stay on their own TTL.
+                fast_lane_interval = org_hub.fast_lane_interval
+                if fast_lane_interval is not None and hub.has_fast_lane_devices:
+                    hub_scan_interval = min(hub_scan_interval, int(fast_lane_interval))
 
                 coordinator = MerakiSensorCoordinator(
                     hass,
@@ -21,7 +21,7 @@ from .const import (
 )
 from .coordinator import MerakiSensorCoordinator
 from .entities.base import MerakiBinarySensorEntity
-from .utils import should_create_entity
+from .utils import build_capability_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -143,10 +143,13 @@ class MerakiMTBinarySensor(MerakiBinarySensorEntity):
         # Use transformer to process data consistently
         from .data.transformers import transformer_registry
 
-        transformed_data = transformer_registry.transform_device_data("MT", device_data)
+        key = self.entity_description.key
+        transformed_data = transformer_registry.transform_device_data(
+            "MT", device_data, (key,)
+        )
 
         # Get the value for our specific metric
-        value = transformed_data.get(self.entity_description.key)
+        value = transformed_data.get(key)
 
         if value is None:
             return None
@@ -173,7 +176,13 @@ class MerakiMTBinarySensor(MerakiBinarySensorEntity):
             return False
 
         readings = device_data.get("readings", [])
-        return len(readings) > 0
+        if not readings:
+            return False
+
+        # Readings past the configured staleness threshold are not current
+        return not self.coordinator.reading_is_stale(
+            self._device_serial, self.entity_description.key
+        )
 
     # extra_state_attributes property is inherited from base class
 
@@ -190,10 +199,15 @@ def _setup_mt_binary_sensors(
         if isinstance(coordinator.data, dict)
         else None
     )
+    capability_index = build_capability_index(network_hub.devices, coordinator_payload)
+
     for device in network_hub.devices:
         device_serial = device.get("serial")
         if not device_serial:
             continue
+        capabilities: frozenset[str] | None = capability_index.get(
+            device_serial, frozenset()
+        )
 
         _LOGGER.debug(
             "Creating binary sensors for MT device: %s (model: %s)",
@@ -204,7 +218,7 @@ def _setup_mt_binary_sensors(
         entities_created_for_device = 0
         for metric in MT_BINARY_SENSOR_METRICS:
             if metric in MT_BINARY_SENSOR_DESCRIPTIONS:
-                if should_create_entity(device, metric, coordinator_payload):
+                if capabilities is None or metric in capabilities:
                     description = MT_BINARY_SENSOR_DESCRIPTIONS[metric]
                     entities.append(
                         MerakiMTBinarySensor(
@@ -96,15 +96,10 @@ class MerakiUpdateSensorDataButton(MerakiButtonEntity):
                 _LOGGER.warning("No coordinators found for sensor data update")
                 return
 
-            # Request refresh for all coordinators
-            update_count = 0
-            for coordinator in coordinators.values():
-                await coordinator.async_request_refresh()
-                update_count += 1
+            # One fresh org-wide fetch, fanned out to every coordinator
+            await self.org_hub.async_force_refresh(list(coordinators.values()))
 
-            _LOGGER.info(
-                "Requested sensor data update for %d coordinators", update_count
-            )
+            _LOGGER.info("Updated sensor data for %d coordinators", len(coordinators))
 
         except Exception as err:
             _LOGGER.error("Error updating sensor data: %s", err, exc_info=True)
@@ -24,13 +24,22 @@ from .config.schemas import (
     OrganizationIDConfig,
 )
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MAX,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MIN,
     CONF_API_KEY,
     CONF_AUTO_DISCOVERY,
     CONF_BASE_URL,
+    CONF_BINARY_FAST_LANE_ENABLED,
+    CONF_BINARY_FAST_LANE_INTERVAL,
+    CONF_DEADBAND_ENABLED,
+    CONF_DEADBAND_MAX_AGE,
+    CONF_DIAGNOSTIC_UPDATE_INTERVAL,
     CONF_DISCOVERY_INTERVAL,
     CONF_DYNAMIC_DATA_INTERVAL,
     CONF_ENABLED_DEVICE_TYPES,
     CONF_EXTENDED_CACHE_TTL,
+    CONF_GATEWAY_CONNECTIONS_INTERVAL,
     CONF_HUB_AUTO_DISCOVERY,
     CONF_HUB_DISCOVERY_INTERVAL,
     CONF_HUB_DISCOVERY_INTERVALS,
@@ -38,28 +47,54 @@ from .const import (
     CONF_HUB_SCAN_INTERVALS,
     CONF_HUB_SELECTION,
     CONF_LONG_CACHE_TTL,
+    CONF_METRIC_DEADBANDS,
     CONF_MT_REFRESH_ENABLED,
     CONF_MT_REFRESH_INTERVAL,
     CONF_ORGANIZATION_ID,
     CONF_SCAN_INTERVAL,
     CONF_SELECTED_DEVICES,
     CONF_SEMI_STATIC_DATA_INTERVAL,
+    CONF_STALE_READING_THRESHOLD,
     CONF_STANDARD_CACHE_TTL,
     CONF_STATIC_DATA_INTERVAL,
+    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL_MAX,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL_MIN,
     DEFAULT_BASE_URL,
+    DEFAULT_BINARY_FAST_LANE_ENABLED,
+    DEFAULT_BINARY_FAST_LANE_INTERVAL,
+    DEFAULT_DEADBAND_ENABLED,
+    DEFAULT_DEADBAND_MAX_AGE,
+    DEFAULT_DIAGNOSTIC_UPDATE_INTERVAL,
     DEFAULT_DISCOVERY_INTERVAL,
     DEFAULT_DISCOVERY_INTERVAL_MINUTES,
     DEFAULT_EXTENDED_CACHE_TTL,
+    DEFAULT_GATEWAY_CONNECTIONS_INTERVAL,
     DEFAULT_LONG_CACHE_TTL,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL_MINUTES,
+    DEFAULT_STALE_READING_THRESHOLD,
     DEFAULT_STANDARD_CACHE_TTL,
+    DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES,
     DEVICE_TYPE_MIN_SCAN_INTERVALS,
     DEVICE_TYPE_SCAN_INTERVALS,
     DOMAIN,
+    MAX_ADAPTIVE_SCAN_INTERVAL,
+    MAX_BINARY_FAST_LANE_INTERVAL,
+    MAX_DEADBAND_MAX_AGE,
+    MAX_DIAGNOSTIC_UPDATE_INTERVAL,
+    MAX_GATEWAY_CONNECTIONS_INTERVAL,
+    MAX_STALE_READING_THRESHOLD,
+    MIN_ADAPTIVE_SCAN_INTERVAL,
+    MIN_BINARY_FAST_LANE_INTERVAL,
+    MIN_DEADBAND_MAX_AGE,
+    MIN_DIAGNOSTIC_UPDATE_INTERVAL,
     MIN_DISCOVERY_INTERVAL_MINUTES,
+    MIN_GATEWAY_CONNECTIONS_INTERVAL,
     MIN_SCAN_INTERVAL_MINUTES,
+    MIN_STALE_READING_THRESHOLD,
     MT_REFRESH_COMMAND_INTERVAL,
     MT_REFRESH_MAX_INTERVAL,
     MT_REFRESH_MIN_INTERVAL,
@@ -661,10 +696,37 @@ class MerakiDashboardOptionsFlow(config_entries.OptionsFlow):
                 CONF_STATIC_DATA_INTERVAL,
                 CONF_SEMI_STATIC_DATA_INTERVAL,
                 CONF_DYNAMIC_DATA_INTERVAL,
+                CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+                CONF_DEADBAND_ENABLED,
+                CONF_METRIC_DEADBANDS,
+                CONF_BINARY_FAST_LANE_ENABLED,
+                CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
             ):
                 if key in user_input:
                     options[key] = user_input[key]
 
+            if CONF_DEADBAND_MAX_AGE in user_input:
+                options[CONF_DEADBAND_MAX_AGE] = int(user_input[CONF_DEADBAND_MAX_AGE])
+
+            if CONF_BINARY_FAST_LANE_INTERVAL in user_input:
+                options[CONF_BINARY_FAST_LANE_INTERVAL] = int(
+                    user_input[CONF_BINARY_FAST_LANE_INTERVAL]
+                )
+
+            if CONF_GATEWAY_CONNECTIONS_INTERVAL in user_input:
+                options[CONF_GATEWAY_CONNECTIONS_INTERVAL] = int(
+                    user_input[CONF_GATEWAY_CONNECTIONS_INTERVAL]
+                )
+
+            for key in (
+                CONF_ADAPTIVE_SCAN_INTERVAL_MIN,
+                CONF_ADAPTIVE_SCAN_INTERVAL_MAX,
+                CONF_DIAGNOSTIC_UPDATE_INTERVAL,
+                CONF_STALE_READING_THRESHOLD,
+            ):
+                if key in user_input:
+                    options[key] = int(user_input[key])
+
             if CONF_MT_REFRESH_INTERVAL in user_input:
                 options[CONF_MT_REFRESH_INTERVAL] = int(
                     user_input[CONF_MT_REFRESH_INTERVAL]
@@ -827,6 +889,156 @@ class MerakiDashboardOptionsFlow(config_entries.OptionsFlow):
             )
         )
 
+        # Gateway connectivity (RSSI/last-seen) refresh tier - default 5 minutes
+        schema_dict[
+            vol.Optional(
+                CONF_GATEWAY_CONNECTIONS_INTERVAL,
+                default=current_options.get(
+                    CONF_GATEWAY_CONNECTIONS_INTERVAL,
+                    DEFAULT_GATEWAY_CONNECTIONS_INTERVAL,
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_GATEWAY_CONNECTIONS_INTERVAL,
+                max=MAX_GATEWAY_CONNECTIONS_INTERVAL,
+                step=30,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+        # Fast lane for door/water/button readings
+        schema_dict[
+            vol.Optional(
+                CONF_BINARY_FAST_LANE_ENABLED,
+                default=current_options.get(
+                    CONF_BINARY_FAST_LANE_ENABLED, DEFAULT_BINARY_FAST_LANE_ENABLED
+                ),
+            )
+        ] = selector.BooleanSelector()
+        schema_dict[
+            vol.Optional(
+                CONF_BINARY_FAST_LANE_INTERVAL,
+                default=current_options.get(
+                    CONF_BINARY_FAST_LANE_INTERVAL, DEFAULT_BINARY_FAST_LANE_INTERVAL
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_BINARY_FAST_LANE_INTERVAL,
+                max=MAX_BINARY_FAST_LANE_INTERVAL,
+                step=1,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+        # Adaptive per-hub scan interval
+        schema_dict[
+            vol.Optional(
+                CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+                default=current_options.get(
+                    CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+                    DEFAULT_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+                ),
+            )
+        ] = selector.BooleanSelector()
+        for key, default in (
+            (CONF_ADAPTIVE_SCAN_INTERVAL_MIN, DEFAULT_ADAPTIVE_SCAN_INTERVAL_MIN),
+            (CONF_ADAPTIVE_SCAN_INTERVAL_MAX, DEFAULT_ADAPTIVE_SCAN_INTERVAL_MAX),
+        ):
+            schema_dict[
+                vol.Optional(key, default=current_options.get(key, default))
+            ] = selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_ADAPTIVE_SCAN_INTERVAL,
+                    max=MAX_ADAPTIVE_SCAN_INTERVAL,
+                    step=30,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            )
+
+        # Maximum write frequency of the push-updated API diagnostic sensors
+        schema_dict[
+            vol.Optional(
+                CONF_DIAGNOSTIC_UPDATE_INTERVAL,
+                default=current_options.get(
+                    CONF_DIAGNOSTIC_UPDATE_INTERVAL, DEFAULT_DIAGNOSTIC_UPDATE_INTERVAL
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_DIAGNOSTIC_UPDATE_INTERVAL,
+                max=MAX_DIAGNOSTIC_UPDATE_INTERVAL,
+                step=1,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+        # Mark MT entities unavailable once their readings are this old
+        schema_dict[
+            vol.Optional(
+                CONF_STALE_READING_THRESHOLD,
+                default=current_options.get(
+                    CONF_STALE_READING_THRESHOLD, DEFAULT_STALE_READING_THRESHOLD
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_STALE_READING_THRESHOLD,
+                max=MAX_STALE_READING_THRESHOLD,
+                step=60,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+        # Expose per-reading attributes as diagnostic entities (recorder-friendly)
+        schema_dict[
+            vol.Optional(
+                CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+                default=current_options.get(
+                    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+                    DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES,
+                ),
+            )
+        ] = selector.BooleanSelector()
+
+        # Significant-change filtering for MT sensor state writes
+        schema_dict[
+            vol.Optional(
+                CONF_DEADBAND_ENABLED,
+                default=current_options.get(
+                    CONF_DEADBAND_ENABLED, DEFAULT_DEADBAND_ENABLED
+                ),
+            )
+        ] = selector.BooleanSelector()
+        schema_dict[
+            vol.Optional(
+                CONF_DEADBAND_MAX_AGE,
+                default=current_options.get(
+                    CONF_DEADBAND_MAX_AGE, DEFAULT_DEADBAND_MAX_AGE
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_DEADBAND_MAX_AGE,
+                max=MAX_DEADBAND_MAX_AGE,
+                step=30,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+        schema_dict[
+            vol.Optional(
+                CONF_METRIC_DEADBANDS,
+                default=current_options.get(CONF_METRIC_DEADBANDS, {}),
+            )
+        ] = selector.ObjectSelector()
+
         # 4. Add update API key checkbox
         schema_dict[vol.Optional("update_api_key", default=False)] = (
             selector.BooleanSelector()
@@ -42,6 +42,27 @@ CONF_DYNAMIC_DATA_INTERVAL: Final = "dynamic_data_interval"
 # Device type enablement configuration
 CONF_ENABLED_DEVICE_TYPES: Final = "enabled_device_types"
 
+# Expose volatile attributes (last_reported_at, temperature_fahrenheit) as
+# separate diagnostic entities instead of state attributes
+CONF_VOLATILE_ATTRIBUTE_ENTITIES: Final = "volatile_attribute_entities"
+DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES: Final = False
+
+# Significant-change filtering for MT sensor state writes
+CONF_DEADBAND_ENABLED: Final = "deadband_enabled"
+CONF_DEADBAND_MAX_AGE: Final = "deadband_max_age"
+CONF_METRIC_DEADBANDS: Final = "metric_deadbands"
+DEFAULT_DEADBAND_ENABLED: Final = False
+DEFAULT_DEADBAND_MAX_AGE: Final = 300  # seconds - heartbeat write interval
+MIN_DEADBAND_MAX_AGE: Final = 60
+MAX_DEADBAND_MAX_AGE: Final = 3600
+
+# MT readings older than this many seconds mark their entities unavailable
+# (0 disables staleness checks). Event-driven metrics are never stale.
+CONF_STALE_READING_THRESHOLD: Final = "stale_reading_threshold"
+DEFAULT_STALE_READING_THRESHOLD: Final = 0  # seconds - disabled
+MIN_STALE_READING_THRESHOLD: Final = 0
+MAX_STALE_READING_THRESHOLD: Final = 86400
+
 # MT (Environmental) sensor metrics
 MT_SENSOR_APPARENT_POWER: Final = "apparentPower"
 MT_SENSOR_BATTERY: Final = "battery"
@@ -91,6 +112,9 @@ ORG_SENSOR_LICENSE_INVENTORY: Final = "license_inventory"
 ORG_SENSOR_RECENT_ALERTS: Final = "recent_alerts"
 ORG_SENSOR_UPLINK_STATUS: Final = "uplink_status"
 
+# Services
+SERVICE_FORCE_REFRESH: Final = "force_refresh"
+
 # Hub types
 HUB_TYPE_ORGANIZATION: Final = "organization"
 HUB_TYPE_NETWORK: Final = "network"
@@ -101,6 +125,7 @@ ATTR_NETWORK_NAME: Final = "network_name"
 ATTR_SERIAL: Final = "serial"
 ATTR_MODEL: Final = "model"
 ATTR_LAST_REPORTED_AT: Final = "last_reported_at"
+ATTR_TEMPERATURE_FAHRENHEIT: Final = "temperature_fahrenheit"
 
 # Event configuration
 EVENT_TYPE: Final = "meraki_dashboard_event"
@@ -132,6 +157,9 @@ EVENT_FETCH_TIMEOUT_SECONDS: Final = 15
 API_PRIORITY_HIGH: Final = 0
 API_PRIORITY_NORMAL: Final = 10
 API_PRIORITY_LOW: Final = 20
+# MT15/MT40 refreshData action batches: behind readings and setup calls, ahead
+# of low-priority diagnostics
+API_PRIORITY_MT_REFRESH: Final = 15
 
 # Scan intervals (in seconds)
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes
@@ -185,6 +213,40 @@ CONF_STANDARD_CACHE_TTL: Final = "standard_cache_ttl"
 CONF_EXTENDED_CACHE_TTL: Final = "extended_cache_ttl"
 CONF_LONG_CACHE_TTL: Final = "long_cache_ttl"
 
+# Refresh tier for org-wide MT gateway connectivity (RSSI + last-seen), in seconds.
+# Diagnostic-only, so it refreshes less often than the sensor readings.
+CONF_GATEWAY_CONNECTIONS_INTERVAL: Final = "gateway_connections_interval"
+DEFAULT_GATEWAY_CONNECTIONS_INTERVAL: Final = 300  # 5 minutes
+MIN_GATEWAY_CONNECTIONS_INTERVAL: Final = 30
+MAX_GATEWAY_CONNECTIONS_INTERVAL: Final = 3600
+
+# Fast lane for binary MT metrics (door, water, button): a frequent
+# metrics-filtered readings call merged over the slower full-metric call.
+CONF_BINARY_FAST_LANE_ENABLED: Final = "binary_fast_lane_enabled"
+CONF_BINARY_FAST_LANE_INTERVAL: Final = "binary_fast_lane_interval"
+DEFAULT_BINARY_FAST_LANE_ENABLED: Final = False
+DEFAULT_BINARY_FAST_LANE_INTERVAL: Final = 10  # seconds
+MIN_BINARY_FAST_LANE_INTERVAL: Final = 5
+MAX_BINARY_FAST_LANE_INTERVAL: Final = 60
+
+# Minimum seconds between state writes of the push-updated org hub
+# diagnostic sensors (API calls, queue depth, throttling).
+CONF_DIAGNOSTIC_UPDATE_INTERVAL: Final = "diagnostic_update_interval"
+DEFAULT_DIAGNOSTIC_UPDATE_INTERVAL: Final = 10  # seconds
+MIN_DIAGNOSTIC_UPDATE_INTERVAL: Final = 1
+MAX_DIAGNOSTIC_UPDATE_INTERVAL: Final = 300
+
+# Adaptive per-hub scan interval: stretch quiet hubs and shrink busy ones
+# within these bounds, based on how often ticks bring new, changing readings.
+CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED: Final = "adaptive_scan_interval_enabled"
+CONF_ADAPTIVE_SCAN_INTERVAL_MIN: Final = "adaptive_scan_interval_min"
+CONF_ADAPTIVE_SCAN_INTERVAL_MAX: Final = "adaptive_scan_interval_max"
+DEFAULT_ADAPTIVE_SCAN_INTERVAL_ENABLED: Final = False
+DEFAULT_ADAPTIVE_SCAN_INTERVAL_MIN: Final = 60  # seconds
+DEFAULT_ADAPTIVE_SCAN_INTERVAL_MAX: Final = 900  # 15 minutes
+MIN_ADAPTIVE_SCAN_INTERVAL: Final = 30
+MAX_ADAPTIVE_SCAN_INTERVAL: Final = 3600
+
 # Data type classifications
 STATIC_DATA_TYPES: Final = ["license_inventory", "device_statuses"]
 SEMI_STATIC_DATA_TYPES: Final = ["network_info", "device_info"]
@@ -228,5 +290,32 @@ MT_EVENT_SENSOR_METRICS: Final = [
     MT_SENSOR_WATER,
 ]
 
+# Every readings metric the integration parses; valid values for the
+# getOrganizationSensorReadingsLatest ``metrics`` filter
+MT_READING_METRICS: Final = (
+    MT_SENSOR_APPARENT_POWER,
+    MT_SENSOR_BATTERY,
+    MT_SENSOR_BUTTON,
+    MT_SENSOR_CO2,
+    MT_SENSOR_CURRENT,
+    MT_SENSOR_DOOR,
+    MT_SENSOR_DOWNSTREAM_POWER,
+    MT_SENSOR_FREQUENCY,
+    MT_SENSOR_HUMIDITY,
+    MT_SENSOR_INDOOR_AIR_QUALITY,
+    MT_SENSOR_NO2,
+    MT_SENSOR_NOISE,
+    MT_SENSOR_O3,
+    MT_SENSOR_PM10,
+    MT_SENSOR_PM25,
+    MT_SENSOR_POWER_FACTOR,
+    MT_SENSOR_REAL_POWER,
+    MT_SENSOR_REMOTE_LOCKOUT_SWITCH,
+    MT_SENSOR_TEMPERATURE,
+    MT_SENSOR_TVOC,
+    MT_SENSOR_VOLTAGE,
+    MT_SENSOR_WATER,
+)
+
 # Organization hub suffix
 ORG_HUB_SUFFIX: Final = "Organisation"
@@ -3,22 +3,36 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MAX,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MIN,
+    CONF_STALE_READING_THRESHOLD,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL_MAX,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL_MIN,
+    DEFAULT_STALE_READING_THRESHOLD,
     DOMAIN,
     ENTITY_REMOVAL_MIN_DISCOVERY_PASSES,
+    MT_SENSOR_BUTTON,
+    MT_SENSOR_DOOR,
+    MT_SENSOR_WATER,
 )
 from .types import CoordinatorData, MerakiDeviceData
 from .utils import performance_monitor
+from .utils.cadence import AdaptiveIntervalController, CadenceTracker
 from .utils.error_handling import handle_api_errors
+from .utils.freshness import ReadingFreshnessIndex
 from .utils.retry import with_standard_retries
 
 if TYPE_CHECKING:
@@ -26,12 +40,28 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Metrics only reported on change, so an old reading is still current
+EVENT_DRIVEN_METRICS = frozenset({MT_SENSOR_BUTTON, MT_SENSOR_DOOR, MT_SENSOR_WATER})
+
 
 class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
     """Coordinator to manage fetching Meraki MT sensor data.
 
     One coordinator per network hub drives periodic MT readings updates,
-    consuming the org hub's short-TTL-cached org-wide readings fetch.
+    consuming the org hub's short-TTL-cached org-wide readings fetch. Each
+    update feeds reading timestamps to the org hub's reporting-cadence tracker
+    (shared by every hub polling at the same interval) and schedules the next
+    fetch just after the expected sample, falling back to the fixed
+    ``scan_interval`` when no pattern is found.
+
+    Reading timestamps are parsed once per new sample into a freshness index,
+    so entities can go unavailable once their readings exceed the configured
+    staleness threshold without parsing timestamps on every state access.
+
+    With the adaptive scan interval enabled, the coordinator ticks at the
+    adaptive minimum and an ``AdaptiveIntervalController`` decides per tick
+    whether a fetch is worth making, stretching quiet hubs and shrinking busy
+    ones within the configured bounds.
     """
 
     def __init__(
@@ -51,11 +81,34 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
             scan_interval: Update interval in seconds
             config_entry: Configuration entry for this integration
         """
+        options = config_entry.options
+        self._adaptive: AdaptiveIntervalController | None = None
+        tick_interval = scan_interval
+        if options.get(CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED):
+            minimum = int(
+                options.get(
+                    CONF_ADAPTIVE_SCAN_INTERVAL_MIN, DEFAULT_ADAPTIVE_SCAN_INTERVAL_MIN
+                )
+            )
+            maximum = int(
+                options.get(
+                    CONF_ADAPTIVE_SCAN_INTERVAL_MAX, DEFAULT_ADAPTIVE_SCAN_INTERVAL_MAX
+                )
+            )
+            self._adaptive = AdaptiveIntervalController(scan_interval, minimum, maximum)
+            tick_interval = min(scan_interval, minimum)
+
+        stale_threshold = options.get(
+            CONF_STALE_READING_THRESHOLD, DEFAULT_STALE_READING_THRESHOLD
+        )
+        if not isinstance(stale_threshold, int | float):
+            stale_threshold = DEFAULT_STALE_READING_THRESHOLD
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{hub.hub_name}",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=tick_interval),
         )
         self.hub = hub
         self.network_hub = hub
@@ -72,6 +125,15 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self._missing_device_serials: dict[str, int] = {}
         self._last_cleanup_discovery_time: datetime | None = None
 
+        # Reporting-cadence alignment and staleness: the freshness index keeps
+        # the last seen ``ts`` per (serial, metric) so only new samples are
+        # parsed and fed to the tracker.
+        self._tick_interval = tick_interval
+        self._cadence = hub.organization_hub.readings_cadence(tick_interval)
+        self._freshness = ReadingFreshnessIndex(stale_threshold, EVENT_DRIVEN_METRICS)
+        self._last_fetch_time: float | None = None
+        self._update_event_fetch_interval()
+
         _LOGGER.debug(
             "Device coordinator initialized for %s (%s) with %d devices and %d second update interval",
             hub.hub_name,
@@ -92,6 +154,31 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
         """Get the duration of the last update in seconds."""
         return self._last_update_duration
 
+    @property
+    def cadence(self) -> CadenceTracker:
+        """Get the org's reporting-cadence tracker this network polls on."""
+        return self._cadence
+
+    @property
+    def freshness(self) -> ReadingFreshnessIndex:
+        """Get the per-sensor reading freshness index."""
+        return self._freshness
+
+    def reading_is_stale(self, serial: str, metric: str | None = None) -> bool:
+        """Return True if a sensor's reading is past the staleness threshold.
+
+        Args:
+            serial: Device serial
+            metric: Reading metric; the sensor's latest reading is used when
+                omitted or when the metric has no reading of its own
+        """
+        return self._freshness.is_stale(serial, metric, dt_util.utcnow().timestamp())
+
+    @property
+    def adaptive_interval(self) -> AdaptiveIntervalController | None:
+        """Get the adaptive scan interval controller, if enabled."""
+        return self._adaptive
+
     @performance_monitor("coordinator_update")
     @with_standard_retries("realtime")
     @handle_api_errors(reraise_on=(UpdateFailed,))
@@ -102,6 +189,13 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
         sensor's latest readings (plus merged gateway RSSI / last-seen).
         """
         update_start_time = self.hass.loop.time()
+        if self.data is not None and not self._adaptive_fetch_due(update_start_time):
+            # Keep the tick on the reporting phase while skipping the fetch
+            self.update_interval = timedelta(
+                seconds=self._cadence.next_delay(dt_util.utcnow().timestamp())
+            )
+            return self.data
+
         self._update_count += 1
 
         _LOGGER.debug(
@@ -118,7 +212,10 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
             # cached fetch).
             if self.hub.device_type == "MT":
                 _LOGGER.debug("Fetching MT sensor data from hub %s", self.hub.hub_name)
-                data = await self.hub.async_get_sensor_data()
+                data = await self.hub.async_get_sensor_data(
+                    max_age=self._cadence.max_cache_age(dt_util.utcnow().timestamp())
+                )
+                self._last_fetch_time = update_start_time
                 _LOGGER.debug(
                     "Retrieved MT data for %d devices", len(data) if data else 0
                 )
@@ -150,6 +247,8 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
             await self._async_cleanup_entity_registry()
 
+            self._schedule_cadence_aligned(data)
+
             return data
 
         except Exception as err:
@@ -167,6 +266,82 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
             )
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    def _update_event_fetch_interval(self) -> None:
+        """Tell the hub's event service how far apart readings fetches are."""
+        event_service = getattr(self.hub, "event_service", None)
+        if event_service is None:
+            return
+        event_service.fetch_interval = (
+            self._adaptive.interval
+            if self._adaptive is not None
+            else self.scan_interval
+        )
+
+    def _adaptive_fetch_due(self, now: float) -> bool:
+        """Return True unless the adaptive controller says to skip this tick."""
+        if self._adaptive is None or self._last_fetch_time is None:
+            return True
+        # Polling is org-wide: a snapshot another hub already fetched is free.
+        snapshot_fresh = self.hub.organization_hub.sensor_readings_fresh
+        return self._adaptive.should_fetch(
+            now - self._last_fetch_time, self._tick_interval, snapshot_fresh
+        )
+
+    def _schedule_cadence_aligned(self, data: CoordinatorData | None) -> None:
+        """Feed new samples to the schedulers and set the next interval."""
+        now = dt_util.utcnow().timestamp()
+        sample_times: list[float] = []
+        values: dict[tuple[str, str], float] = {}
+        for serial, device_data in (data or {}).items():
+            if not isinstance(device_data, dict):
+                continue
+            for reading in device_data.get("readings") or ():
+                metric = reading.get("metric")
+                timestamp = reading.get("ts")
+                if not metric or not isinstance(timestamp, str):
+                    continue
+                known = self._freshness.known(serial, metric)
+                if not self._freshness.observe(serial, metric, timestamp):
+                    continue
+                value = _numeric_value(reading.get(metric))
+                if value is not None:
+                    values[(serial, metric)] = value
+                # The first sample seen per metric may be arbitrarily old, so
+                # its delivery lag says nothing about scheduling.
+                if not known:
+                    continue
+                sample_time = self._freshness.reading_time(serial, metric)
+                if sample_time is not None:
+                    sample_times.append(sample_time)
+
+        if self._adaptive is not None:
+            previous_interval = self._adaptive.interval
+            interval = self._adaptive.record(bool(sample_times), values)
+            if interval != previous_interval:
+                _LOGGER.debug(
+                    "Adaptive scan interval for %s: %.0fs -> %.0fs",
+                    self.hub.hub_name,
+                    previous_interval,
+                    interval,
+                )
+                self._update_event_fetch_interval()
+
+        self._cadence.observe(sample_times, now)
+        delay = self._cadence.next_delay(now)
+        self.update_interval = timedelta(seconds=delay)
+        if self._adaptive is None:
+            # Adaptive hubs skip ticks, so only fixed schedules are prefetched.
+            self.hub.organization_hub.async_schedule_readings_prefetch(
+                self.hass.loop.time() + delay
+            )
+        if self._cadence.aligned:
+            _LOGGER.debug(
+                "Next %s fetch in %.1fs, aligned to reporting phase %.1fs",
+                self.hub.hub_name,
+                delay,
+                self._cadence.phase,
+            )
+
     async def async_request_refresh_delayed(self, delay_seconds: int = 5) -> None:
         """Request a delayed refresh of the coordinator data.
 
@@ -361,3 +536,12 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 err,
                 exc_info=True,
             )
+
+
+def _numeric_value(payload: Any) -> float | None:
+    """Return the first numeric value of a reading's metric payload."""
+    candidates = payload.values() if isinstance(payload, Mapping) else (payload,)
+    for candidate in candidates:
+        if isinstance(candidate, int | float) and not isinstance(candidate, bool):
+            return float(candidate)
+    return None
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -44,6 +44,41 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Payload fields holding each binary metric's state, in lookup order. The API
+# nests the state under the metric, e.g. ``{"door": {"open": true}}``.
+BINARY_STATE_FIELDS: dict[str, tuple[str, ...]] = {
+    MT_SENSOR_BUTTON: ("open", "detected"),
+    MT_SENSOR_DOOR: ("open", "detected"),
+    MT_SENSOR_DOWNSTREAM_POWER: ("enabled",),
+    MT_SENSOR_REMOTE_LOCKOUT_SWITCH: ("locked",),
+    MT_SENSOR_WATER: ("present", "wet"),
+}
+
+
+def extract_binary_state(reading: dict[str, Any], metric: str) -> bool | None:
+    """Return a binary metric's state from one reading, None if it has none."""
+    payload = reading.get(metric)
+    if not isinstance(payload, dict):
+        return None
+    for field in BINARY_STATE_FIELDS.get(metric, ()):
+        if field in payload:
+            return bool(payload[field])
+    return None
+
+
+def extract_button_press(reading: dict[str, Any]) -> bool | None:
+    """Return whether a button reading records a press, None if it has none.
+
+    Press readings carry the kind of press (``pressType``) rather than an
+    open/detected state.
+    """
+    payload = reading.get(MT_SENSOR_BUTTON)
+    if isinstance(payload, dict):
+        for field in ("pressType", "pressed"):
+            if field in payload:
+                return bool(payload[field])
+    return extract_binary_state(reading, MT_SENSOR_BUTTON)
+
 
 class DataTransformer(ABC):
     """Abstract base class for data transformers."""
@@ -188,8 +223,15 @@ class SafeExtractor:
 class MTSensorDataTransformer(DataTransformer):
     """Transformer for MT (Environmental) sensor data."""
 
-    def transform(self, raw_data: dict[str, Any]) -> dict[str, Any]:
-        """Transform MT sensor readings to standardized format."""
+    def transform(
+        self, raw_data: dict[str, Any], metrics: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """Transform MT sensor readings to standardized format.
+
+        Args:
+            raw_data: One device's entry from the org-wide readings call
+            metrics: Only parse readings for these metrics (all when None)
+        """
         transformed: dict[str, Any] = {}
 
         readings = raw_data.get("readings", [])
@@ -198,6 +240,8 @@ class MTSensorDataTransformer(DataTransformer):
             metric = reading.get("metric")
             if not metric:
                 continue
+            if metrics is not None and metric not in metrics:
+                continue
 
             # Transform specific MT metrics based on API format
             if metric == "temperature":
@@ -374,23 +418,7 @@ class MTSensorDataTransformer(DataTransformer):
 
     def _extract_binary_value(self, reading: dict[str, Any], metric: str) -> bool:
         """Extract binary sensor values from API format."""
-        metric_data = reading.get(metric)
-        if metric_data is None or not isinstance(metric_data, dict):
-            return False
-
-        # Each binary sensor has specific field names
-        if metric == "downstreamPower":
-            return bool(metric_data.get("enabled", False))
-        elif metric == "remoteLockoutSwitch":
-            return bool(metric_data.get("locked", False))
-        elif metric == "water":
-            # Water sensors use "wet" field
-            return bool(metric_data.get("wet", False))
-        elif metric in ["door", "button"]:
-            # These use either "open" or "detected" fields
-            return bool(metric_data.get("open", metric_data.get("detected", False)))
-
-        return False
+        return bool(extract_binary_state(reading, metric))
 
 
 
@@ -573,12 +601,23 @@ class TransformerRegistry:
         return self._device_transformers.get(device_type)
 
     def transform_device_data(
-        self, device_type: str, raw_data: dict[str, Any]
+        self,
+        device_type: str,
+        raw_data: dict[str, Any],
+        metrics: Collection[str] | None = None,
     ) -> dict[str, Any]:
-        """Transform complete device data using the appropriate transformer."""
+        """Transform complete device data using the appropriate transformer.
+
+        ``metrics`` limits parsing to the given readings metrics for
+        transformers that support it (currently MT).
+        """
         transformer = self.get_device_transformer(device_type)
         if transformer:
             try:
+                if metrics is not None and isinstance(
+                    transformer, MTSensorDataTransformer
+                ):
+                    return transformer.transform(raw_data, metrics)
                 return transformer.transform(raw_data)
             except Exception as e:
                 _LOGGER.error(
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import datetime
 import logging
+import time
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -25,9 +27,18 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 from ..const import (
+    ATTR_LAST_REPORTED_AT,
+    ATTR_TEMPERATURE_FAHRENHEIT,
+    CONF_DEADBAND_ENABLED,
+    CONF_DEADBAND_MAX_AGE,
+    CONF_METRIC_DEADBANDS,
+    DEFAULT_DEADBAND_ENABLED,
+    DEFAULT_DEADBAND_MAX_AGE,
     MT_SENSOR_APPARENT_POWER,
     MT_SENSOR_BATTERY,
     MT_SENSOR_BUTTON,
@@ -208,6 +219,54 @@ MT_SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
     ),
 }
 
+# Diagnostic sensors for values that are otherwise state attributes. Only
+# created when CONF_VOLATILE_ATTRIBUTE_ENTITIES is enabled; both change on every
+# reading, so as attributes they would churn the recorder's attributes table.
+MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
+    ATTR_LAST_REPORTED_AT: SensorEntityDescription(
+        key=ATTR_LAST_REPORTED_AT,
+        name="Last Reported",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ATTR_TEMPERATURE_FAHRENHEIT: SensorEntityDescription(
+        key=ATTR_TEMPERATURE_FAHRENHEIT,
+        name="Temperature (Fahrenheit)",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        suggested_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+}
+
+# Default deadbands used when significant-change filtering is enabled. A new
+# value is written only once it moves at least this far from the last written
+# value, or when the last write is older than the max-age heartbeat. Anchoring
+# on the written value (not the previous reading) gives the band hysteresis, so
+# +/-0.1 jitter around a setpoint never crosses it.
+MT_DEFAULT_DEADBANDS: dict[SensorDeviceClass, float] = {
+    SensorDeviceClass.TEMPERATURE: 0.2,
+    SensorDeviceClass.HUMIDITY: 1.0,
+    SensorDeviceClass.CO2: 10.0,
+    SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS: 10.0,
+    SensorDeviceClass.PM25: 1.0,
+    SensorDeviceClass.PM10: 1.0,
+    SensorDeviceClass.NITROGEN_DIOXIDE: 1.0,
+    SensorDeviceClass.OZONE: 1.0,
+    SensorDeviceClass.AQI: 1.0,
+    SensorDeviceClass.SOUND_PRESSURE: 1.0,
+    SensorDeviceClass.BATTERY: 1.0,
+    SensorDeviceClass.SIGNAL_STRENGTH: 2.0,
+    SensorDeviceClass.POWER: 1.0,
+    SensorDeviceClass.APPARENT_POWER: 1.0,
+    SensorDeviceClass.CURRENT: 0.01,
+    SensorDeviceClass.VOLTAGE: 0.5,
+    SensorDeviceClass.FREQUENCY: 0.1,
+    SensorDeviceClass.POWER_FACTOR: 1.0,
+}
+
 # Energy sensor descriptions for power sensors
 MT_ENERGY_SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
     f"{MT_SENSOR_REAL_POWER}_energy": SensorEntityDescription(
@@ -228,6 +287,10 @@ class MerakiMTSensor(MerakiSensorEntity):
     such as temperature, humidity, etc.
     """
 
+    _unrecorded_attributes = frozenset(
+        {ATTR_LAST_REPORTED_AT, ATTR_TEMPERATURE_FAHRENHEIT}
+    )
+
     def __init__(
         self,
         coordinator: MerakiSensorCoordinator,
@@ -239,6 +302,11 @@ class MerakiMTSensor(MerakiSensorEntity):
         """Initialize the MT sensor."""
         super().__init__(coordinator, device, description, config_entry_id, network_hub)
 
+        # Last state written to Home Assistant, for significant-change filtering
+        self._last_written_value: Any = None
+        self._last_written_available: bool | None = None
+        self._last_written_at: float | None = None
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information for device registry."""
@@ -249,6 +317,69 @@ class MerakiMTSensor(MerakiSensorEntity):
 
         return device_info
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the change is within the metric's deadband."""
+        available = self.available
+        value = self.native_value if available else None
+        now = time.monotonic()
+
+        if self._is_insignificant_change(value, available, now):
+            return
+
+        self._last_written_value = value
+        self._last_written_available = available
+        self._last_written_at = now
+        super()._handle_coordinator_update()
+
+    def _deadband(self, options: Mapping[str, Any]) -> float | None:
+        """Return the deadband for this metric, or None when filtering is off."""
+        if not options.get(CONF_DEADBAND_ENABLED, DEFAULT_DEADBAND_ENABLED):
+            return None
+
+        overrides = options.get(CONF_METRIC_DEADBANDS) or {}
+        if self.entity_description.key in overrides:
+            try:
+                return max(0.0, float(overrides[self.entity_description.key]))
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Ignoring invalid deadband for %s: %s",
+                    self.entity_description.key,
+                    overrides[self.entity_description.key],
+                )
+
+        device_class = self.entity_description.device_class
+        if device_class is None:
+            return None
+        return MT_DEFAULT_DEADBANDS.get(SensorDeviceClass(device_class))
+
+    def _is_insignificant_change(self, value: Any, available: bool, now: float) -> bool:
+        """Return True if writing this value would only record jitter."""
+        if self._last_written_at is None or available != self._last_written_available:
+            return False
+
+        config_entry = self.coordinator.config_entry
+        if config_entry is None:
+            return False
+        options = config_entry.options
+        deadband = self._deadband(options)
+        if deadband is None:
+            return False
+
+        max_age = options.get(CONF_DEADBAND_MAX_AGE, DEFAULT_DEADBAND_MAX_AGE)
+        if now - self._last_written_at >= max_age:
+            return False
+
+        previous = self._last_written_value
+        if (
+            not isinstance(value, int | float)
+            or not isinstance(previous, int | float)
+            or isinstance(value, bool)
+        ):
+            return False
+
+        return abs(value - previous) < deadband
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
@@ -259,11 +390,14 @@ class MerakiMTSensor(MerakiSensorEntity):
         if not device_data:
             return None
 
-        # Use transformer to process data consistently
-        transformed_data = transformer_registry.transform_device_data("MT", device_data)
+        # Use transformer to process data consistently, parsing only our metric
+        key = self.entity_description.key
+        transformed_data = transformer_registry.transform_device_data(
+            "MT", device_data, (key,)
+        )
 
         # Return the value for our specific metric
-        return transformed_data.get(self.entity_description.key)
+        return transformed_data.get(key)
 
     @property
     def available(self) -> bool:
@@ -277,7 +411,13 @@ class MerakiMTSensor(MerakiSensorEntity):
             return False
 
         readings = device_data.get("readings", [])
-        return len(readings) > 0
+        if not readings:
+            return False
+
+        # Readings past the configured staleness threshold are not current
+        return not self.coordinator.reading_is_stale(
+            self._device_serial, self.entity_description.key
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -289,7 +429,11 @@ class MerakiMTSensor(MerakiSensorEntity):
             attrs["mac_address"] = sanitize_attribute_value(mac_address)
 
         # For temperature sensors, also include Fahrenheit value
-        if self.entity_description.key == "temperature" and self.coordinator.data:
+        if (
+            self.entity_description.key == "temperature"
+            and self.coordinator.data
+            and not self._volatile_attributes_as_entities
+        ):
             device_data = self.coordinator.data.get(self._device_serial)
             if device_data:
                 readings = device_data.get("readings", [])
@@ -298,12 +442,53 @@ class MerakiMTSensor(MerakiSensorEntity):
                         temp_data = reading.get("temperature", {})
                         fahrenheit = temp_data.get("fahrenheit")
                         if fahrenheit is not None:
-                            attrs["temperature_fahrenheit"] = fahrenheit
+                            attrs[ATTR_TEMPERATURE_FAHRENHEIT] = fahrenheit
                         break
 
         return attrs
 
 
+class MerakiMTVolatileAttributeSensor(MerakiSensorEntity):
+    """Diagnostic sensor for a volatile MT attribute.
+
+    Exposes last_reported_at or temperature_fahrenheit as an entity of its own
+    when the user opts out of carrying them as state attributes.
+    """
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current value of the attribute."""
+        if not self.coordinator.data:
+            return None
+
+        device_data = self.coordinator.data.get(self._device_serial)
+        if not device_data:
+            return None
+
+        readings = device_data.get("readings", [])
+        if not readings:
+            return None
+
+        if self.entity_description.key == ATTR_LAST_REPORTED_AT:
+            timestamp = readings[-1].get("ts")
+            if not timestamp:
+                return None
+            return dt_util.parse_datetime(timestamp)
+
+        if self.entity_description.key == ATTR_TEMPERATURE_FAHRENHEIT:
+            for reading in readings:
+                if reading.get("metric") == MT_SENSOR_TEMPERATURE:
+                    temp_data = reading.get(MT_SENSOR_TEMPERATURE, {})
+                    return temp_data.get("fahrenheit")
+
+        return None
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return super().available and self.native_value is not None
+
+
 class MerakiMTEnergySensor(MerakiRestoreSensorEntity):
     """Representation of a Meraki MT energy sensor.
 
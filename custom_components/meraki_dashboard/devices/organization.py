@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
 from ..entities.base import MerakiHubSensorEntity
 
@@ -77,7 +80,119 @@ NETWORK_HUB_SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
 }
 
 
-class MerakiHubApiCallsSensor(MerakiHubSensorEntity):
+class MerakiOrgMetricsSensorEntity(MerakiHubSensorEntity):
+    """Organization hub diagnostic sensor pushed by metric-change notifications.
+
+    Instead of being polled, the sensor subscribes to the org hub's metric
+    notifications and writes state only when its value or attributes change,
+    at most once per ``diagnostic_update_interval`` seconds. Changes arriving
+    sooner are coalesced into one deferred write.
+    """
+
+    _attr_should_poll = False
+
+    # Seconds between re-checks while a sliding-window value is non-zero, so it
+    # decays without new API activity (None: changes only on notifications).
+    _decay_recheck_seconds: float | None = None
+
+    def __init__(
+        self,
+        hub: Any,
+        description: SensorEntityDescription,
+        config_entry_id: str,
+        hub_type: str = "org",
+    ) -> None:
+        """Initialize the push-updated sensor."""
+        super().__init__(hub, description, config_entry_id, hub_type)
+        self._last_written: tuple[Any, dict[str, Any] | None] | None = None
+        self._last_write_time: float | None = None
+        self._pending_write: CALLBACK_TYPE | None = None
+        self._pending_decay_recheck: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the org hub's metric notifications."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._hub.async_add_metrics_listener(self._async_metrics_changed)
+        )
+        self.async_on_remove(self._async_cancel_pending_timers)
+        # Home Assistant writes the initial state once the entity is added.
+        self._last_written = self._state_snapshot()
+        self._last_write_time = self.hass.loop.time()
+        self._async_schedule_decay_recheck()
+
+    def _state_snapshot(self) -> tuple[Any, dict[str, Any] | None]:
+        """Return what a state write would record."""
+        return self.native_value, self.extra_state_attributes
+
+    @callback
+    def _async_metrics_changed(self) -> None:
+        """Write the new state now, or once the write interval has passed."""
+        if self._pending_write is not None:
+            return
+        if self._last_write_time is not None:
+            wait = (
+                self._last_write_time
+                + self._hub.diagnostic_update_interval
+                - self.hass.loop.time()
+            )
+            if wait > 0:
+                self._pending_write = async_call_later(
+                    self.hass, wait, self._async_deferred_write
+                )
+                return
+        self._async_write_if_changed()
+
+    @callback
+    def _async_deferred_write(self, _now: datetime) -> None:
+        """Run a write deferred by the rate limit."""
+        self._pending_write = None
+        self._async_write_if_changed()
+
+    @callback
+    def _async_decay_recheck(self, _now: datetime) -> None:
+        """Re-check a sliding-window value, subject to the write rate limit."""
+        self._pending_decay_recheck = None
+        self._async_metrics_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state if the value or attributes changed since the last write."""
+        snapshot = self._state_snapshot()
+        if snapshot != self._last_written:
+            self._last_written = snapshot
+            self._last_write_time = self.hass.loop.time()
+            self.async_write_ha_state()
+        self._async_schedule_decay_recheck()
+
+    @callback
+    def _async_schedule_decay_recheck(self) -> None:
+        """Re-check a non-zero sliding-window value after it may have decayed."""
+        if (
+            self._decay_recheck_seconds is None
+            or not self._last_written
+            or not self._last_written[0]
+            or self._pending_decay_recheck is not None
+        ):
+            return
+        self._pending_decay_recheck = async_call_later(
+            self.hass,
+            max(self._decay_recheck_seconds, self._hub.diagnostic_update_interval),
+            self._async_decay_recheck,
+        )
+
+    @callback
+    def _async_cancel_pending_timers(self) -> None:
+        """Cancel a deferred write or decay re-check when the entity is removed."""
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+        if self._pending_decay_recheck is not None:
+            self._pending_decay_recheck()
+            self._pending_decay_recheck = None
+
+
+class MerakiHubApiCallsSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking API calls from an organization hub."""
 
     def __init__(
@@ -105,7 +220,7 @@ class MerakiHubApiCallsSensor(MerakiHubSensorEntity):
         }
 
 
-class MerakiHubFailedApiCallsSensor(MerakiHubSensorEntity):
+class MerakiHubFailedApiCallsSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking failed API calls from an organization hub."""
 
     def __init__(
@@ -132,9 +247,11 @@ class MerakiHubFailedApiCallsSensor(MerakiHubSensorEntity):
         }
 
 
-class MerakiHubApiCallsPerMinuteSensor(MerakiHubSensorEntity):
+class MerakiHubApiCallsPerMinuteSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking API calls per minute from an organization hub."""
 
+    _decay_recheck_seconds = 15.0
+
     def __init__(
         self,
         organization_hub: Any,
@@ -151,9 +268,11 @@ class MerakiHubApiCallsPerMinuteSensor(MerakiHubSensorEntity):
         return self._organization_hub.api_calls_per_minute
 
 
-class MerakiHubApiThrottleEventsSensor(MerakiHubSensorEntity):
+class MerakiHubApiThrottleEventsSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking API throttle events from an organization hub."""
 
+    _decay_recheck_seconds = 60.0
+
     def __init__(
         self,
         organization_hub: Any,
@@ -181,7 +300,7 @@ class MerakiHubApiThrottleEventsSensor(MerakiHubSensorEntity):
         }
 
 
-class MerakiHubApiRateLimitQueueDepthSensor(MerakiHubSensorEntity):
+class MerakiHubApiRateLimitQueueDepthSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking API rate limit queue depth."""
 
     def __init__(
@@ -200,7 +319,7 @@ class MerakiHubApiRateLimitQueueDepthSensor(MerakiHubSensorEntity):
         return self._organization_hub.api_rate_limit_queue_depth
 
 
-class MerakiHubApiThrottleWaitSecondsTotalSensor(MerakiHubSensorEntity):
+class MerakiHubApiThrottleWaitSecondsTotalSensor(MerakiOrgMetricsSensorEntity):
     """Sensor for tracking total wait time caused by throttling."""
 
     def __init__(
@@ -8,8 +8,11 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .utils.cadence import AdaptiveIntervalController, CadenceTracker
+from .utils.freshness import ReadingFreshnessIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +96,20 @@ async def async_get_config_entry_diagnostics(
                 coordinator._last_update_duration
             )
 
+        cadence = getattr(coordinator, "cadence", None)
+        if isinstance(cadence, CadenceTracker):
+            coordinator_info["reporting_cadence"] = cadence.as_dict()
+
+        adaptive = getattr(coordinator, "adaptive_interval", None)
+        if isinstance(adaptive, AdaptiveIntervalController):
+            coordinator_info["adaptive_scan_interval"] = adaptive.as_dict()
+
+        freshness = getattr(coordinator, "freshness", None)
+        if isinstance(freshness, ReadingFreshnessIndex):
+            coordinator_info["reading_freshness"] = freshness.as_dict(
+                dt_util.utcnow().timestamp()
+            )
+
         diagnostics["coordinators"][hub_id] = coordinator_info
 
     # Device registry diagnostics
@@ -26,6 +26,8 @@ from ..const import (
     ATTR_NETWORK_ID,
     ATTR_NETWORK_NAME,
     ATTR_SERIAL,
+    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+    DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES,
 )
 from ..coordinator import MerakiSensorCoordinator
 from ..utils.device_info import DeviceInfoBuilder, determine_device_type
@@ -69,6 +71,10 @@ class MerakiCoordinatorEntity(MerakiEntity, CoordinatorEntity[MerakiSensorCoordi
     This class should be used for all entities that get their data from a coordinator.
     """
 
+    # last_reported_at changes with every reading. Excluding it from the recorder
+    # stops each poll from writing a new state_attributes row per entity.
+    _unrecorded_attributes = frozenset({ATTR_LAST_REPORTED_AT})
+
     def __init__(
         self,
         coordinator: MerakiSensorCoordinator,
@@ -154,6 +160,18 @@ class MerakiCoordinatorEntity(MerakiEntity, CoordinatorEntity[MerakiSensorCoordi
             return device_type
         return "unknown"
 
+    @property
+    def _volatile_attributes_as_entities(self) -> bool:
+        """Return True if volatile attributes are exposed as separate entities."""
+        config_entry = self.coordinator.config_entry
+        if config_entry is None:
+            return False
+        return bool(
+            config_entry.options.get(
+                CONF_VOLATILE_ATTRIBUTE_ENTITIES, DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES
+            )
+        )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return common device-level extra state attributes."""
@@ -174,9 +192,11 @@ class MerakiCoordinatorEntity(MerakiEntity, CoordinatorEntity[MerakiSensorCoordi
             }
         )
 
-        # Add last reported timestamp if available in coordinator data
+        # Add last reported timestamp if available in coordinator data, unless it
+        # is exposed through its own diagnostic entity
         if (
-            self.coordinator.data
+            not self._volatile_attributes_as_entities
+            and self.coordinator.data
             and self._device_serial in self.coordinator.data
             and "readings" in self.coordinator.data[self._device_serial]
         ):
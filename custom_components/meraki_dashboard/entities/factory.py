@@ -8,7 +8,7 @@ and entity instantiation for all supported device types.
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any, TypeVar, cast
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -39,7 +39,7 @@ from ..const import (
     SENSOR_TYPE_MT,
 )
 from ..coordinator import MerakiSensorCoordinator
-from ..utils.device_info import determine_device_type
+from ..utils.device_info import build_capability_index, determine_device_type
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -149,6 +149,7 @@ class EntityFactory:
         coordinator: MerakiSensorCoordinator,
         device_data: dict[str, Any],
         config_entry_id: str,
+        capability_index: Mapping[str, frozenset[str] | None] | None = None,
     ) -> list[Entity]:
         """Create all applicable entities for a device.
 
@@ -161,6 +162,8 @@ class EntityFactory:
             coordinator: The data coordinator
             device_data: Device information and sensor data
             config_entry_id: Config entry ID
+            capability_index: The shared serial -> metrics index for the
+                current snapshot (built for this device when omitted)
 
         Returns:
             List of created entities
@@ -175,7 +178,15 @@ class EntityFactory:
             return entities
 
         # Get available metrics for this device
-        available_metrics = cls._get_available_metrics(device_type, device_data)
+        if capability_index is None:
+            coordinator_data = getattr(coordinator, "data", None)
+            capability_index = build_capability_index(
+                [device_data],
+                coordinator_data if isinstance(coordinator_data, dict) else None,
+            )
+        available_metrics = cls._get_available_metrics(
+            device_type, device_data, capability_index.get(device_data.get("serial"))
+        )
 
         for metric_type in available_metrics:
             try:
@@ -200,15 +211,27 @@ class EntityFactory:
 
     @classmethod
     def _get_available_metrics(
-        cls, device_type: str, device_data: dict[str, Any]
+        cls,
+        device_type: str,
+        device_data: dict[str, Any],
+        capabilities: frozenset[str] | None = None,
     ) -> list[str]:
-        """Get available metrics for a device based on its capabilities."""
+        """Get available metrics for a device based on its capabilities.
+
+        Args:
+            device_type: Device type (MT, MR, ...)
+            device_data: Device information and sensor data
+            capabilities: The device's entry from the capability index; when
+                omitted the metrics embedded in ``device_data`` are used
+        """
         # Start with all registered metrics for this device type
         potential_metrics = cls._device_capabilities.get(device_type, [])
         available_metrics = []
 
         # Check each metric against device capabilities
-        sensor_data = device_data.get("sensor", {})
+        sensor_data = (
+            capabilities if capabilities is not None else device_data.get("sensor", {})
+        )
 
         for metric in potential_metrics:
             # Check if device reports this metric
@@ -593,6 +616,18 @@ def _register_organization_entities():
             )
         )
     )
+    EntityFactory._registry["mt_volatile_attribute_sensor"] = (
+        lambda coordinator, device, description, entry_id, network_hub: (
+            _create_device_entity(
+                "MerakiMTVolatileAttributeSensor",
+                coordinator,
+                device,
+                description,
+                entry_id,
+                network_hub,
+            )
+        )
+    )
     EntityFactory._registry["mt_energy_sensor"] = (
         lambda coordinator, device, description, entry_id, network_hub, power_sensor_key: (
             _create_device_entity(
@@ -713,6 +748,9 @@ def create_entities_for_device(
     device: dict[str, Any],
     config_entry_id: str,
     network_hub: Any = None,
+    capability_index: Mapping[str, frozenset[str] | None] | None = None,
 ) -> list[Entity]:
     """Create all applicable entities for a device using the new pattern."""
-    return EntityFactory.create_entities(coordinator, device, config_entry_id)
+    return EntityFactory.create_entities(
+        coordinator, device, config_entry_id, capability_index
+    )
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
@@ -27,16 +28,18 @@ from ..const import (
     DEFAULT_LONG_CACHE_TTL,
     DEFAULT_STANDARD_CACHE_TTL,
     DOMAIN,
+    MT_EVENT_SENSOR_METRICS,
     MT_REFRESH_COMMAND_INTERVAL,
     SENSOR_TYPE_MT,
 )
 from ..services import MerakiEventService
-from ..services.mt_refresh_service import MTRefreshService
+from ..services.mt_refresh_service import MT_REFRESH_MODELS, MTRefreshService
 from ..types import (
     MerakiDeviceData,
     MTDeviceData,
 )
 from ..utils import (
+    build_capability_index,
     cache_api_response,
     get_cached_api_response,
     performance_monitor,
@@ -53,6 +56,51 @@ _LOGGER = logging.getLogger(__name__)
 # Minimum time between discovery attempts to prevent API spam (30 seconds)
 MIN_DISCOVERY_INTERVAL_SECONDS = 30
 
+# Longest a sensor-data tick waits on the diagnostic gateway-connections fetch
+# (measured from when both org-wide fetches start). A slower fetch keeps running
+# and is merged on the next tick instead of holding back the readings.
+GATEWAY_CONNECTIONS_LATENCY_BUDGET_SECONDS = 5.0
+
+
+class DeviceIndex:
+    """Serial and model lookups over one version of a hub's device inventory.
+
+    Built once per inventory change (see ``MerakiNetworkHub.devices``) so the
+    per-tick paths do dict lookups instead of scanning the device list.
+
+    Attributes:
+        version: Inventory version this index was built from
+        by_serial: Device keyed by serial number
+        by_model: Devices bucketed by upper-cased model
+    """
+
+    def __init__(self, devices: Sequence[MerakiDeviceData], version: int) -> None:
+        """Build the index.
+
+        Args:
+            devices: Device inventory to index
+            version: Inventory version this index represents
+        """
+        self.version = version
+        self.by_serial: dict[str, MerakiDeviceData] = {}
+        self.by_model: dict[str, list[MerakiDeviceData]] = {}
+
+        for device in devices:
+            serial = device.get("serial")
+            if serial:
+                # First occurrence wins, matching the previous linear scan
+                self.by_serial.setdefault(serial, device)
+            model = (device.get("model") or "").upper()
+            self.by_model.setdefault(model, []).append(device)
+
+    def devices_for_models(self, models: Iterable[str]) -> list[MerakiDeviceData]:
+        """Return devices whose model is in ``models`` (case-insensitive)."""
+        return [
+            device
+            for model in models
+            for device in self.by_model.get(model.upper(), [])
+        ]
+
 
 class MerakiNetworkHub:
     """Network-specific hub for managing devices of a specific type.
@@ -104,8 +152,13 @@ class MerakiNetworkHub:
         # Generate a unique hub name for identification
         self.hub_name = f"{network_name}_{device_type}"
 
-        # Device management
-        self.devices: list[MerakiDeviceData] = []
+        # Device management. ``devices`` is a property: assigning a new inventory
+        # bumps the version and rebuilds the serial/model index.
+        self._devices: list[MerakiDeviceData] = []
+        self._device_index = DeviceIndex(self._devices, 0)
+        self._status_index: dict[str, str] = {}
+        self._status_index_source: list[dict[str, Any]] | None = None
+        self._status_index_size = 0
         self._selected_devices: set[str] = set()
         self._last_discovery_time: datetime | None = None
         self._discovery_in_progress = False
@@ -115,6 +168,7 @@ class MerakiNetworkHub:
         self.wireless_data: dict[str, Any] = {}  # For MR devices
         self.switch_data: dict[str, Any] = {}  # For MS devices
         self.camera_data: dict[str, Any] = {}  # For MV devices
+        self.sensor_data: dict[str, MTDeviceData] = {}  # For MT devices (last tick)
 
         # Periodic discovery timer
         self._discovery_unsub: Callable[[], None] | None = None
@@ -122,11 +176,64 @@ class MerakiNetworkHub:
         # Performance tracking
         self._discovery_durations: list[float] = []
 
+        # Gateway connectivity merged into MT data. A fetch that overruns the
+        # latency budget stays pending here and is picked up on the next tick.
+        self._gateway_connections: dict[str, Any] = {}
+        self._gateway_connections_task: asyncio.Future[Any] | None = None
+
         # Initialize event service for MT devices
         self.mt_refresh_service: MTRefreshService | None = None
         if device_type == SENSOR_TYPE_MT:
-            self.event_service = MerakiEventService(self.hass)
-            self.mt_refresh_service = MTRefreshService(self.hass, self)
+            self.event_service = MerakiEventService(
+                self.hass,
+                fetch_history=organization_hub.async_get_sensor_readings_history,
+            )
+            self.mt_refresh_service = MTRefreshService(
+                self.hass, self, organization_hub.mt_refresh_scheduler
+            )
+
+    @property
+    def devices(self) -> list[MerakiDeviceData]:
+        """Return the discovered devices managed by this hub."""
+        return self._devices
+
+    @devices.setter
+    def devices(self, devices: list[MerakiDeviceData]) -> None:
+        """Replace the device inventory and rebuild the lookup index.
+
+        Rediscovering an unchanged inventory keeps the current index version.
+        """
+        if devices is self._devices or devices == self._devices:
+            return
+        self._devices = devices
+        self._device_index = DeviceIndex(devices, self._device_index.version + 1)
+
+    @property
+    def gateway_connections(self) -> dict[str, Any]:
+        """Gateway connectivity merged into the last tick, empty if unknown."""
+        return self._gateway_connections
+
+    @property
+    def device_index(self) -> DeviceIndex:
+        """Return the serial/model index for the current device inventory."""
+        return self._device_index
+
+    def get_device(self, serial: str) -> MerakiDeviceData | None:
+        """Return the device with the given serial, if this hub manages it."""
+        return self._device_index.by_serial.get(serial)
+
+    def get_devices_by_model(self, *models: str) -> list[MerakiDeviceData]:
+        """Return this hub's devices of the given models."""
+        return self._device_index.devices_for_models(models)
+
+    @property
+    def has_fast_lane_devices(self) -> bool:
+        """Return True if any device here supports a door/water/button metric."""
+        fast_lane_metrics = frozenset(MT_EVENT_SENSOR_METRICS)
+        return any(
+            capabilities is not None and capabilities & fast_lane_metrics
+            for capabilities in build_capability_index(self._devices).values()
+        )
 
     @property
     def average_discovery_duration(self) -> float:
@@ -192,16 +299,35 @@ class MerakiNetworkHub:
         if not device_statuses:
             return True
 
-        # Find the device in the status list
-        for status in device_statuses:
-            if status.get("serial") == device_serial:
-                device_status = status.get("status", "online")
-                # Online and alerting devices can respond to API calls
-                # Offline and dormant devices cannot
-                return device_status in ("online", "alerting")
+        # Online and alerting devices can respond to API calls
+        # Offline and dormant devices cannot. Devices missing from the status
+        # list are assumed online.
+        device_status = self._get_status_index(device_statuses).get(
+            device_serial, "online"
+        )
+        return device_status in ("online", "alerting")
 
-        # Device not found in status list - assume online
-        return True
+    def _get_status_index(
+        self, device_statuses: list[dict[str, Any]]
+    ) -> dict[str, str]:
+        """Return a serial -> status map for the org hub's device statuses.
+
+        Rebuilt only when the org hub swaps in a new status list or the list
+        changes size, rather than scanned once per device lookup.
+        """
+        if (
+            device_statuses is not self._status_index_source
+            or len(device_statuses) != self._status_index_size
+        ):
+            index: dict[str, str] = {}
+            for status in device_statuses:
+                serial = status.get("serial")
+                if serial:
+                    index.setdefault(serial, status.get("status", "online"))
+            self._status_index = index
+            self._status_index_source = device_statuses
+            self._status_index_size = len(device_statuses)
+        return self._status_index
 
     def _get_online_devices(
         self, devices: Sequence[dict[str, Any] | MerakiDeviceData]
@@ -263,6 +389,10 @@ class MerakiNetworkHub:
             # Perform initial device discovery
             await self._async_discover_devices()
 
+            # Publish MT button/door/water events from the service's own queue
+            if self.device_type == SENSOR_TYPE_MT:
+                self.event_service.async_start()
+
             # Start MT refresh service for MT devices with MT15/MT40 models
             if self.device_type == SENSOR_TYPE_MT and self.mt_refresh_service:
                 # Check configuration
@@ -272,10 +402,7 @@ class MerakiNetworkHub:
 
                 if mt_refresh_enabled:
                     # Check if we have any MT15 or MT40 devices
-                    has_mt15_mt40 = any(
-                        device.get("model", "").upper() in ("MT15", "MT40")
-                        for device in self.devices
-                    )
+                    has_mt15_mt40 = bool(self.get_devices_by_model(*MT_REFRESH_MODELS))
                     if has_mt15_mt40:
                         # Get interval from config
                         refresh_interval = self.config_entry.options.get(
@@ -516,7 +643,9 @@ class MerakiNetworkHub:
     @handle_api_errors(
         default_return={}, log_errors=True, convert_connection_errors=False
     )
-    async def async_get_sensor_data(self) -> dict[str, MTDeviceData]:
+    async def async_get_sensor_data(
+        self, max_age: float | None = None
+    ) -> dict[str, MTDeviceData]:
         """Get MT sensor data for this hub's devices from the org-wide fetch.
 
         Delegates to the org hub's cached org-wide readings call (SCALE-13: one
@@ -524,56 +653,73 @@ class MerakiNetworkHub:
         client-side. Gateway connectivity (RSSI + last-seen) is merged into each
         serial's data so entities read it uniformly from ``MTDeviceData``.
 
+        Args:
+            max_age: Optional cap on the age of the org hub's cached snapshot
+
         Returns:
             Dictionary mapping serial numbers to their sensor data
         """
         if self.device_type != SENSOR_TYPE_MT or not self.devices:
             return {}
 
-        serials = {device["serial"] for device in self.devices}
+        device_index = self._device_index
 
         # One org-wide readings fetch (short-TTL cached on the org hub), then
         # filter to our serials. On failure the org hub raises, which the
         # @handle_api_errors decorator turns into the default empty dict while
-        # keeping prior entity state (no fabricated 0).
-        all_readings = await self.organization_hub.async_get_all_sensor_readings()
-        # Gateway connectivity (RSSI + last-seen) is diagnostic-only. Never let a
-        # failure here wipe out the primary readings for the whole hub — degrade to
-        # empty gateway data (RSSI/last-seen fall to None) and keep serving readings.
-        try:
-            gateway_connections = (
-                await self.organization_hub.async_get_all_gateway_connections()
+        # keeping prior entity state (no fabricated 0). The diagnostic gateway
+        # fetch runs alongside it so a cold tick costs one round trip, not two.
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        gateway_task = self._gateway_connections_task
+        if gateway_task is None:
+            gateway_task = self.hass.async_create_task(
+                self.organization_hub.async_get_all_gateway_connections(),
+                "meraki_dashboard_gateway_connections",
             )
-        except Exception as gw_err:  # noqa: BLE001 - diagnostic extra, must not fail readings
-            _LOGGER.debug("Gateway connections fetch failed: %s", gw_err)
-            gateway_connections = {}
+            self._gateway_connections_task = gateway_task
+        all_readings = await self.organization_hub.async_get_all_sensor_readings(
+            max_age=max_age
+        )
+        remaining = GATEWAY_CONNECTIONS_LATENCY_BUDGET_SECONDS - (loop.time() - started)
+        if not gateway_task.done() and remaining > 0:
+            await asyncio.wait((gateway_task,), timeout=remaining)
+        gateway_connections = self._collect_gateway_connections(gateway_task)
 
+        # Walk this hub's devices rather than the whole org snapshot, so each
+        # tick costs O(hub devices) on the loop however large the org is.
         result: dict[str, MTDeviceData] = {}
-        for serial, reading in all_readings.items():
-            if serial not in serials:
+        for serial in device_index.by_serial:
+            reading = all_readings.get(serial)
+            if reading is None:
                 continue
 
-            reading_dict = cast("dict[str, Any]", reading)
-            # Merge gateway connectivity; absent rows leave None (never 0).
+            # Merge gateway connectivity into a copy: the org snapshot is
+            # shared by every hub. Absent rows leave None (never 0).
             gateway: dict[str, Any] = dict(gateway_connections.get(serial) or {})
-            reading_dict["rssi"] = gateway.get("rssi")
-            reading_dict["last_connected_at"] = gateway.get("last_connected_at")
+            reading_dict: dict[str, Any] = {
+                **reading,
+                "rssi": gateway.get("rssi"),
+                "last_connected_at": gateway.get("last_connected_at"),
+            }
             result[serial] = cast("MTDeviceData", reading_dict)
 
-            # Process events for state changes (MT button/door/water tracking).
-            if self.event_service:
+        # Detect state changes (MT button/door/water) against the finished
+        # snapshot. Detected events are queued for the event service's own
+        # task and history backfill runs in the background, so neither
+        # subscribers nor the readings history call hold up this tick.
+        if self.event_service:
+            for serial, reading_dict in result.items():
                 try:
-                    device_info: MerakiDeviceData | None = next(
-                        (d for d in self.devices if d["serial"] == serial),
-                        None,
+                    device_info_with_domain = {
+                        **device_index.by_serial[serial],
+                        "domain": DOMAIN,
+                    }
+                    await self.event_service.track_sensor_changes(
+                        serial,
+                        reading_dict.get("readings", []),
+                        cast("MerakiDeviceData", device_info_with_domain),
                     )
-                    if device_info:
-                        device_info_with_domain = {**device_info, "domain": DOMAIN}
-                        await self.event_service.track_sensor_changes(
-                            serial,
-                            reading_dict.get("readings", []),
-                            cast("MerakiDeviceData", device_info_with_domain),
-                        )
                 except Exception as event_err:
                     _LOGGER.debug(
                         "Error processing events for device %s: %s",
@@ -581,8 +727,40 @@ class MerakiNetworkHub:
                         event_err,
                     )
 
+        # Kept for the MT refresh planner, which skips sensors already fresh
+        self.sensor_data = result
         return result
 
+    def _collect_gateway_connections(
+        self, gateway_task: asyncio.Future[Any]
+    ) -> dict[str, Any]:
+        """Return the gateway connectivity to merge into this tick.
+
+        A finished fetch replaces the merged snapshot. Gateway connectivity
+        (RSSI + last-seen) is diagnostic-only, so a failure degrades to empty
+        data (RSSI/last-seen fall to None) rather than failing the readings,
+        and a fetch still in flight leaves the previous snapshot in place.
+        """
+        if not gateway_task.done():
+            _LOGGER.debug(
+                "Gateway connections fetch for %s exceeded %.1fs; merging it "
+                "on the next tick",
+                self.hub_name,
+                GATEWAY_CONNECTIONS_LATENCY_BUDGET_SECONDS,
+            )
+            return self._gateway_connections
+
+        self._gateway_connections_task = None
+        if gateway_task.cancelled():
+            return self._gateway_connections
+        gw_err = gateway_task.exception()
+        if gw_err is not None:
+            _LOGGER.debug("Gateway connections fetch failed: %s", gw_err)
+            self._gateway_connections = {}
+        else:
+            self._gateway_connections = gateway_task.result() or {}
+        return self._gateway_connections
+
     def _is_recent_reading(self, reading: dict[str, Any], minutes: int = 5) -> bool:
         """Check if a reading is recent (within specified minutes).
 
@@ -615,7 +793,15 @@ class MerakiNetworkHub:
             self._discovery_unsub()
             self._discovery_unsub = None
 
+        if self._gateway_connections_task is not None:
+            self._gateway_connections_task.cancel()
+            self._gateway_connections_task = None
+
         # Stop MT refresh service if running
         if self.mt_refresh_service and self.mt_refresh_service.is_running:
             await self.mt_refresh_service.async_stop()
             _LOGGER.debug("Stopped MT refresh service for %s", self.hub_name)
+
+        event_service = getattr(self, "event_service", None)
+        if isinstance(event_service, MerakiEventService):
+            await event_service.async_stop()
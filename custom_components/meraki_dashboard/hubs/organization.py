@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import threading
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 import meraki.aio
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 from meraki.exceptions import APIError, AsyncAPIError
 
 from ..const import (
@@ -22,25 +25,39 @@ from ..const import (
     API_RATE_LIMIT_MAX_CONCURRENT,
     API_RATE_LIMIT_PER_SECOND,
     API_THROTTLE_WINDOW_MINUTES,
+    ATTR_TEMPERATURE_FAHRENHEIT,
     CONF_BASE_URL,
+    CONF_BINARY_FAST_LANE_ENABLED,
+    CONF_BINARY_FAST_LANE_INTERVAL,
+    CONF_DIAGNOSTIC_UPDATE_INTERVAL,
+    CONF_GATEWAY_CONNECTIONS_INTERVAL,
     DEFAULT_BASE_URL,
+    DEFAULT_BINARY_FAST_LANE_ENABLED,
+    DEFAULT_BINARY_FAST_LANE_INTERVAL,
+    DEFAULT_DIAGNOSTIC_UPDATE_INTERVAL,
+    DEFAULT_GATEWAY_CONNECTIONS_INTERVAL,
     DEVICE_TYPE_SCAN_INTERVALS,
     MIN_SCAN_INTERVAL,
+    MT_EVENT_SENSOR_METRICS,
+    MT_READING_METRICS,
     SENSOR_TYPE_MT,
     USER_AGENT,
 )
 from ..exceptions import MerakiApiError
+from ..services.mt_refresh_service import MTRefreshScheduler
 from ..types import (
     MerakiApiClient,
     NetworkData,
     OrganizationData,
 )
+from ..utils.cadence import CadenceTracker
 from ..utils.device_info import device_matches_type
 from ..utils.error_handling import handle_api_errors
 from ..utils.rate_limiter import MerakiRateLimiter
 from ..utils.retry import with_standard_retries
 
 if TYPE_CHECKING:
+    from ..coordinator import MerakiSensorCoordinator
     from ..types import GatewayConnectionData, MTDeviceData
     from .network import MerakiNetworkHub
 
@@ -51,11 +68,112 @@ _LOGGER = logging.getLogger(__name__)
 _MAX_429_RETRIES = 1
 _RETRY_AFTER_CAP_SECONDS = 30
 
+# Readings prefetch: start this long (plus the slowest recent fetch) before
+# the earliest upcoming coordinator tick, sized from the last few fetches.
+READINGS_PREFETCH_MARGIN_SECONDS = 1.0
+READINGS_PREFETCH_HISTORY = 5
+
+# Readings history requests made this close together (every network hub
+# backfilling after the same readings tick) share one org-wide call.
+READINGS_HISTORY_COALESCE_SECONDS = 1.0
+
+# Readings responses with at least this many sensors are turned into a
+# snapshot in the executor, so very large organizations don't block the loop.
+READINGS_EXECUTOR_THRESHOLD = 5000
+
 # Thread-safe cache for logging configuration
 _LOGGING_LOCK = threading.Lock()
 _LOGGING_CONFIGURED_FOR_LEVELS: dict[int, bool] = {}
 
 
+def _entity_metric(unique_id: str, prefix: str) -> str | None:
+    """Return the readings metric behind an MT entity's unique ID, if any.
+
+    Device entity unique IDs are ``{entry_id}_{serial}_{key}``. Energy and
+    Fahrenheit entities are derived from the power and temperature readings;
+    keys that are not readings metrics (RSSI, last seen, ...) map to None.
+    """
+    if not unique_id.startswith(prefix):
+        return None
+    _serial, sep, key = unique_id[len(prefix) :].partition("_")
+    if not sep:
+        return None
+    if key == ATTR_TEMPERATURE_FAHRENHEIT:
+        return "temperature"
+    key = key.removesuffix("_energy")
+    return key if key in MT_READING_METRICS else None
+
+
+def _build_readings_snapshot(rows: list[Any]) -> dict[str, MTDeviceData]:
+    """Return the ``{serial: reading}`` snapshot for a readings response.
+
+    A pure function over the raw rows so it can run in the executor. The
+    snapshot is shared by every network hub and must not be mutated; hubs
+    copy the per-serial entries they merge gateway data into.
+    """
+    return {
+        row["serial"]: cast("MTDeviceData", row)
+        for row in rows
+        if isinstance(row, dict) and row.get("serial")
+    }
+
+
+def _history_start_key(t0: str) -> float:
+    """Sort key for readings history start times, unparseable ones last."""
+    parsed = dt_util.parse_datetime(t0)
+    return parsed.timestamp() if parsed is not None else float("inf")
+
+
+def _fleet_metrics(
+    readings: dict[str, MTDeviceData], candidates: list[str]
+) -> list[str]:
+    """Return which of ``candidates`` any sensor in ``readings`` reports."""
+    wanted = set(candidates)
+    found: set[str] = set()
+    for device in readings.values():
+        for reading in device.get("readings") or ():
+            metric = reading.get("metric")
+            if metric in wanted:
+                found.add(metric)
+        if found == wanted:
+            break
+    return sorted(found)
+
+
+def _merge_readings(
+    base: dict[str, MTDeviceData], rows: list[Any]
+) -> dict[str, MTDeviceData]:
+    """Overlay per-metric readings from ``rows`` onto the ``base`` snapshot.
+
+    Each reading in ``rows`` replaces the same metric's reading for its serial
+    unless the base reading is newer. ``base`` is never mutated; only serials
+    present in ``rows`` get new dicts.
+    """
+    merged = dict(base)
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        device = base.get(row.get("serial", ""))
+        if device is None or not row.get("readings"):
+            continue
+        updates = {
+            reading.get("metric"): reading
+            for reading in row["readings"]
+            if isinstance(reading, dict)
+        }
+        readings = []
+        for reading in device.get("readings") or ():
+            update = updates.pop(reading.get("metric"), None)
+            # ISO-8601 UTC timestamps compare correctly as strings
+            newer = update is not None and (update.get("ts") or "") >= (
+                reading.get("ts") or ""
+            )
+            readings.append(update if newer else reading)
+        readings.extend(updates.values())
+        merged[row["serial"]] = cast("MTDeviceData", {**device, "readings": readings})
+    return merged
+
+
 def _configure_third_party_logging() -> None:
     """Configure third-party library logging based on our component's logging level.
 
@@ -161,6 +279,11 @@ class MerakiOrganizationHub:
         )
         self._initial_refresh_task: asyncio.Task | None = None
 
+        # Push updates for the diagnostic sensors: callbacks run whenever the
+        # API call counters or the rate limiter's metrics change.
+        self._metrics_listeners: list[Callable[[], None]] = []
+        self._rate_limiter.add_listener(self._async_notify_metrics_listeners)
+
         # Short-TTL caches for the org-wide MT reads. There is one coordinator
         # per network hub on an independent timer (no shared refresh tick), so
         # N back-to-back consumer calls within the TTL must coalesce to ONE API
@@ -169,13 +292,73 @@ class MerakiOrganizationHub:
             max(MIN_SCAN_INTERVAL, DEVICE_TYPE_SCAN_INTERVALS.get(SENSOR_TYPE_MT, 30))
         )
         self._sensor_readings_cache: tuple[float, dict[str, MTDeviceData]] | None = None
+        # How far ahead of its tick the cached snapshot was prefetched (0 when
+        # a tick fetched it itself)
+        self._sensor_readings_lead = 0.0
+
+        # Reporting-cadence trackers by polling interval, shared by every hub
+        # polling at it so they align to one phase and share one fetch
+        self._readings_cadences: dict[float, CadenceTracker] = {}
+
+        # Predictive prefetch of the readings snapshot: upcoming coordinator
+        # tick times (loop clock, min-heap), the armed timer and the in-flight
+        # prefetch, plus recent full-fetch durations that size the lead time.
+        self._readings_prefetch_ticks: list[float] = []
+        self._readings_prefetch_handle: asyncio.TimerHandle | None = None
+        self._readings_prefetch_lead = 0.0
+        self._readings_prefetch: asyncio.Task[dict[str, MTDeviceData] | None] | None = (
+            None
+        )
+        # Snapshot of a forced refresh, served to its coordinators regardless
+        # of their cache age (see async_force_refresh).
+        self._forced_readings: dict[str, MTDeviceData] | None = None
+        self._readings_fetch_durations: deque[float] = deque(
+            maxlen=READINGS_PREFETCH_HISTORY
+        )
+
+        # Readings history requests waiting for the shared call: the union of
+        # their serials and metrics, and each request's start time.
+        self._history_serials: set[str] = set()
+        self._history_metrics: set[str] = set()
+        self._history_starts: list[str] = []
+        self._history_fetch: asyncio.Task[list[dict[str, Any]]] | None = None
+
+        # Readings metrics to request, or None to request all of them. Metrics
+        # whose entities are all disabled are left out (see
+        # async_track_enabled_metrics).
+        self._enabled_metrics: tuple[str, ...] | None = None
+        # Sensors whose readings entities are all disabled; the MT refresh
+        # planner sends them no refresh commands. Frozen lazily on read.
+        self._unwatched: set[str] = set()
+        self._unwatched_serials: frozenset[str] | None = frozenset()
+        # Our readings entities by entity ID as (metric, serial, enabled), and
+        # entity counts per (metric, enabled) and (serial, enabled), kept up
+        # to date from registry events instead of rescanning the registry.
+        self._metric_entities: dict[str, tuple[str, str, bool]] = {}
+        self._metric_entity_counts: dict[tuple[str, bool], int] = {}
+        self._serial_entity_counts: dict[tuple[str, bool], int] = {}
+
+        # Fast lane for binary metrics: (fetched_at, full snapshot it was merged
+        # over, merged snapshot). Reset whenever the full snapshot is refetched.
+        self._fast_lane_cache: (
+            tuple[float, dict[str, MTDeviceData], dict[str, MTDeviceData]] | None
+        ) = None
+        # Gateway connectivity sits on its own, slower tier (see
+        # _get_gateway_connections_ttl); one in-flight fetch is shared by every
+        # hub whose tick lands while it runs.
         self._gateway_connections_cache: (
             tuple[float, dict[str, GatewayConnectionData]] | None
         ) = None
+        self._gateway_connections_fetch: (
+            asyncio.Task[dict[str, GatewayConnectionData]] | None
+        ) = None
 
         # Network hubs managed by this organization hub
         self.network_hubs: dict[str, MerakiNetworkHub] = {}
 
+        # One MT15/MT40 refresh action batch per interval for all networks
+        self.mt_refresh_scheduler = MTRefreshScheduler(hass, self)
+
         # Organization-level monitoring data
         self.licenses_info: dict[str, Any] = {}
         self.licenses_expiring_count = 0
@@ -260,6 +443,38 @@ class MerakiOrganizationHub:
         """Return the throttle window length in minutes."""
         return API_THROTTLE_WINDOW_MINUTES
 
+    @property
+    def diagnostic_update_interval(self) -> float:
+        """Minimum seconds between diagnostic sensor state writes."""
+        return float(
+            self.config_entry.options.get(
+                CONF_DIAGNOSTIC_UPDATE_INTERVAL, DEFAULT_DIAGNOSTIC_UPDATE_INTERVAL
+            )
+        )
+
+    @callback
+    def async_add_metrics_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a callback run whenever API call or rate limit metrics change.
+
+        Returns a callable that removes the listener.
+        """
+        self._metrics_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._metrics_listeners:
+                self._metrics_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def _async_notify_metrics_listeners(self) -> None:
+        """Tell the diagnostic sensors that their metrics changed."""
+        for listener in list(self._metrics_listeners):
+            listener()
+
     @property
     def last_license_update_age_minutes(self) -> int | None:
         """Get the age of the last license update in minutes."""
@@ -314,6 +529,11 @@ class MerakiOrganizationHub:
         """Get the base URL for the Meraki API."""
         return self._base_url
 
+    @property
+    def rate_limiter(self) -> MerakiRateLimiter:
+        """Shared rate limiter for this organization's API calls."""
+        return self._rate_limiter
+
     def _track_api_call_duration(self, duration: float) -> None:
         """Track API call duration for performance monitoring."""
         self._api_call_durations.append(duration)
@@ -326,6 +546,13 @@ class MerakiOrganizationHub:
         """
         return self.hass.loop.time()
 
+    def _get_gateway_connections_ttl(self) -> float:
+        """Refresh interval for gateway connectivity, never below the readings TTL."""
+        interval = self.config_entry.options.get(
+            CONF_GATEWAY_CONNECTIONS_INTERVAL, DEFAULT_GATEWAY_CONNECTIONS_INTERVAL
+        )
+        return max(self._org_cache_ttl, float(interval))
+
     @staticmethod
     def _extract_status(err: Exception) -> int | None:
         """Best-effort HTTP status extraction from a Meraki SDK error."""
@@ -337,17 +564,25 @@ class MerakiOrganizationHub:
 
     @staticmethod
     def _extract_retry_after(err: Exception, cap_seconds: float) -> float:
-        """Parse a capped Retry-After wait from a 429 error's response headers."""
+        """Parse a capped Retry-After wait from a 429 error's response headers.
+
+        SDK errors carry the response; our own ``MerakiApiError`` carries the
+        header value in its ``retry_after`` context.
+        """
         response = getattr(err, "response", None)
         headers = getattr(response, "headers", None)
+        context = getattr(err, "context", None)
         retry_after: float | None = None
+        raw: Any = None
         if isinstance(headers, dict):
             raw = headers.get("Retry-After") or headers.get("retry-after")
-            if raw is not None:
-                try:
-                    retry_after = float(raw)
-                except (ValueError, TypeError):
-                    retry_after = None
+        elif isinstance(context, dict):
+            raw = context.get("retry_after")
+        if raw is not None:
+            try:
+                retry_after = float(raw)
+            except (ValueError, TypeError):
+                retry_after = None
         if retry_after is None or retry_after < 0:
             retry_after = float(cap_seconds)
         # Cap so a hostile/huge header can never stall the coordinator.
@@ -365,8 +600,10 @@ class MerakiOrganizationHub:
 
         The Meraki SDK client is built with ``wait_on_rate_limit=False`` and
         ``retry_4xx_error=False`` so it never blocks internally; we own the
-        retry here. Non-429 errors propagate immediately. The ``asyncio.sleep``
-        is cancellable, so a coordinator shutdown mid-wait unwinds cleanly.
+        retry here. Calls made outside the SDK (action batches) raise
+        ``MerakiApiError`` with the response status, and get the same retry.
+        Non-429 errors propagate immediately. The ``asyncio.sleep`` is
+        cancellable, so a coordinator shutdown mid-wait unwinds cleanly.
         """
         attempt = 0
         while True:
@@ -375,7 +612,7 @@ class MerakiOrganizationHub:
                 if asyncio.iscoroutine(result):
                     result = await result
                 return result
-            except (APIError, AsyncAPIError) as err:
+            except (APIError, AsyncAPIError, MerakiApiError) as err:
                 status = self._extract_status(err)
                 if status != 429 or attempt >= max_retries:
                     raise
@@ -412,8 +649,177 @@ class MerakiOrganizationHub:
             self.failed_api_calls += 1
             self.last_api_call_error = str(err)
             raise
+        finally:
+            self._async_notify_metrics_listeners()
+
+    @property
+    def enabled_metrics(self) -> tuple[str, ...] | None:
+        """Readings metrics with an enabled entity, or None for all metrics."""
+        return self._enabled_metrics
+
+    @property
+    def unwatched_serials(self) -> frozenset[str]:
+        """Sensors with readings entities, all of them disabled."""
+        if self._unwatched_serials is None:
+            self._unwatched_serials = frozenset(self._unwatched)
+        return self._unwatched_serials
+
+    @callback
+    def async_track_enabled_metrics(self) -> Callable[[], None]:
+        """Keep ``enabled_metrics`` in sync with the entity registry.
+
+        The registry is scanned once here; after that each registry event
+        only updates the counts for the entity it names.
+
+        Returns the listener's unsubscribe callback.
+        """
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(self.hass), self.config_entry.entry_id
+        ):
+            self._async_track_metric_entity(entry.entity_id, entry)
+        self._async_update_enabled_metrics()
+        return self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_handle_entity_registry_updated,
+        )
+
+    @callback
+    def _async_handle_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update the metric set when one of our entities is toggled."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if data["action"] == "remove":
+            if entity_id not in self._metric_entities:
+                return
+            self._async_track_metric_entity(entity_id, None)
+            self._async_update_enabled_metrics()
+            return
+        if data["action"] == "update":
+            old_entity_id = data.get("old_entity_id")
+            if old_entity_id is not None:
+                self._async_track_metric_entity(old_entity_id, None)
+            elif "disabled_by" not in data["changes"]:
+                return
+        entry = er.async_get(self.hass).async_get(entity_id)
+        if entry is not None and entry.config_entry_id != self.config_entry.entry_id:
+            entry = None
+        self._async_track_metric_entity(entity_id, entry)
+        self._async_update_enabled_metrics()
+
+    @callback
+    def _async_track_metric_entity(
+        self, entity_id: str, entry: er.RegistryEntry | None
+    ) -> None:
+        """Replace one entity's share of the counts with its registry entry's.
+
+        An entry of None (removed, or not a readings entity of ours) drops the
+        entity. Sensors are marked unwatched once they have readings entities
+        and all of them are disabled.
+        """
+        changed: list[tuple[str, str, bool]] = []
+        if (previous := self._metric_entities.pop(entity_id, None)) is not None:
+            changed.append(previous)
+            self._count_metric_entity(previous, -1)
+        prefix = f"{self.config_entry.entry_id}_"
+        if (
+            entry is not None
+            and (metric := _entity_metric(entry.unique_id, prefix)) is not None
+        ):
+            serial = entry.unique_id[len(prefix) :].partition("_")[0]
+            current = (metric, serial, entry.disabled_by is None)
+            self._metric_entities[entity_id] = current
+            changed.append(current)
+            self._count_metric_entity(current, 1)
+
+        counts = self._serial_entity_counts
+        for _metric, serial, _enabled in changed:
+            unwatched = (serial, False) in counts and (serial, True) not in counts
+            if unwatched != (serial in self._unwatched):
+                if unwatched:
+                    self._unwatched.add(serial)
+                else:
+                    self._unwatched.discard(serial)
+                self._unwatched_serials = None
+
+    def _count_metric_entity(self, state: tuple[str, str, bool], delta: int) -> None:
+        """Add ``delta`` to the metric and serial counts of one entity."""
+        metric, serial, enabled = state
+        for counts, key in (
+            (self._metric_entity_counts, (metric, enabled)),
+            (self._serial_entity_counts, (serial, enabled)),
+        ):
+            if count := counts.get(key, 0) + delta:
+                counts[key] = count
+            else:
+                del counts[key]
+
+    @callback
+    def _async_update_enabled_metrics(self) -> None:
+        """Rebuild the readings metric filter from the tracked entity counts.
 
-    async def async_get_all_sensor_readings(self) -> dict[str, MTDeviceData]:
+        A metric is dropped only when it has entities and all of them are
+        disabled, so metrics of newly discovered devices are still fetched.
+        Button, door and water are always fetched for device-trigger events.
+        """
+        counts = self._metric_entity_counts
+        disabled_only = {
+            metric
+            for metric, enabled in counts
+            if not enabled and (metric, True) not in counts
+        } - set(MT_EVENT_SENSOR_METRICS)
+        enabled_metrics = (
+            tuple(m for m in MT_READING_METRICS if m not in disabled_only)
+            if disabled_only
+            else None
+        )
+        if enabled_metrics != self._enabled_metrics:
+            _LOGGER.debug(
+                "Readings metrics filter for %s: %s",
+                self.organization_id,
+                ", ".join(enabled_metrics) if enabled_metrics else "all metrics",
+            )
+            self._enabled_metrics = enabled_metrics
+
+    @property
+    def fast_lane_interval(self) -> float | None:
+        """Interval of the binary-metric fast lane, or None when it is disabled."""
+        options = self.config_entry.options
+        if not options.get(
+            CONF_BINARY_FAST_LANE_ENABLED, DEFAULT_BINARY_FAST_LANE_ENABLED
+        ):
+            return None
+        return float(
+            options.get(
+                CONF_BINARY_FAST_LANE_INTERVAL, DEFAULT_BINARY_FAST_LANE_INTERVAL
+            )
+        )
+
+    @property
+    def sensor_readings_fresh(self) -> bool:
+        """Return True if the org-wide readings snapshot is still cached."""
+        if self._sensor_readings_cache is None:
+            return False
+        fetched_at = self._sensor_readings_cache[0]
+        return self._cache_now() - fetched_at < self._org_cache_ttl
+
+    def readings_cadence(self, interval: float) -> CadenceTracker:
+        """Return the org's reporting-cadence tracker for a polling interval.
+
+        Hubs polling at the same interval share one tracker, so they learn one
+        reporting phase and their aligned ticks land on one cached snapshot
+        instead of each forcing its own fetch.
+        """
+        cadence = self._readings_cadences.get(float(interval))
+        if cadence is None:
+            cadence = CadenceTracker(interval)
+            self._readings_cadences[float(interval)] = cadence
+        return cadence
+
+    async def async_get_all_sensor_readings(
+        self, max_age: float | None = None
+    ) -> dict[str, MTDeviceData]:
         """Fetch latest MT readings for the WHOLE org in one call (no serials filter).
 
         Fixes SCALE-13: one org-wide
@@ -422,22 +828,66 @@ class MerakiOrganizationHub:
         serial in the org (callers filter to their devices client-side). Result
         is served from a short-TTL cache so N per-hub coordinators coalesce to
         one API call.
+
+        With the binary fast lane enabled, ticks between full fetches also
+        issue a ``metrics=``-filtered call for the door/water/button metrics
+        present in the fleet and merge it over the full snapshot.
+
+        Args:
+            max_age: Optional tighter cache age in seconds. Cadence-aligned
+                coordinators pass the time since the expected sample so a
+                snapshot fetched before it is not served. A prefetched
+                snapshot's lead time is not counted against it.
         """
         if self.dashboard is None:
             return {}
 
         now = self._cache_now()
-        if self._sensor_readings_cache is not None:
+        ttl = self._org_cache_ttl
+        if max_age is not None:
+            ttl = min(ttl, max_age + self._sensor_readings_lead)
+        full = self._forced_readings
+        if full is None and self._sensor_readings_cache is not None:
             fetched_at, cached = self._sensor_readings_cache
-            if now - fetched_at < self._org_cache_ttl:
-                return cached
+            if now - fetched_at < ttl:
+                full = cached
+
+        if full is None and self._readings_prefetch is not None:
+            # A prefetch is already fetching this snapshot; share it.
+            full = await asyncio.shield(self._readings_prefetch)
+        if full is None:
+            full = await self._async_fetch_sensor_readings(now)
+
+        fast_lane_interval = self.fast_lane_interval
+        if fast_lane_interval is None:
+            return full
+        return await self._async_apply_fast_lane(now, full, fast_lane_interval)
+
+    async def _async_fetch_sensor_readings(
+        self, now: float, lead: float = 0.0
+    ) -> dict[str, MTDeviceData]:
+        """Issue the full-metric org-wide readings call and refresh its cache.
+
+        Args:
+            now: Cache clock time the fetch started at
+            lead: Seconds ahead of its tick a prefetch started
+        """
+        if self.dashboard is None:
+            return {}
+
+        # Only ask for metrics that have an enabled entity (all when unfiltered)
+        metric_filter: dict[str, Any] = {}
+        if self._enabled_metrics is not None:
+            metric_filter["metrics"] = list(self._enabled_metrics)
 
+        started = self.hass.loop.time()
         readings = await self.async_api_call(
             self.dashboard.sensor.getOrganizationSensorReadingsLatest,
             self.organization_id,
             priority=API_PRIORITY_HIGH,
             total_pages="all",
             perPage=1000,
+            **metric_filter,
         )
         # Guard the SDK's exhausted-retry error dict ({"errors": [...]}). Raising
         # here (rather than returning {}) keeps prior entity state instead of
@@ -448,14 +898,234 @@ class MerakiOrganizationHub:
             )
 
         self.last_api_call_error = None
-        result: dict[str, MTDeviceData] = {
-            r["serial"]: cast("MTDeviceData", r)
-            for r in readings
-            if isinstance(r, dict) and r.get("serial")
-        }
+        if len(readings) >= READINGS_EXECUTOR_THRESHOLD:
+            # Only the swap of the finished snapshot happens on the loop.
+            result = await self.hass.async_add_executor_job(
+                _build_readings_snapshot, readings
+            )
+        else:
+            result = _build_readings_snapshot(readings)
         self._sensor_readings_cache = (now, result)
+        self._sensor_readings_lead = lead
+        self._fast_lane_cache = None
+        self._readings_fetch_durations.append(self.hass.loop.time() - started)
         return result
 
+    async def async_force_refresh(
+        self, coordinators: Iterable[MerakiSensorCoordinator]
+    ) -> None:
+        """Fetch one fresh readings snapshot and refresh ``coordinators`` from it.
+
+        Bypasses the readings TTL: a prefetch already in flight is waited for,
+        then the cached snapshot is dropped and replaced by a single org-wide
+        fetch. Ticks arriving meanwhile share that fetch like a prefetch, and
+        every coordinator refreshes concurrently from its result whatever
+        cache age it asks for, so none of them fetches its own.
+        """
+        if self.dashboard is None:
+            return
+
+        while (prefetch := self._readings_prefetch) is not None:
+            await asyncio.wait((prefetch,))
+
+        self._sensor_readings_cache = None
+        self._fast_lane_cache = None
+        fetch = self.hass.async_create_task(
+            self._async_force_fetch_readings(), "meraki_dashboard_readings_refresh"
+        )
+        self._readings_prefetch = fetch
+        fetch.add_done_callback(self._clear_readings_prefetch)
+        self._forced_readings = await asyncio.shield(fetch)
+        try:
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+        finally:
+            self._forced_readings = None
+
+    async def _async_force_fetch_readings(self) -> dict[str, MTDeviceData] | None:
+        """Fetch the snapshot for ``async_force_refresh``, raising on failure."""
+        return await self._async_fetch_sensor_readings(self._cache_now())
+
+    @callback
+    def async_schedule_readings_prefetch(self, tick_at: float) -> None:
+        """Prefetch the readings snapshot ahead of a coordinator tick.
+
+        Coordinators report when their next tick fires (``hass.loop.time()``
+        clock). The snapshot is fetched shortly before the earliest tick the
+        current snapshot won't cover, led by the slowest recent fetch, so
+        ticks hit a warm cache instead of waiting on pagination.
+        """
+        heapq.heappush(self._readings_prefetch_ticks, tick_at)
+        self._arm_readings_prefetch()
+
+    @callback
+    def _arm_readings_prefetch(self) -> None:
+        """(Re)arm the prefetch timer for the earliest uncovered tick."""
+        if self._readings_prefetch_handle is not None:
+            self._readings_prefetch_handle.cancel()
+            self._readings_prefetch_handle = None
+        if self.dashboard is None or not self._readings_fetch_durations:
+            return
+
+        loop = self.hass.loop
+        now = loop.time()
+        ticks = self._readings_prefetch_ticks
+        cache = self._sensor_readings_cache
+        while ticks and (
+            ticks[0] <= now
+            or (cache is not None and ticks[0] - cache[0] < self._org_cache_ttl)
+        ):
+            heapq.heappop(ticks)
+        if not ticks or self._readings_prefetch is not None:
+            return
+
+        lead = max(self._readings_fetch_durations) + READINGS_PREFETCH_MARGIN_SECONDS
+        self._readings_prefetch_lead = lead
+        self._readings_prefetch_handle = loop.call_at(
+            max(ticks[0] - lead, now), self._start_readings_prefetch
+        )
+
+    @callback
+    def _start_readings_prefetch(self) -> None:
+        """Start the shared prefetch task."""
+        self._readings_prefetch_handle = None
+        if self._readings_prefetch is not None:
+            return
+        self._readings_prefetch = self.hass.async_create_task(
+            self._async_prefetch_readings(), "meraki_dashboard_readings_prefetch"
+        )
+        self._readings_prefetch.add_done_callback(self._clear_readings_prefetch)
+
+    def _clear_readings_prefetch(
+        self, prefetch: asyncio.Future[dict[str, MTDeviceData] | None]
+    ) -> None:
+        """Forget a finished prefetch and arm the next one."""
+        if self._readings_prefetch is prefetch:
+            self._readings_prefetch = None
+            if not prefetch.cancelled():
+                self._arm_readings_prefetch()
+
+    async def _async_prefetch_readings(self) -> dict[str, MTDeviceData] | None:
+        """Fetch the readings snapshot ahead of demand.
+
+        Returns None on failure so ticks waiting on it fetch for themselves.
+        """
+        try:
+            return await self._async_fetch_sensor_readings(
+                self._cache_now(), self._readings_prefetch_lead
+            )
+        except Exception as err:  # noqa: BLE001 - the tick retries on its own
+            _LOGGER.debug("Sensor readings prefetch failed: %s", err)
+            # Give up on the tick it was for rather than retrying right away.
+            if self._readings_prefetch_ticks:
+                heapq.heappop(self._readings_prefetch_ticks)
+            return None
+
+    async def _async_apply_fast_lane(
+        self, now: float, full: dict[str, MTDeviceData], interval: float
+    ) -> dict[str, MTDeviceData]:
+        """Merge a fresh binary-metric readings call over the full snapshot.
+
+        The full snapshot already carries the binary metrics when it is
+        younger than the fast-lane interval, so no extra call is made then.
+        A failed fast-lane call keeps serving the last merged snapshot.
+        """
+        if self.dashboard is None or self._sensor_readings_cache is None:
+            return full
+
+        fast_lane = self._fast_lane_cache
+        merged = full
+        if fast_lane is not None and fast_lane[1] is full:
+            fetched_at, _base, merged = fast_lane
+            if now - fetched_at < interval:
+                return merged
+        elif now - self._sensor_readings_cache[0] < interval:
+            return full
+
+        metrics = _fleet_metrics(full, MT_EVENT_SENSOR_METRICS)
+        if not metrics:
+            return full
+
+        try:
+            rows = await self.async_api_call(
+                self.dashboard.sensor.getOrganizationSensorReadingsLatest,
+                self.organization_id,
+                priority=API_PRIORITY_HIGH,
+                total_pages="all",
+                perPage=1000,
+                metrics=metrics,
+            )
+        except Exception as err:  # noqa: BLE001 - full-lane data still valid
+            _LOGGER.debug("Binary fast-lane readings fetch failed: %s", err)
+            return merged
+        if not isinstance(rows, list):
+            _LOGGER.debug("Unexpected fast-lane readings response: %r", type(rows))
+            return merged
+
+        merged = _merge_readings(full, rows)
+        self._fast_lane_cache = (now, full, merged)
+        return merged
+
+    async def async_get_sensor_readings_history(
+        self, serials: list[str], metrics: list[str], t0: str
+    ) -> list[dict[str, Any]]:
+        """Fetch readings history for ``serials`` and ``metrics`` since ``t0``.
+
+        Requests made within ``READINGS_HISTORY_COALESCE_SECONDS`` of each
+        other are merged into one ``getOrganizationSensorReadingsHistory``
+        call for the union of their serials and metrics, from the earliest
+        ``t0``. Every caller gets that call's flat history rows (``serial``,
+        ``metric``, ``ts`` and the metric payload) and picks out its own. Used
+        by the network hubs' event services to replay button presses and door
+        transitions between two polls.
+        """
+        if self.dashboard is None or not serials:
+            return []
+
+        self._history_serials.update(serials)
+        self._history_metrics.update(metrics)
+        self._history_starts.append(t0)
+        if self._history_fetch is None:
+            self._history_fetch = self.hass.async_create_background_task(
+                self._async_fetch_readings_history(),
+                "meraki_dashboard_readings_history",
+            )
+        # Shielded: one caller giving up must not cancel the shared fetch.
+        return await asyncio.shield(self._history_fetch)
+
+    async def _async_fetch_readings_history(self) -> list[dict[str, Any]]:
+        """Issue the merged readings history call once requests have gathered."""
+        await asyncio.sleep(READINGS_HISTORY_COALESCE_SECONDS)
+        serials = sorted(self._history_serials)
+        metrics = sorted(self._history_metrics)
+        t0 = min(self._history_starts, key=_history_start_key)
+        # Requests from here on start the next call
+        self._history_serials = set()
+        self._history_metrics = set()
+        self._history_starts = []
+        self._history_fetch = None
+        if self.dashboard is None:
+            return []
+
+        rows = await self.async_api_call(
+            self.dashboard.sensor.getOrganizationSensorReadingsHistory,
+            self.organization_id,
+            priority=API_PRIORITY_HIGH,
+            total_pages="all",
+            perPage=1000,
+            t0=t0,
+            serials=serials,
+            metrics=metrics,
+        )
+        if isinstance(rows, dict) and "items" in rows:
+            rows = rows["items"]
+        if not isinstance(rows, list):
+            raise MerakiApiError(
+                f"Unexpected sensor readings history response: {type(rows)!r}"
+            )
+        return [row for row in rows if isinstance(row, dict)]
+
     async def async_get_all_gateway_connections(
         self,
     ) -> dict[str, GatewayConnectionData]:
@@ -464,7 +1134,9 @@ class MerakiOrganizationHub:
         One org-wide ``getOrganizationSensorGatewaysConnectionsLatest(org_id,
         total_pages="all")`` call, returning
         ``{serial: {"rssi": int | None, "last_connected_at": str | None}}``.
-        Short-TTL cached like the readings call.
+        Cached on its own tier (``gateway_connections_interval``, 5 minutes by
+        default) rather than the readings TTL, so readings ticks in between
+        merge the most recent snapshot. Concurrent callers share one fetch.
         """
         if self.dashboard is None:
             return {}
@@ -472,9 +1144,37 @@ class MerakiOrganizationHub:
         now = self._cache_now()
         if self._gateway_connections_cache is not None:
             fetched_at, cached = self._gateway_connections_cache
-            if now - fetched_at < self._org_cache_ttl:
+            if now - fetched_at < self._get_gateway_connections_ttl():
                 return cached
 
+        if self._gateway_connections_fetch is None:
+            self._gateway_connections_fetch = self.hass.async_create_task(
+                self._async_fetch_gateway_connections(now),
+                "meraki_dashboard_gateway_connections_fetch",
+            )
+            self._gateway_connections_fetch.add_done_callback(
+                self._clear_gateway_connections_fetch
+            )
+        # Shielded: one caller giving up must not cancel the shared fetch.
+        return await asyncio.shield(self._gateway_connections_fetch)
+
+    def _clear_gateway_connections_fetch(
+        self, fetch: asyncio.Future[dict[str, GatewayConnectionData]]
+    ) -> None:
+        """Forget a finished shared gateway fetch so the next miss starts anew."""
+        if self._gateway_connections_fetch is fetch:
+            self._gateway_connections_fetch = None
+        if not fetch.cancelled():
+            # Mark the error retrieved; callers that awaited it already saw it.
+            fetch.exception()
+
+    async def _async_fetch_gateway_connections(
+        self, now: float
+    ) -> dict[str, GatewayConnectionData]:
+        """Issue the org-wide gateway connections call and refresh its cache."""
+        if self.dashboard is None:
+            return {}
+
         rows = await self.async_api_call(
             self.dashboard.sensor.getOrganizationSensorGatewaysConnectionsLatest,
             self.organization_id,
@@ -814,6 +1514,22 @@ class MerakiOrganizationHub:
 
         self.network_hubs.clear()
 
+        if self._gateway_connections_fetch is not None:
+            self._gateway_connections_fetch.cancel()
+            self._gateway_connections_fetch = None
+
+        if self._history_fetch is not None:
+            self._history_fetch.cancel()
+            self._history_fetch = None
+
+        if self._readings_prefetch_handle is not None:
+            self._readings_prefetch_handle.cancel()
+            self._readings_prefetch_handle = None
+        if self._readings_prefetch is not None:
+            self._readings_prefetch.cancel()
+            self._readings_prefetch = None
+        self._readings_prefetch_ticks.clear()
+
         if self._initial_refresh_task and not self._initial_refresh_task.done():
             self._initial_refresh_task.cancel()
             await asyncio.gather(self._initial_refresh_task, return_exceptions=True)
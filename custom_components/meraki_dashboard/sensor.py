@@ -11,12 +11,20 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    ATTR_TEMPERATURE_FAHRENHEIT,
+    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+    DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES,
     DOMAIN,
     MT_SENSOR_LAST_SEEN,
     MT_SENSOR_SIGNAL_STRENGTH,
+    MT_SENSOR_TEMPERATURE,
     SENSOR_TYPE_MT,
 )
-from .devices.mt import MT_ENERGY_SENSOR_DESCRIPTIONS, MT_SENSOR_DESCRIPTIONS
+from .devices.mt import (
+    MT_ENERGY_SENSOR_DESCRIPTIONS,
+    MT_SENSOR_DESCRIPTIONS,
+    MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS,
+)
 from .devices.organization import (
     NETWORK_HUB_SENSOR_DESCRIPTIONS,
     ORG_HUB_SENSOR_DESCRIPTIONS,
@@ -26,7 +34,7 @@ from .entities.factory import (
     create_network_entity,
     create_organization_entity,
 )
-from .utils import should_create_entity
+from .utils import build_capability_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -119,11 +127,21 @@ async def _setup_mt_sensors(
         _LOGGER.warning("No coordinator found for MT network %s", network_hub.hub_name)
         return
 
+    volatile_attribute_entities = config_entry.options.get(
+        CONF_VOLATILE_ATTRIBUTE_ENTITIES, DEFAULT_VOLATILE_ATTRIBUTE_ENTITIES
+    )
+
+    # Resolve every device's supported metrics once for this snapshot
+    capability_index = build_capability_index(network_hub.devices, coordinator.data)
+
     # Create sensors for each MT device
     for device in network_hub.devices:
         device_serial = device.get("serial")
         if not device_serial:
             continue
+        capabilities: frozenset[str] | None = capability_index.get(
+            device_serial, frozenset()
+        )
 
         _LOGGER.debug(
             "Creating sensors for MT device: %s (model: %s)",
@@ -135,7 +153,7 @@ async def _setup_mt_sensors(
         # Signal strength (RSSI) and last-seen are always created for MT
         # devices: they come from the org-wide gateway-connections fetch
         # (merged onto MTDeviceData), not from the per-metric readings-based
-        # capability discovery that should_create_entity() otherwise uses, so
+        # capability discovery behind the capability index, so
         # the entity always exists and reflects "no gateway row" as an
         # unavailable/None value rather than being absent entirely.
         entities_created_for_device = 0
@@ -144,9 +162,7 @@ async def _setup_mt_sensors(
                 MT_SENSOR_SIGNAL_STRENGTH,
                 MT_SENSOR_LAST_SEEN,
             )
-            if always_create or should_create_entity(
-                device, description.key, coordinator.data
-            ):
+            if always_create or capabilities is None or description.key in capabilities:
                 try:
                     entity = create_device_entity(
                         "mt_sensor",
@@ -173,7 +189,7 @@ async def _setup_mt_sensors(
         for description in MT_ENERGY_SENSOR_DESCRIPTIONS.values():
             # Extract the base power sensor key from the energy sensor key
             power_sensor_key = description.key.replace("_energy", "")
-            if should_create_entity(device, power_sensor_key, coordinator.data):
+            if capabilities is None or power_sensor_key in capabilities:
                 try:
                     entity = create_device_entity(
                         "mt_energy_sensor",
@@ -196,6 +212,32 @@ async def _setup_mt_sensors(
                         "Failed to create MT energy sensor %s: %s", description.key, e
                     )
 
+        # Create diagnostic entities for volatile attributes when they are not
+        # carried as state attributes
+        if volatile_attribute_entities:
+            for description in MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS.values():
+                if (
+                    description.key == ATTR_TEMPERATURE_FAHRENHEIT
+                    and capabilities is not None
+                    and MT_SENSOR_TEMPERATURE not in capabilities
+                ):
+                    continue
+                try:
+                    entity = create_device_entity(
+                        "mt_volatile_attribute_sensor",
+                        coordinator,
+                        device,
+                        description,
+                        config_entry.entry_id,
+                        network_hub,
+                    )
+                    entities.append(entity)
+                    entities_created_for_device += 1
+                except ValueError as e:
+                    _LOGGER.warning(
+                        "Failed to create MT sensor %s: %s", description.key, e
+                    )
+
         if entities_created_for_device == 0:
             _LOGGER.debug(
                 "No sensors created for device %s (model: %s) - no supported metrics found",
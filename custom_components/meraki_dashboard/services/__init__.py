@@ -7,7 +7,7 @@ from .event_service import (
     EventThrottle,
     MerakiEventService,
 )
-from .mt_refresh_service import MTRefreshService
+from .mt_refresh_service import MTRefreshScheduler, MTRefreshService
 
 __all__ = [
     "EventFilter",
@@ -15,5 +15,6 @@ __all__ = [
     "EventSubscriber",
     "EventThrottle",
     "MerakiEventService",
+    "MTRefreshScheduler",
     "MTRefreshService",
 ]
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
 
 from ..const import (
+    DOMAIN,
     EVENT_DEVICE_ID,
     EVENT_DEVICE_SERIAL,
     EVENT_PREVIOUS_VALUE,
@@ -25,12 +31,60 @@ from ..const import (
     MT_SENSOR_DOOR,
     MT_SENSOR_WATER,
 )
+from ..data.transformers import extract_binary_state, extract_button_press
 
 if TYPE_CHECKING:
     from ..types import MerakiDeviceData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Detected events waiting for the drain task; further events are dropped and
+# counted rather than stalling the coordinator tick that produced them.
+EVENT_QUEUE_MAXSIZE = 1000
+
+# A subscriber that takes longer than this on one event is abandoned for it
+EVENT_SUBSCRIBER_TIMEOUT_SECONDS = 10.0
+
+# Most event keys the throttle tracks at once
+EVENT_THROTTLE_MAX_ENTRIES = 10000
+
+# Subscription routing key: (event_type, data field, value); (event_type,
+# None, None) holds subscriptions without a serial or sensor type filter.
+_RouteKey = tuple[str, str | None, str | None]
+
+# Readings history longer than this between two polls (e.g. after an outage)
+# is not backfilled; only the latest change is published.
+EVENT_BACKFILL_MAX_GAP_SECONDS = 3600
+
+# Most backfilled transitions replayed per serial and metric in one tick
+EVENT_BACKFILL_MAX_TRANSITIONS = 50
+
+# Fetches readings history rows for (serials, metrics) since an ISO ``t0``
+HistoryFetcher = Callable[[list[str], list[str], str], Awaitable[list[dict[str, Any]]]]
+
+
+def _event_state(reading: dict[str, Any], metric: str) -> Any:
+    """Return an event-worthy metric's state from one reading.
+
+    Nested payloads are read with the same extractors as the binary sensor
+    entities; a flat ``value`` is still accepted for older payloads.
+    """
+    if not isinstance(reading.get(metric), dict):
+        return reading.get("value")
+    if metric == MT_SENSOR_BUTTON:
+        return extract_button_press(reading)
+    return extract_binary_state(reading, metric)
+
+
+# Metrics whose state changes are published as events
+_EVENT_METRICS = frozenset(MT_EVENT_SENSOR_METRICS)
+
+# Metrics whose events are new readings rather than value changes
+_TIMESTAMP_TRIGGERED_METRICS = frozenset({MT_SENSOR_BUTTON})
+
+# Metrics whose transitions between two polls are replayed from history
+_BACKFILL_METRICS = frozenset({MT_SENSOR_BUTTON, MT_SENSOR_DOOR})
+
 
 class EventPublisher(ABC):
     """Abstract base class for event publishers."""
@@ -90,54 +144,130 @@ class EventFilter:
 
 
 class EventThrottle:
-    """Throttle events to prevent flooding."""
+    """Throttle events to prevent flooding.
 
-    def __init__(self, min_interval_seconds: float = 1.0) -> None:
+    Times come from the monotonic clock the event loop runs on, so wall-clock
+    jumps never release or hold back events. Each allowed event is pushed on
+    a min-heap by the time its throttle window closes and popped once it has,
+    so memory only holds keys throttled right now (capped at ``max_entries``)
+    and each event costs amortized O(log n).
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 1.0,
+        max_entries: int = EVENT_THROTTLE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize event throttle.
 
         Args:
             min_interval_seconds: Minimum seconds between events for same key
+            max_entries: Most keys tracked at once; the oldest are dropped
+            clock: Monotonic time source (``loop.time()`` uses the same clock)
         """
         self.min_interval = min_interval_seconds
-        self._last_event_times: dict[str, datetime] = {}
+        self.max_entries = max_entries
+        self._clock = clock
+        self._last_event_times: dict[str, float] = {}
+        self._expiry: list[tuple[float, str]] = []
 
     def should_allow(self, key: str) -> bool:
         """Check if event should be allowed based on throttling."""
-        now = datetime.now()
-        last_time = self._last_event_times.get(key)
+        now = self._clock()
+        self._expire(now - self.min_interval)
 
-        if last_time:
-            delta = (now - last_time).total_seconds()
-            if delta < self.min_interval:
-                return False
+        if key in self._last_event_times:
+            return False
 
         self._last_event_times[key] = now
+        heapq.heappush(self._expiry, (now, key))
+        if len(self._expiry) > self.max_entries:
+            _time, oldest = heapq.heappop(self._expiry)
+            del self._last_event_times[oldest]
         return True
 
     def clear_old_entries(self, max_age_seconds: float = 3600) -> None:
         """Clear old throttle entries to prevent memory growth."""
-        now = datetime.now()
-        keys_to_remove = []
+        self._expire(self._clock() - max_age_seconds)
 
-        for key, timestamp in self._last_event_times.items():
-            if (now - timestamp).total_seconds() > max_age_seconds:
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
+    def _expire(self, cutoff: float) -> None:
+        """Drop keys whose last event was at or before ``cutoff``."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= cutoff:
+            _time, key = heapq.heappop(expiry)
             del self._last_event_times[key]
 
 
 class MerakiEventService(EventPublisher):
-    """Event service for Meraki Dashboard integration."""
+    """Event service for Meraki Dashboard integration.
+
+    Once started, events detected by ``track_sensor_changes`` are put on a
+    bounded queue and published by a dedicated task, so slow subscribers
+    never hold up the coordinator tick. Until then they are published inline.
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the event service."""
+    With ``fetch_history``, a button or door reading whose ``ts`` moved by
+    more than ``fetch_interval`` since the previous poll may hide presses or
+    open/close cycles in between. Those are held for a background task that
+    runs ``async_flush_backfill`` off the coordinator tick; it fetches the
+    readings history for all of them in one call and replays every
+    transition in order.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch_history: HistoryFetcher | None = None,
+        fetch_interval: float = 0,
+    ) -> None:
+        """Initialize the event service.
+
+        Args:
+            hass: Home Assistant instance
+            fetch_history: Optional readings history source for backfill
+            fetch_interval: Seconds between readings polls; smaller ``ts``
+                gaps are the sensor's next report and are not backfilled
+        """
         self.hass = hass
+        self._fetch_history = fetch_history
+        self.fetch_interval = fetch_interval
+        self._backfill_task: asyncio.Task[None] | None = None
+        # (serial, metric) -> (device_id, previous (value, ts), current
+        # (value, ts), (previous, current) reading times) awaiting backfill
+        self._pending_backfill: dict[
+            tuple[str, str],
+            tuple[str, tuple[Any, str], tuple[Any, str], tuple[float, float]],
+        ] = {}
+        self.backfilled_readings = 0
+        # Subscriptions by event type, and the same subscriptions routed by
+        # the serial or sensor type their filter selects, keyed by a
+        # subscription token so unsubscribing is a dict pop.
         self._subscribers: defaultdict[
-            str, list[tuple[EventSubscriber, EventFilter | None]]
-        ] = defaultdict(list)
-        self._previous_states: dict[str, dict[str, Any]] = {}
+            str, dict[int, tuple[EventSubscriber, EventFilter | None]]
+        ] = defaultdict(dict)
+        self._routes: dict[
+            _RouteKey, dict[int, tuple[EventSubscriber, EventFilter | None]]
+        ] = {}
+        self._subscription_tokens = itertools.count()
+        # Last (value, ts) per (serial, metric) and the readings list each
+        # serial's state was last diffed against
+        self._previous_states: dict[tuple[str, str], tuple[Any, str | None]] = {}
+        self._snapshot_readings: dict[str, list[dict[str, Any]]] = {}
         self._logged_missing_devices: set[str] = set()
+
+        # Serial -> device registry ID, seeded from one registry scan and kept
+        # current from device registry events. Serials with no device are
+        # cached as misses until the registry changes.
+        self._device_ids: dict[str, str] | None = None
+        self._device_serials: dict[str, set[str]] = {}
+        self._unregistered_serials: set[str] = set()
+        self._device_registry_unsub: Callable[[], None] | None = None
+
+        # Bounded event queue and the task draining it (see async_start)
+        self._event_queue: asyncio.Queue[tuple[str, dict[str, Any], bool]] | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+        self.dropped_events = 0
+        self.subscriber_timeouts = 0
         self._throttle = EventThrottle(
             min_interval_seconds=0.5
         )  # Prevent event flooding
@@ -158,28 +288,64 @@ class MerakiEventService(EventPublisher):
         Returns:
             Unsubscribe callback
         """
-        self._subscribers[event_type].append((subscriber, event_filter))
+        token = next(self._subscription_tokens)
+        subscription = (subscriber, event_filter)
+        route_keys = _route_keys(event_type, event_filter)
+        self._subscribers[event_type][token] = subscription
+        for route_key in route_keys:
+            self._routes.setdefault(route_key, {})[token] = subscription
 
         def unsubscribe() -> None:
             """Remove the subscription."""
-            try:
-                self._subscribers[event_type].remove((subscriber, event_filter))
-                if not self._subscribers[event_type]:
-                    del self._subscribers[event_type]
-            except KeyError, ValueError:
-                pass
+            _discard(self._subscribers, event_type, token)
+            for route_key in route_keys:
+                _discard(self._routes, route_key, token)
 
         return unsubscribe
 
-    async def publish_event(self, event_type: str, data: dict[str, Any]) -> None:
+    def _matching_subscribers(
+        self, event_type: str, data: dict[str, Any]
+    ) -> list[EventSubscriber]:
+        """Return the subscribers whose filter matches, in subscription order."""
+        serial = data.get(EVENT_DEVICE_SERIAL)
+        sensor_type = data.get(EVENT_SENSOR_TYPE)
+        if serial and sensor_type:
+            routes = self._routes
+            candidates = {
+                **routes.get((event_type, EVENT_DEVICE_SERIAL, serial), {}),
+                **routes.get((event_type, EVENT_SENSOR_TYPE, sensor_type), {}),
+                **routes.get((event_type, None, None), {}),
+            }
+        else:
+            # Filters let events missing a serial or sensor type through, so
+            # every subscription for the event type is a candidate.
+            candidates = self._subscribers.get(event_type, {})
+
+        return [
+            subscriber
+            for _token, (subscriber, event_filter) in sorted(candidates.items())
+            if event_filter is None or event_filter.matches(event_type, data)
+        ]
+
+    async def publish_event(
+        self, event_type: str, data: dict[str, Any], *, replayed: bool = False
+    ) -> None:
         """Publish an event to subscribers and Home Assistant event bus.
 
         Args:
             event_type: Type of event
             data: Event data
+            replayed: Whether the event was replayed from readings history
         """
-        # Apply throttling for high-frequency events
-        throttle_key = f"{event_type}:{data.get(EVENT_DEVICE_SERIAL, 'unknown')}"
+        # Apply throttling for high-frequency events. Live publishes are keyed
+        # on the state so repeats of it are suppressed; replayed readings are
+        # distinct presses or cycles, so their reading timestamp is keyed too.
+        throttle_key = (
+            f"{event_type}:{data.get(EVENT_DEVICE_SERIAL, 'unknown')}"
+            f":{data.get(EVENT_VALUE, '')}"
+        )
+        if replayed:
+            throttle_key += f":{data.get(EVENT_TIMESTAMP, '')}"
         if not self._throttle.should_allow(throttle_key):
             _LOGGER.debug("Throttled event %s for %s", event_type, throttle_key)
             return
@@ -187,21 +353,77 @@ class MerakiEventService(EventPublisher):
         # Publish to Home Assistant event bus
         self.hass.bus.async_fire(EVENT_TYPE, {**data, EVENT_TYPE: event_type})
 
-        # Notify internal subscribers
-        for subscriber, event_filter in self._subscribers.get(event_type, []):
-            if event_filter is None or event_filter.matches(event_type, data):
-                try:
-                    await subscriber.handle_event(event_type, data)
-                except Exception:
-                    _LOGGER.exception(
-                        "Error in event subscriber %s for event %s",
-                        subscriber,
-                        event_type,
-                    )
+        # Notify internal subscribers concurrently
+        subscribers = self._matching_subscribers(event_type, data)
+        if subscribers:
+            await asyncio.gather(
+                *(
+                    self._async_dispatch(subscriber, event_type, data)
+                    for subscriber in subscribers
+                )
+            )
+
+    async def _async_dispatch(
+        self, subscriber: EventSubscriber, event_type: str, data: dict[str, Any]
+    ) -> None:
+        """Deliver an event to one subscriber, bounded by the subscriber timeout."""
+        try:
+            async with asyncio.timeout(EVENT_SUBSCRIBER_TIMEOUT_SECONDS):
+                await subscriber.handle_event(event_type, data)
+        except TimeoutError:
+            self.subscriber_timeouts += 1
+            _LOGGER.warning(
+                "Event subscriber %s timed out after %.0fs handling %s",
+                subscriber,
+                EVENT_SUBSCRIBER_TIMEOUT_SECONDS,
+                event_type,
+            )
+        except Exception:
+            _LOGGER.exception(
+                "Error in event subscriber %s for event %s",
+                subscriber,
+                event_type,
+            )
+
+    @callback
+    def async_start(self) -> None:
+        """Start publishing detected events from a bounded queue."""
+        if self._drain_task is not None:
+            return
+        self._event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+        self._drain_task = self.hass.async_create_background_task(
+            self._async_drain_events(), "meraki_dashboard_event_queue"
+        )
 
-        # Clean up old throttle entries periodically
-        if len(self._throttle._last_event_times) > 1000:
-            self._throttle.clear_old_entries()
+    async def _async_drain_events(self) -> None:
+        """Publish queued events in order until cancelled."""
+        queue = self._event_queue
+        assert queue is not None
+        while True:
+            event_type, data, replayed = await queue.get()
+            try:
+                await self.publish_event(event_type, data, replayed=replayed)
+            except Exception:
+                _LOGGER.exception("Error publishing event %s", event_type)
+
+    async def _async_emit(
+        self, event_type: str, data: dict[str, Any], replayed: bool = False
+    ) -> None:
+        """Queue an event for the drain task, or publish it inline if not started."""
+        if self._event_queue is None:
+            await self.publish_event(event_type, data, replayed=replayed)
+            return
+        try:
+            self._event_queue.put_nowait((event_type, data, replayed))
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            _LOGGER.log(
+                logging.WARNING if self.dropped_events == 1 else logging.DEBUG,
+                "Event queue full, dropped %s for %s (%d dropped in total)",
+                event_type,
+                data.get(EVENT_DEVICE_SERIAL),
+                self.dropped_events,
+            )
 
     async def track_sensor_changes(
         self,
@@ -211,63 +433,173 @@ class MerakiEventService(EventPublisher):
     ) -> None:
         """Track sensor data and publish events for state changes.
 
+        Detection is a diff of this serial's readings against the previous
+        snapshot: an unchanged readings list (snapshots are never mutated) is
+        skipped outright, and otherwise only button/door/water readings are
+        compared with the stored state.
+
         Args:
             device_serial: Serial number of the device
             sensor_readings: List of sensor readings from API
             device_info: Device information
         """
+        if sensor_readings is self._snapshot_readings.get(device_serial):
+            return
+
         # Get device ID from device registry
         device_id = await self._get_device_id(device_serial, device_info)
         if not device_id:
             return
+        self._snapshot_readings[device_serial] = sensor_readings
 
-        # Process each reading for event-worthy changes
         for reading in sensor_readings:
             metric = reading.get("metric")
-            if metric not in MT_EVENT_SENSOR_METRICS:
+            if metric not in _EVENT_METRICS:
                 continue
 
-            current_value = reading.get("value")
-            timestamp = reading.get("ts")
-
-            # Create unique key for this sensor
-            sensor_key = f"{device_serial}_{metric}"
+            key = (device_serial, metric)
+            current = (_event_state(reading, metric), reading.get("ts"))
+            previous = self._previous_states.get(key)
+            if previous == current:
+                continue
+            self._previous_states[key] = current
+            if previous is None or previous[0] is None:
+                continue
 
-            # Get previous value if exists
-            previous_value = self._previous_states.get(sensor_key, {}).get("value")
+            if self._fetch_history is not None and metric in _BACKFILL_METRICS:
+                window = _backfill_window(previous[1], current[1], self.fetch_interval)
+                if window is not None:
+                    # Readings in between may hold more transitions
+                    self._pending_backfill[key] = (device_id, previous, current, window)
+                    self._async_schedule_backfill()
+                    continue
+
+            current_value, timestamp = current
+            previous_value = previous[0]
+            # A new press repeats the same value, so only its timestamp moves
+            if current_value == previous_value and not (
+                metric in _TIMESTAMP_TRIGGERED_METRICS and current_value
+            ):
+                continue
 
-            _LOGGER.debug(
-                "Checking event for %s: current=%s, previous=%s",
-                sensor_key,
+            await self._async_emit_change(
+                device_id,
+                device_serial,
+                metric,
                 current_value,
                 previous_value,
+                timestamp,
             )
 
-            # Publish event if this is a state change (and we have a previous state)
-            if previous_value is not None and current_value != previous_value:
-                event_type = self._determine_event_type(metric, current_value)
-                event_data: dict[str, Any] = {
-                    EVENT_DEVICE_ID: device_id,
-                    EVENT_DEVICE_SERIAL: device_serial,
-                    EVENT_SENSOR_TYPE: metric,
-                    EVENT_VALUE: current_value,
-                    EVENT_PREVIOUS_VALUE: previous_value,
-                    EVENT_TIMESTAMP: timestamp or datetime.now().isoformat(),
-                }
-
-                await self.publish_event(event_type, event_data)
-
-                # Log important state changes
-                if metric == MT_SENSOR_BUTTON and event_type == "button_pressed":
-                    _LOGGER.info("Button pressed on device %s", device_serial)
-                elif metric == MT_SENSOR_WATER and event_type == "water_detected":
-                    _LOGGER.info("Water detected on device %s", device_serial)
-
-            # Update stored state
-            self._previous_states[sensor_key] = {
-                "value": current_value,
-                "timestamp": timestamp,
-            }
+    @callback
+    def _async_schedule_backfill(self) -> None:
+        """Run the backfill in a background task unless one is already running."""
+        if self._backfill_task is None:
+            self._backfill_task = self.hass.async_create_background_task(
+                self._async_run_backfill(), "meraki_dashboard_event_backfill"
+            )
+
+    async def _async_run_backfill(self) -> None:
+        """Flush held transitions until none are left."""
+        try:
+            while self._pending_backfill:
+                await self.async_flush_backfill()
+        except Exception:
+            _LOGGER.exception("Error backfilling events")
+        finally:
+            self._backfill_task = None
+
+    async def async_flush_backfill(self) -> None:
+        """Replay button and door transitions held since the last flush.
+
+        One readings history call covers every held serial and metric. Rows
+        between each previous and current reading are replayed in ``ts``
+        order, followed by the current reading. If the call fails, only the
+        change between the two polls is published, as without backfill.
+        """
+        pending, self._pending_backfill = self._pending_backfill, {}
+        if not pending or self._fetch_history is None:
+            return
+
+        serials = sorted({serial for serial, _metric in pending})
+        metrics = sorted({metric for _serial, metric in pending})
+        _id, earliest, _current, _window = min(
+            pending.values(), key=lambda entry: entry[3][0]
+        )
+        rows: list[dict[str, Any]] = []
+        try:
+            rows = await self._fetch_history(serials, metrics, earliest[1])
+        except Exception as err:  # noqa: BLE001 - fall back to the latest change
+            _LOGGER.debug("Readings history backfill failed: %s", err)
+
+        history: dict[tuple[str, str], list[tuple[float, dict[str, Any]]]] = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            key = (row.get("serial"), row.get("metric"))
+            reading_time = _reading_time(row.get("ts"))
+            if key in pending and reading_time is not None:
+                history.setdefault(key, []).append((reading_time, row))
+
+        for key, (device_id, previous, current, (start, end)) in pending.items():
+            serial, metric = key
+            between = sorted(
+                (item for item in history.get(key, ()) if start < item[0] < end),
+                key=lambda item: item[0],
+            )
+            transitions = [
+                (_event_state(row, metric), row.get("ts")) for _time, row in between
+            ]
+            transitions.append(current)
+
+            value = previous[0]
+            for new_value, timestamp in transitions[-EVENT_BACKFILL_MAX_TRANSITIONS:]:
+                if new_value is None:
+                    continue
+                if new_value != value or (
+                    metric in _TIMESTAMP_TRIGGERED_METRICS and new_value
+                ):
+                    await self._async_emit_change(
+                        device_id,
+                        serial,
+                        metric,
+                        new_value,
+                        value,
+                        timestamp,
+                        replayed=True,
+                    )
+                value = new_value
+            self.backfilled_readings += len(between)
+
+    async def _async_emit_change(
+        self,
+        device_id: str,
+        device_serial: str,
+        metric: str,
+        value: Any,
+        previous_value: Any,
+        timestamp: str | None,
+        *,
+        replayed: bool = False,
+    ) -> None:
+        """Emit the event for one state change."""
+        event_type = self._determine_event_type(metric, value)
+        event_data: dict[str, Any] = {
+            EVENT_DEVICE_ID: device_id,
+            EVENT_DEVICE_SERIAL: device_serial,
+            EVENT_SENSOR_TYPE: metric,
+            EVENT_VALUE: value,
+            EVENT_PREVIOUS_VALUE: previous_value,
+            EVENT_TIMESTAMP: timestamp or datetime.now().isoformat(),
+        }
+
+        await self._async_emit(event_type, event_data, replayed)
+
+        # Log important state changes
+        if metric == MT_SENSOR_BUTTON and event_type == "button_pressed":
+            _LOGGER.info("Button pressed on device %s", device_serial)
+        elif metric == MT_SENSOR_WATER and event_type == "water_detected":
+            _LOGGER.info("Water detected on device %s", device_serial)
 
     async def _get_device_id(
         self, device_serial: str, device_info: MerakiDeviceData
@@ -281,38 +613,95 @@ class MerakiEventService(EventPublisher):
         Returns:
             Device ID or None if not found
         """
-        device_registry = dr.async_get(self.hass)
-        domain = str(device_info.get("domain", "meraki_dashboard"))
-
-        # Try the exact identifier format first
-        device_entry = device_registry.async_get_device(
-            identifiers={(domain, device_serial)}
+        device_ids = self._async_device_index()
+        device_id = device_ids.get(device_serial)
+        if device_id is not None:
+            return device_id
+
+        if device_serial not in self._unregistered_serials:
+            # The registry indexes exact identifiers itself
+            domain = str(device_info.get("domain", DOMAIN))
+            device_entry = dr.async_get(self.hass).async_get_device(
+                identifiers={(domain, device_serial)}
+            )
+            if device_entry:
+                self._async_index_device(device_ids, device_entry.id, [device_serial])
+                return device_entry.id
+            self._unregistered_serials.add(device_serial)
+
+        # Only log once per device to reduce spam
+        if device_serial not in self._logged_missing_devices:
+            self._logged_missing_devices.add(device_serial)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Device %s not found in registry, skipping event processing",
+                    device_serial,
+                )
+        return None
+
+    @callback
+    def _async_device_index(self) -> dict[str, str]:
+        """Return the serial index, seeding it from the registry on first use."""
+        if self._device_ids is not None:
+            return self._device_ids
+
+        device_ids: dict[str, str] = {}
+        for device in dr.async_get(self.hass).devices.values():
+            self._async_index_device(
+                device_ids, device.id, _identifier_serials(device.identifiers)
+            )
+        self._device_ids = device_ids
+        self._device_registry_unsub = self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_handle_device_registry_updated,
         )
+        return device_ids
 
-        # If not found, search for device with matching identifier pattern
-        if not device_entry:
-            for device in device_registry.devices.values():
-                for identifier in device.identifiers:
-                    if identifier[0] == domain and identifier[1].endswith(
-                        f"_{device_serial}"
-                    ):
-                        device_entry = device
-                        break
-                if device_entry:
-                    break
-
-        if not device_entry:
-            # Only log once per device to reduce spam
-            if device_serial not in self._logged_missing_devices:
-                self._logged_missing_devices.add(device_serial)
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(
-                        "Device %s not found in registry, skipping event processing",
-                        device_serial,
-                    )
-            return None
+    @callback
+    def _async_index_device(
+        self, device_ids: dict[str, str], device_id: str, serials: Iterable[str]
+    ) -> None:
+        """Map ``serials`` to a device ID."""
+        for serial in serials:
+            device_ids[serial] = device_id
+            self._device_serials.setdefault(device_id, set()).add(serial)
+
+    @callback
+    def _async_handle_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Keep the serial index in step with device registry changes."""
+        device_ids = self._device_ids
+        if device_ids is None:
+            return
+
+        device_id = event.data["device_id"]
+        for serial in self._device_serials.pop(device_id, ()):
+            if device_ids.get(serial) == device_id:
+                del device_ids[serial]
+        if event.data["action"] == "remove":
+            return
 
-        return device_entry.id
+        device = dr.async_get(self.hass).async_get(device_id)
+        if device is not None:
+            self._async_index_device(
+                device_ids, device_id, _identifier_serials(device.identifiers)
+            )
+        # A new or changed device may be one a miss was cached for
+        self._unregistered_serials.clear()
+
+    async def async_stop(self) -> None:
+        """Stop the event queue and listening for device registry changes."""
+        if self._device_registry_unsub is not None:
+            self._device_registry_unsub()
+            self._device_registry_unsub = None
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+            self._backfill_task = None
+        self._event_queue = None
 
     def _determine_event_type(self, sensor_type: str, value: Any) -> str:
         """Determine the event type based on sensor type and value.
@@ -339,10 +728,79 @@ class MerakiEventService(EventPublisher):
         Args:
             device_serial: Device serial number to clear
         """
-        keys_to_remove = [
-            key for key in self._previous_states if key.startswith(f"{device_serial}_")
-        ]
-        for key in keys_to_remove:
-            del self._previous_states[key]
+        for metric in _EVENT_METRICS:
+            self._previous_states.pop((device_serial, metric), None)
+            self._pending_backfill.pop((device_serial, metric), None)
+        self._snapshot_readings.pop(device_serial, None)
 
         self._logged_missing_devices.discard(device_serial)
+        self._unregistered_serials.discard(device_serial)
+
+
+def _reading_time(timestamp: Any) -> float | None:
+    """Return a reading ``ts`` as epoch seconds, or None if unparseable."""
+    if not isinstance(timestamp, str):
+        return None
+    parsed = dt_util.parse_datetime(timestamp)
+    return parsed.timestamp() if parsed is not None else None
+
+
+def _backfill_window(
+    previous_ts: str | None, current_ts: str | None, fetch_interval: float
+) -> tuple[float, float] | None:
+    """Return the reading times to backfill between, or None to skip it.
+
+    A ``ts`` that moved by no more than one fetch interval is the sensor's
+    next report (or a heartbeat), so there is nothing in between to replay.
+    """
+    start = _reading_time(previous_ts)
+    end = _reading_time(current_ts)
+    if start is None or end is None:
+        return None
+    if not fetch_interval < end - start <= EVENT_BACKFILL_MAX_GAP_SECONDS:
+        return None
+    return start, end
+
+
+def _route_keys(event_type: str, event_filter: EventFilter | None) -> list[_RouteKey]:
+    """Return the routing keys a subscription is indexed under.
+
+    Serial filters are the most selective, so a filter on both serial and
+    sensor type is routed by serial only; ``matches`` still checks the rest.
+    """
+    if event_filter is not None and event_filter.device_serials:
+        return [
+            (event_type, EVENT_DEVICE_SERIAL, serial)
+            for serial in event_filter.device_serials
+        ]
+    if event_filter is not None and event_filter.sensor_types:
+        return [
+            (event_type, EVENT_SENSOR_TYPE, sensor_type)
+            for sensor_type in event_filter.sensor_types
+        ]
+    return [(event_type, None, None)]
+
+
+def _discard(buckets: dict[Any, dict[int, Any]], key: Any, token: int) -> None:
+    """Remove a subscription token from a bucket, dropping the bucket if empty."""
+    bucket = buckets.get(key)
+    if bucket is None or bucket.pop(token, None) is None:
+        return
+    if not bucket:
+        del buckets[key]
+
+
+def _identifier_serials(identifiers: Iterable[tuple[str, str]]) -> list[str]:
+    """Return the serials a device's integration identifiers refer to.
+
+    Device identifiers are the bare serial or ``{entry_id}_{serial}``.
+    """
+    serials: list[str] = []
+    for domain, identifier in identifiers:
+        if domain != DOMAIN:
+            continue
+        serials.append(identifier)
+        _prefix, sep, serial = identifier.rpartition("_")
+        if sep and serial:
+            serials.append(serial)
+    return serials
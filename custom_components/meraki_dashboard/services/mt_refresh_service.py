@@ -2,43 +2,77 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
 from collections import defaultdict
-from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from ..const import MT_REFRESH_COMMAND_INTERVAL
-from ..types import MerakiDeviceData
+from ..const import API_PRIORITY_MT_REFRESH, MT_REFRESH_COMMAND_INTERVAL
+from ..exceptions import MerakiApiError
+from ..types import MerakiDeviceData, MTDeviceData
 
 if TYPE_CHECKING:
     from ..hubs.network import MerakiNetworkHub
+    from ..hubs.organization import MerakiOrganizationHub
 
 _LOGGER = logging.getLogger(__name__)
 
 # Number of consecutive failures before logging a warning
 CONSECUTIVE_FAILURE_THRESHOLD = 3
 
+# Most refresh cycles a sensor sits out after repeated failed batches; the
+# wait doubles per consecutive failure up to this
+MT_REFRESH_MAX_BACKOFF_CYCLES = 8
 
-class MTRefreshService:
-    """Service to manage MT15/MT40 device refresh commands using Action Batches.
+# Models that accept the refreshData sensor command
+MT_REFRESH_MODELS = ("MT15", "MT40")
+
+# Delay before the first org-wide refresh after a network registers, so hubs
+# set up together share one batch
+MT_REFRESH_COALESCE_SECONDS = 5
+
+# Timeout for one action batch POST
+ACTION_BATCH_TIMEOUT_SECONDS = 30
+
+# Most actions Meraki accepts in one asynchronous action batch (synchronous
+# batches are capped at 20)
+ACTION_BATCH_MAX_ACTIONS = 100
+
+# Most asynchronous action batches Meraki runs at once per organization;
+# sensors beyond what this many batches hold wait for a later cycle
+ACTION_BATCH_MAX_CONCURRENT = 5
 
-    This service sends batched refresh commands to MT15 and MT40 devices to ensure
-    they update their readings more frequently than the default Meraki update interval.
+# (status or None if no response, response body or error, devices it covered)
+ActionBatchResponse = tuple[int | None, str, list[MerakiDeviceData]]
 
-    Uses Meraki's Action Batches API to send refresh commands efficiently in a single
-    API call, minimizing API usage while maintaining fast sensor updates.
+
+class MTRefreshService:
+    """Refresh MT15/MT40 sensors on one network through the org-wide scheduler.
+
+    These models accept a ``refreshData`` command that makes them report
+    sooner than Meraki's default update interval. Commands are sent by the
+    organization's ``MTRefreshScheduler``, which batches every network's
+    sensors into as few Action Batches as fit. This service registers its
+    network with the scheduler, plans which of the network's sensors to
+    refresh each cycle and keeps the network's own success rate and failure
+    streaks.
     """
 
     def __init__(
         self,
         hass: HomeAssistant,
         network_hub: MerakiNetworkHub,
+        scheduler: MTRefreshScheduler,
         interval: int = MT_REFRESH_COMMAND_INTERVAL,
     ) -> None:
         """Initialize the MT refresh service.
@@ -46,17 +80,25 @@ class MTRefreshService:
         Args:
             hass: Home Assistant instance
             network_hub: Network hub managing the MT devices
+            scheduler: Org-wide scheduler sending the refresh commands
             interval: Refresh interval in seconds (default: MT_REFRESH_COMMAND_INTERVAL)
         """
         self.hass = hass
         self.network_hub = network_hub
         self.dashboard = network_hub.dashboard
+        self._scheduler = scheduler
 
         # Refresh interval configuration
         self._refresh_interval = interval
 
-        # Track consecutive failures per device serial (for logging only)
+        # Track consecutive failures per device serial, and the refresh cycle
+        # each failing serial backs off until
         self._failure_counts: dict[str, int] = defaultdict(int)
+        self._refresh_cycles = 0
+        self._backoff_until: dict[str, int] = {}
+
+        # Sensors left out of refresh cycles, by reason
+        self._skipped_refreshes: dict[str, int] = defaultdict(int)
 
         # Throttle the benign "no suitable gateway" 400 (a sensor momentarily out
         # of BLE range of any online gateway): per-cycle logs go to debug, with a
@@ -64,8 +106,8 @@ class MTRefreshService:
         self._consecutive_gateway_failures = 0
         self._gateway_warning_logged = False
 
-        # Timer for refresh commands
-        self._refresh_timer: Callable[[], None] | None = None
+        # Removes this network from the scheduler
+        self._unregister: Callable[[], None] | None = None
 
         # Track if service is running
         self._running = False
@@ -82,7 +124,7 @@ class MTRefreshService:
         )
 
     async def async_start(self, interval: int | None = None) -> None:
-        """Start the refresh service.
+        """Start refreshing this network's sensors.
 
         Args:
             interval: Optional refresh interval in seconds. If provided, updates the service interval.
@@ -100,23 +142,14 @@ class MTRefreshService:
             )
 
         self._running = True
-
-        # Schedule the refresh timer to run at the configured interval
-        self._refresh_timer = async_track_time_interval(
-            self.hass,
-            self._async_refresh_devices,
-            timedelta(seconds=self._refresh_interval),
-        )
-
+        self._unregister = self._scheduler.async_register(self, self._refresh_interval)
         _LOGGER.debug(
-            "MT Refresh Service started for network %s with %d second interval",
+            "MT Refresh Service registered network %s with the org-wide "
+            "scheduler (%d second interval)",
             self.network_hub.network_name,
             self._refresh_interval,
         )
 
-        # Run initial refresh immediately
-        await self._async_refresh_devices(datetime.now(UTC))
-
     async def async_stop(self) -> None:
         """Stop the refresh service."""
         if not self._running:
@@ -124,9 +157,9 @@ class MTRefreshService:
 
         self._running = False
 
-        if self._refresh_timer:
-            self._refresh_timer()
-            self._refresh_timer = None
+        if self._unregister:
+            self._unregister()
+            self._unregister = None
 
         _LOGGER.debug(
             "MT Refresh Service stopped for network %s (batches: %d attempts, %d successful, %d failed)",
@@ -136,148 +169,114 @@ class MTRefreshService:
             self._batch_failures,
         )
 
-    async def _async_refresh_devices(self, _now: datetime | None = None) -> None:
-        """Refresh MT15 and MT40 devices using Action Batches.
-
-        This method is called at the configured interval and sends a batched refresh
-        command to all MT15 and MT40 devices in the network.
-        """
-        if not self._running:
-            return
-
-        if self.dashboard is None:
-            _LOGGER.error("Dashboard API not initialized for MT refresh service")
-            return
-
-        # Get MT15 and MT40 devices
-        mt_devices = self._get_mt15_mt40_devices()
-
-        if not mt_devices:
-            _LOGGER.debug("No MT15 or MT40 devices to refresh")
-            return
-
-        _LOGGER.debug(
-            "Refreshing %d MT15/MT40 devices: %s",
-            len(mt_devices),
-            [d["serial"] for d in mt_devices],
-        )
-
-        # Send action batch
-        await self._send_action_batch(mt_devices)
-
     def _get_mt15_mt40_devices(self) -> list[MerakiDeviceData]:
         """Get all MT15 and MT40 devices from the network hub.
 
         Returns:
             List of MT15 and MT40 device dictionaries
         """
-        mt_devices: list[MerakiDeviceData] = []
+        return self.network_hub.get_devices_by_model(*MT_REFRESH_MODELS)
 
-        for device in self.network_hub.devices:
-            model = device.get("model", "").upper()
-            # Check if device is MT15 or MT40
-            if model in ("MT15", "MT40"):
-                mt_devices.append(device)
+    def plan_refresh_targets(self) -> list[MerakiDeviceData]:
+        """Return the MT15 and MT40 devices to send a refresh command this cycle.
 
-        return mt_devices
+        A sensor is left out when the command would be redundant or rejected:
 
-    async def _send_action_batch(self, mt_devices: list[MerakiDeviceData]) -> None:
-        """Send action batch to refresh MT devices.
+        * its readings entities are all disabled, so nobody reads the result;
+        * it is backing off after failed batches;
+        * it has no gateway in range (RSSI None), which Meraki rejects with
+          the "no suitable gateway" 400 for the whole batch;
+        * its latest reading is already recent, less than half an interval
+          old. Rounding to the nearest cycle keeps a reading that answered
+          the previous cycle's refresh from skipping this one.
 
-        Args:
-            mt_devices: List of MT15/MT40 devices to refresh
+        Only a gateway connectivity row reporting no RSSI excludes a sensor;
+        one without a row yet is still refreshed, as are sensors without a
+        reading in the last snapshot.
         """
-        if not mt_devices:
-            return
-
-        self._batch_attempts += 1
-
-        try:
-            # Get organization hub for API key and org ID
-            org_hub = self.network_hub.organization_hub
-            api_key = org_hub._api_key  # noqa: SLF001
-            org_id = org_hub.organization_id
-            base_url = org_hub.base_url
-
-            # Build action batch payload
-            actions = []
-            for device in mt_devices:
-                serial = device.get("serial")
-                if not serial:
-                    continue
-
-                actions.append(
-                    {
-                        "resource": f"/devices/{serial}/sensor/commands",
-                        "operation": "create",
-                        "body": {"operation": "refreshData"},
-                    }
-                )
-
-            if not actions:
-                _LOGGER.warning("No valid devices to batch refresh")
-                return
-
-            payload = {"confirmed": True, "synchronous": False, "actions": actions}
-
-            # Make the API call
-            url = f"{base_url}/organizations/{org_id}/actionBatches"
-            headers = {
-                "X-Cisco-Meraki-API-Key": api_key,
-                "Content-Type": "application/json",
-            }
+        self._refresh_cycles += 1
+        hub = self.network_hub
+        sensor_data = hub.sensor_data
+        gateways = hub.gateway_connections
+        unwatched = hub.organization_hub.unwatched_serials
+        now = dt_util.utcnow().timestamp()
+
+        targets: list[MerakiDeviceData] = []
+        skipped: dict[str, int] = defaultdict(int)
+        for device in self._get_mt15_mt40_devices():
+            serial = device.get("serial")
+            if not serial:
+                continue
+            if serial in unwatched:
+                skipped["unwatched"] += 1
+            elif self._backoff_until.get(serial, 0) > self._refresh_cycles:
+                skipped["backoff"] += 1
+            elif (row := gateways.get(serial)) is not None and row.get("rssi") is None:
+                skipped["no_gateway"] += 1
+            elif (
+                _latest_reading_age(sensor_data.get(serial), now)
+                < self._refresh_interval / 2
+            ):
+                skipped["fresh"] += 1
+            else:
+                targets.append(device)
 
+        if skipped:
+            for reason, count in skipped.items():
+                self._skipped_refreshes[reason] += count
             _LOGGER.debug(
-                "Sending action batch with %d sensor refresh commands", len(actions)
+                "MT refresh on network %s skipping %s",
+                hub.network_name,
+                ", ".join(f"{count} {reason}" for reason, count in skipped.items()),
             )
+        return targets
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    response_text = await response.text()
-                    self._handle_batch_response(
-                        response.status, response_text, mt_devices
-                    )
-
-        except TimeoutError:
-            self._record_batch_failure(mt_devices)
-            _LOGGER.error(
-                "Action batch timed out after 30 seconds. Will retry in %d seconds.",
-                self._refresh_interval,
-            )
-        except Exception as err:
-            self._record_batch_failure(mt_devices)
-            _LOGGER.error(
-                "Action batch failed with exception: %s. Will retry in %d seconds.",
-                err,
-                self._refresh_interval,
-                exc_info=True,
-            )
+    def record_refresh_cycle(self, responses: list[ActionBatchResponse]) -> None:
+        """Record the action-batch responses for this network's planned sensors."""
+        self._batch_attempts += 1
+        self._handle_batch_responses(responses)
 
-    def _record_batch_failure(self, mt_devices: list[MerakiDeviceData]) -> None:
-        """Bump failure counters for a failed batch (no logging)."""
-        self._batch_failures += 1
-        for device in mt_devices:
-            serial = device.get("serial")
-            if serial:
-                self._failure_counts[serial] += 1
+    def _handle_batch_responses(self, responses: list[ActionBatchResponse]) -> None:
+        """Update counters and log one refresh cycle's action-batch responses.
 
-    def _handle_batch_response(
-        self, status: int, response_text: str, mt_devices: list[MerakiDeviceData]
-    ) -> None:
-        """Update counters and log an action-batch response.
+        A cycle may span several batches; it counts as one success only if
+        every batch was accepted, while per-serial failure counts and backoff
+        follow the batch each serial was sent in, except for "no suitable
+        gateway" rejections. A status of None means the batch got no
+        response (timeout or connection error).
 
         The 400 "a suitable gateway was not available" response is a benign,
         self-healing condition: the target MT15/MT40 is momentarily out of BLE
         range of any online gateway. Readings still arrive via the org-wide poll,
         so only the fast-refresh boost is affected. Log those per-cycle at debug
         (with one throttled warning per streak) instead of ERROR every interval.
+        Genuine failures are logged once per cycle by the scheduler.
         """
-        if status == 201:
+        failed: list[tuple[int | None, str]] = []
+        for status, response_text, mt_devices in responses:
+            if status != 201:
+                failed.append((status, response_text))
+                # Meraki rejects the whole batch when any one sensor has no
+                # gateway, without naming it; backing off every sensor in the
+                # batch would punish the reachable ones, and the planner
+                # leaves out sensors whose gateway row reports no RSSI.
+                if _is_gateway_unavailable(status, response_text):
+                    continue
+            for device in mt_devices:
+                serial = device.get("serial")
+                if not serial:
+                    continue
+                if status != 201:
+                    self._failure_counts[serial] += 1
+                    self._backoff_until[serial] = self._refresh_cycles + min(
+                        2 ** (self._failure_counts[serial] - 1),
+                        MT_REFRESH_MAX_BACKOFF_CYCLES,
+                    )
+                elif serial in self._failure_counts:
+                    self._failure_counts[serial] = 0
+                    self._backoff_until.pop(serial, None)
+
+        if not failed:
             self._batch_successes += 1
             if self._gateway_warning_logged:
                 _LOGGER.info(
@@ -288,25 +287,27 @@ class MTRefreshService:
                 )
             self._consecutive_gateway_failures = 0
             self._gateway_warning_logged = False
-            for device in mt_devices:
-                serial = device.get("serial")
-                if serial and serial in self._failure_counts:
-                    self._failure_counts[serial] = 0
 
-            batch_id = "unknown"
-            try:
-                batch_id = json.loads(response_text).get("id", "unknown")
-            except (json.JSONDecodeError, AttributeError):
-                pass
+            batch_ids = []
+            for _status, response_text, _devices in responses:
+                try:
+                    batch_ids.append(json.loads(response_text).get("id", "unknown"))
+                except json.JSONDecodeError, AttributeError:
+                    batch_ids.append("unknown")
             _LOGGER.debug(
                 "Action batch successful: sensor refresh commands queued (batchId=%s)",
-                batch_id,
+                ", ".join(map(str, batch_ids)),
             )
             return
 
-        self._record_batch_failure(mt_devices)
+        self._batch_failures += 1
+        genuine = [
+            (status, response_text)
+            for status, response_text in failed
+            if not _is_gateway_unavailable(status, response_text)
+        ]
 
-        if status == 400 and "suitable gateway" in response_text.lower():
+        if not genuine:
             self._consecutive_gateway_failures += 1
             _LOGGER.debug(
                 "MT refresh: no available gateway for one or more sensors on "
@@ -334,12 +335,6 @@ class MTRefreshService:
         # Genuine failure (bad key, malformed request, server error, ...) — a
         # non-gateway streak should not suppress a later gateway warning.
         self._consecutive_gateway_failures = 0
-        _LOGGER.error(
-            "Action batch failed with status %d: %s. Will retry in %d seconds.",
-            status,
-            response_text[:500],
-            self._refresh_interval,
-        )
 
     @property
     def success_rate(self) -> float:
@@ -361,3 +356,313 @@ class MTRefreshService:
             True if service is running, False otherwise
         """
         return self._running
+
+
+class MTRefreshScheduler:
+    """Org-wide refresh scheduler for every network's MT15/MT40 sensors.
+
+    Every network hub's refresh service registers here. Each tick collects
+    the sensors each registered service plans to refresh and sends them in as
+    few action batches as fit, so an org with many networks sends one batch
+    per interval instead of one per network. The outcome is recorded on each
+    service for its own sensors, keeping per-network success rates and
+    failure streaks attributed to the right network.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, organization_hub: MerakiOrganizationHub
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            hass: Home Assistant instance
+            organization_hub: Organization hub the action batches are sent for
+        """
+        self.hass = hass
+        self.organization_hub = organization_hub
+
+        # Registered services and their configured intervals; the shortest
+        # interval drives the shared timer.
+        self._services: dict[MTRefreshService, int] = {}
+        self._interval: int | None = None
+        self._refresh_timer: Callable[[], None] | None = None
+        self._pending_refresh: Callable[[], None] | None = None
+
+        # Where the next cycle starts in the planned sensors when they don't
+        # all fit in ACTION_BATCH_MAX_CONCURRENT batches
+        self._rotation = 0
+
+        self.batch_attempts = 0
+        self.batch_failures = 0
+
+    @callback
+    def async_register(
+        self, service: MTRefreshService, interval: int
+    ) -> Callable[[], None]:
+        """Refresh a network's sensors as part of the org-wide batch.
+
+        A refresh runs shortly after registering; services registering within
+        ``MT_REFRESH_COALESCE_SECONDS`` of each other share it.
+
+        Returns:
+            Callback removing the service again
+        """
+        self._services[service] = interval
+        self._async_reschedule()
+        if self._pending_refresh is not None:
+            self._pending_refresh()
+        self._pending_refresh = async_call_later(
+            self.hass, MT_REFRESH_COALESCE_SECONDS, self._async_pending_refresh
+        )
+
+        @callback
+        def unregister() -> None:
+            """Remove the service."""
+            if self._services.pop(service, None) is not None:
+                self._async_reschedule()
+
+        return unregister
+
+    @callback
+    def _async_reschedule(self) -> None:
+        """Run the shared timer at the shortest registered interval."""
+        interval = min(self._services.values(), default=None)
+        if interval == self._interval:
+            return
+        self._interval = interval
+        if self._refresh_timer is not None:
+            self._refresh_timer()
+            self._refresh_timer = None
+        if interval is None:
+            if self._pending_refresh is not None:
+                self._pending_refresh()
+                self._pending_refresh = None
+            return
+        self._refresh_timer = async_track_time_interval(
+            self.hass, self.async_refresh, timedelta(seconds=interval)
+        )
+
+    async def _async_pending_refresh(self, _now: datetime) -> None:
+        """Run the refresh scheduled after the latest registration."""
+        self._pending_refresh = None
+        await self.async_refresh()
+
+    async def async_refresh(self, _now: datetime | None = None) -> None:
+        """Refresh every registered network's sensors in as few batches as fit.
+
+        At most ``ACTION_BATCH_MAX_CONCURRENT`` batches are sent per cycle.
+        When the planned sensors need more, the cycle starts where the last
+        one stopped, so every sensor is refreshed in turn.
+        """
+        planned: list[tuple[MTRefreshService, MerakiDeviceData]] = []
+        for service in self._services:
+            if not service.is_running or service.dashboard is None:
+                continue
+            planned.extend(
+                (service, device)
+                for device in service.plan_refresh_targets()
+                if device.get("serial")
+            )
+        if not planned:
+            return
+
+        capacity = ACTION_BATCH_MAX_CONCURRENT * ACTION_BATCH_MAX_ACTIONS
+        if len(planned) > capacity:
+            start = self._rotation % len(planned)
+            planned = (planned[start:] + planned[:start])[:capacity]
+            self._rotation = start + capacity
+            _LOGGER.debug(
+                "MT refresh planned more sensors than %d action batches hold; "
+                "the rest are refreshed in later cycles",
+                ACTION_BATCH_MAX_CONCURRENT,
+            )
+
+        groups: dict[MTRefreshService, list[MerakiDeviceData]] = {}
+        for service, device in planned:
+            groups.setdefault(service, []).append(device)
+
+        chunks = _chunk_devices([device for _service, device in planned])
+        _LOGGER.debug(
+            "Sending org-wide sensor refresh for %d network(s) in %d action batch(es)",
+            len(groups),
+            len(chunks),
+        )
+        responses = await _async_submit_action_batches(
+            self.organization_hub, chunks, self._send_action_batch
+        )
+
+        # Attribute each batch's outcome to the networks whose sensors it held
+        outcomes: dict[str, tuple[int | None, str]] = {}
+        for status, response_text, chunk in responses:
+            for device in chunk:
+                outcomes[device["serial"]] = (status, response_text)
+        for service, devices in groups.items():
+            by_outcome: dict[tuple[int | None, str], list[MerakiDeviceData]] = {}
+            for device in devices:
+                by_outcome.setdefault(outcomes[device["serial"]], []).append(device)
+            service.record_refresh_cycle(
+                [
+                    (status, response_text, outcome_devices)
+                    for (status, response_text), outcome_devices in by_outcome.items()
+                ]
+            )
+
+        failed = [
+            (status, response_text)
+            for status, response_text, _chunk in responses
+            if status != 201
+        ]
+        self.batch_attempts += len(responses)
+        self.batch_failures += len(failed)
+        genuine = [
+            failure for failure in failed if not _is_gateway_unavailable(*failure)
+        ]
+        if genuine:
+            _log_batch_failure(*genuine[0], retry_in=self._interval)
+
+    async def _send_action_batch(self, actions: list[dict[str, Any]]) -> str:
+        """POST one action batch and return the response body."""
+        return await _async_post_action_batch(self.hass, self.organization_hub, actions)
+
+
+def _latest_reading_age(data: MTDeviceData | None, now: float) -> float:
+    """Return the age in seconds of a sensor's latest reading, inf if none."""
+    if not data:
+        return math.inf
+    latest: float | None = None
+    for reading in data.get("readings") or ():
+        timestamp = reading.get("ts")
+        if not isinstance(timestamp, str):
+            continue
+        parsed = dt_util.parse_datetime(timestamp)
+        if parsed is not None and (latest is None or parsed.timestamp() > latest):
+            latest = parsed.timestamp()
+    return math.inf if latest is None else now - latest
+
+
+def _refresh_actions(mt_devices: list[MerakiDeviceData]) -> list[dict[str, Any]]:
+    """Return a refreshData action for each device with a serial."""
+    return [
+        {
+            "resource": f"/devices/{serial}/sensor/commands",
+            "operation": "create",
+            "body": {"operation": "refreshData"},
+        }
+        for device in mt_devices
+        if (serial := device.get("serial"))
+    ]
+
+
+def _chunk_devices(
+    mt_devices: list[MerakiDeviceData],
+) -> list[list[MerakiDeviceData]]:
+    """Split devices with a serial into chunks that fit one action batch."""
+    devices = [device for device in mt_devices if device.get("serial")]
+    return [
+        devices[start : start + ACTION_BATCH_MAX_ACTIONS]
+        for start in range(0, len(devices), ACTION_BATCH_MAX_ACTIONS)
+    ]
+
+
+async def _async_submit_action_batches(
+    org_hub: MerakiOrganizationHub,
+    chunks: list[list[MerakiDeviceData]],
+    post: Callable[[list[dict[str, Any]]], Awaitable[str]],
+) -> list[ActionBatchResponse]:
+    """Submit one action batch per chunk through the org hub's API call path.
+
+    The chunks (at most ``ACTION_BATCH_MAX_CONCURRENT``) are queued on the
+    shared rate limiter at once, so they are sent as fast as its workers and
+    call budget allow, and each POST counts towards the org hub's API call
+    metrics. A rejected batch is reported with
+    its status and body; one that got no response with a status of None and
+    the error as its body.
+    """
+    results = await asyncio.gather(
+        *(
+            org_hub.async_api_call(
+                post, _refresh_actions(chunk), priority=API_PRIORITY_MT_REFRESH
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+    responses: list[ActionBatchResponse] = []
+    for result, chunk in zip(results, chunks, strict=True):
+        if isinstance(result, MerakiApiError) and result.status_code is not None:
+            response_text = result.context.get("response_text", result.message)
+            responses.append((result.status_code, response_text, chunk))
+        elif isinstance(result, BaseException):
+            reason = (
+                f"timed out after {ACTION_BATCH_TIMEOUT_SECONDS} seconds"
+                if isinstance(result, TimeoutError)
+                else repr(result)
+            )
+            responses.append((None, reason, chunk))
+        else:
+            responses.append((201, result, chunk))
+    return responses
+
+
+def _is_gateway_unavailable(status: int | None, response_text: str) -> bool:
+    """Return True for the benign "no suitable gateway" rejection."""
+    return status == 400 and "suitable gateway" in response_text.lower()
+
+
+def _log_batch_failure(
+    status: int | None, response_text: str, retry_in: int | None
+) -> None:
+    """Log a genuine action batch failure."""
+    if status is None:
+        _LOGGER.error(
+            "Action batch failed: %s. Will retry in %s seconds.",
+            response_text,
+            retry_in,
+        )
+        return
+    _LOGGER.error(
+        "Action batch failed with status %d: %s. Will retry in %s seconds.",
+        status,
+        response_text[:500],
+        retry_in,
+    )
+
+
+async def _async_post_action_batch(
+    hass: HomeAssistant, org_hub: MerakiOrganizationHub, actions: list[dict[str, Any]]
+) -> str:
+    """POST an asynchronous action batch and return the response body.
+
+    Uses Home Assistant's shared client session, so connections are pooled
+    across batches.
+
+    Raises:
+        MerakiApiError: The batch was not accepted (status other than 201);
+            a 429 carries its Retry-After so the org hub's retry honours it
+    """
+    url = f"{org_hub.base_url}/organizations/{org_hub.organization_id}/actionBatches"
+    headers = {
+        "X-Cisco-Meraki-API-Key": org_hub._api_key,  # noqa: SLF001
+        "Content-Type": "application/json",
+    }
+    payload = {"confirmed": True, "synchronous": False, "actions": actions}
+
+    session = async_get_clientsession(hass)
+    async with session.post(
+        url,
+        headers=headers,
+        json=payload,
+        timeout=aiohttp.ClientTimeout(total=ACTION_BATCH_TIMEOUT_SECONDS),
+    ) as response:
+        response_text = await response.text()
+        status = response.status
+        retry_after = response.headers.get("Retry-After")
+    if status != 201:
+        raise MerakiApiError(
+            f"Action batch rejected with status {status}",
+            status_code=status,
+            request_url=url,
+            response_text=response_text,
+            retry_after=retry_after,
+        )
+    return response_text
@@ -13,6 +13,7 @@ from .cache import (
 # Import from device_info module
 from .device_info import (
     DeviceInfoBuilder,
+    build_capability_index,
     create_device_capability_filter,
     create_device_info,
     create_network_hub_device_info,
@@ -66,6 +67,7 @@ __all__ = [
     "get_cached_api_response",
     # Device info functions
     "DeviceInfoBuilder",
+    "build_capability_index",
     "create_device_capability_filter",
     "create_device_info",
     "create_network_hub_device_info",
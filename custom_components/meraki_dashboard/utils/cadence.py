@@ -0,0 +1,250 @@
+"""Reporting-cadence tracking for MT sensor polling."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+from statistics import fmean, pstdev
+from typing import Any
+
+# Fetch this long after a sample is expected, giving the Dashboard API time to
+# publish it.
+CADENCE_FETCH_MARGIN_SECONDS = 5.0
+
+# Phase samples needed before alignment is trusted, and how tightly they must
+# cluster (mean resultant length of the phases on the interval circle, 0-1).
+CADENCE_MIN_SAMPLES = 8
+CADENCE_MIN_CONCENTRATION = 0.6
+
+# Number of recent sample phases and lags kept
+CADENCE_HISTORY = 64
+
+# Adaptive interval: fetches remembered, and how many are needed before the
+# interval moves.
+ADAPTIVE_WINDOW = 10
+ADAPTIVE_MIN_FETCHES = 4
+
+# A hub is busy when at least this fraction of fetches brought new samples and
+# values move by at least ADAPTIVE_VOLATILE (mean coefficient of variation);
+# it is quiet when few fetches bring anything new or values barely move.
+ADAPTIVE_BUSY_ACTIVITY = 0.6
+ADAPTIVE_QUIET_ACTIVITY = 0.3
+ADAPTIVE_VOLATILE = 0.01
+ADAPTIVE_STABLE = 0.002
+
+# Multiplicative step applied per fetch when shrinking or stretching
+ADAPTIVE_SHRINK = 0.5
+ADAPTIVE_STRETCH = 1.5
+
+
+class CadenceTracker:
+    """Learn when an organization's sensors report and when to poll next.
+
+    Each newly seen reading timestamp is folded onto the polling interval
+    (``ts mod interval``). When those phases cluster, samples land at a
+    predictable point in each interval and the next fetch is scheduled just
+    after it instead of on a free-running timer. When they don't (sensors
+    spread across the interval, or too little history), the fixed interval is
+    used.
+
+    Sample-to-state lag (time from a reading's ``ts`` to the fetch that first
+    delivered it) is tracked separately for fixed and aligned scheduling so
+    the two can be compared in diagnostics.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        margin: float = CADENCE_FETCH_MARGIN_SECONDS,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            interval: Fixed polling interval in seconds (also the fallback)
+            margin: Seconds after the expected sample to schedule the fetch
+        """
+        self.interval = float(interval)
+        self.margin = margin
+        self._phases: deque[float] = deque(maxlen=CADENCE_HISTORY)
+        self._fixed_lags: deque[float] = deque(maxlen=CADENCE_HISTORY)
+        self._aligned_lags: deque[float] = deque(maxlen=CADENCE_HISTORY)
+        self._aligned = False
+
+    @property
+    def phase(self) -> float | None:
+        """Expected sample offset within the interval, or None without a pattern."""
+        if len(self._phases) < CADENCE_MIN_SAMPLES:
+            return None
+
+        scale = 2 * math.pi / self.interval
+        cos_sum = sum(math.cos(phase * scale) for phase in self._phases)
+        sin_sum = sum(math.sin(phase * scale) for phase in self._phases)
+        concentration = math.hypot(cos_sum, sin_sum) / len(self._phases)
+        if concentration < CADENCE_MIN_CONCENTRATION:
+            return None
+        return (math.atan2(sin_sum, cos_sum) / scale) % self.interval
+
+    @property
+    def aligned(self) -> bool:
+        """Return True if the last scheduled fetch was phase-aligned."""
+        return self._aligned
+
+    def observe(self, sample_times: Iterable[float], fetched_at: float) -> None:
+        """Record newly delivered samples.
+
+        Args:
+            sample_times: Epoch timestamps of readings not seen before
+            fetched_at: Epoch time of the fetch that delivered them
+        """
+        lags = self._aligned_lags if self._aligned else self._fixed_lags
+        for sample_time in sample_times:
+            self._phases.append(sample_time % self.interval)
+            lags.append(max(0.0, fetched_at - sample_time))
+
+    def next_delay(self, now: float) -> float:
+        """Seconds until the next fetch should run.
+
+        Args:
+            now: Current epoch time
+        """
+        phase = self.phase
+        self._aligned = phase is not None
+        if phase is None:
+            return self.interval
+
+        delay = (phase + self.margin - now) % self.interval
+        # A fetch that just missed the sample runs again shortly after it; one
+        # that just caught it waits a full interval.
+        return max(delay, 1.0)
+
+    def max_cache_age(self, now: float) -> float | None:
+        """Seconds since the latest expected sample, or None without a pattern.
+
+        Cached org-wide readings older than this predate the sample the
+        aligned fetch is meant to pick up.
+        """
+        phase = self.phase
+        if phase is None:
+            return None
+        return (now - phase) % self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a diagnostics summary."""
+        phase = self.phase
+        return {
+            "interval_seconds": self.interval,
+            "phase_seconds": round(phase, 1) if phase is not None else None,
+            "aligned": self._aligned,
+            "samples": len(self._phases),
+            "mean_lag_fixed_seconds": _mean(self._fixed_lags),
+            "mean_lag_aligned_seconds": _mean(self._aligned_lags),
+        }
+
+
+class AdaptiveIntervalController:
+    """Pick a hub's effective polling interval from its recent readings.
+
+    Every fetch records whether it brought new samples and the latest numeric
+    value per (serial, metric). Hubs whose fetches keep bringing changing
+    values shrink towards ``minimum``; hubs that rarely change stretch towards
+    ``maximum``. Anything in between holds the current interval.
+    """
+
+    def __init__(self, initial: float, minimum: float, maximum: float) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial: Starting interval in seconds (clamped to the bounds)
+            minimum: Shortest effective interval in seconds
+            maximum: Longest effective interval in seconds
+        """
+        self.minimum = float(minimum)
+        self.maximum = float(max(minimum, maximum))
+        self.interval = min(max(float(initial), self.minimum), self.maximum)
+        self._fetches: deque[bool] = deque(maxlen=ADAPTIVE_WINDOW)
+        self._values: dict[Hashable, deque[float]] = {}
+        self.skipped_ticks = 0
+
+    @property
+    def activity(self) -> float | None:
+        """Fraction of recent fetches that brought new samples."""
+        if not self._fetches:
+            return None
+        return sum(self._fetches) / len(self._fetches)
+
+    @property
+    def volatility(self) -> float | None:
+        """Mean coefficient of variation of recent values, or None if unknown."""
+        spreads = [
+            pstdev(values) / (abs(fmean(values)) or 1.0)
+            for values in self._values.values()
+            if len(values) > 1
+        ]
+        if not spreads:
+            return None
+        return fmean(spreads)
+
+    def should_fetch(self, elapsed: float, tick: float, snapshot_fresh: bool) -> bool:
+        """Return True if this tick should fetch readings.
+
+        Args:
+            elapsed: Seconds since this hub's last fetch
+            tick: Seconds between coordinator ticks
+            snapshot_fresh: The org-wide snapshot is cached, so fetching is free
+        """
+        # Round to the nearest tick so intervals that aren't a multiple of the
+        # tick don't add a whole extra tick of delay.
+        if snapshot_fresh or elapsed + tick / 2 >= self.interval:
+            return True
+        self.skipped_ticks += 1
+        return False
+
+    def record(self, new_samples: bool, values: Mapping[Hashable, float]) -> float:
+        """Record a fetch and return the updated interval.
+
+        Args:
+            new_samples: Whether the fetch brought any sample not seen before
+            values: Latest numeric value per (serial, metric) for new samples
+        """
+        self._fetches.append(new_samples)
+        for key, value in values.items():
+            history = self._values.get(key)
+            if history is None:
+                history = self._values[key] = deque(maxlen=ADAPTIVE_WINDOW)
+            history.append(value)
+
+        if len(self._fetches) < ADAPTIVE_MIN_FETCHES:
+            return self.interval
+
+        activity = self.activity or 0.0
+        volatility = self.volatility
+        if activity >= ADAPTIVE_BUSY_ACTIVITY and (
+            volatility is None or volatility >= ADAPTIVE_VOLATILE
+        ):
+            self.interval = max(self.minimum, self.interval * ADAPTIVE_SHRINK)
+        elif activity <= ADAPTIVE_QUIET_ACTIVITY or (
+            volatility is not None and volatility < ADAPTIVE_STABLE
+        ):
+            self.interval = min(self.maximum, self.interval * ADAPTIVE_STRETCH)
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a diagnostics summary."""
+        activity = self.activity
+        volatility = self.volatility
+        return {
+            "effective_interval_seconds": round(self.interval, 1),
+            "min_interval_seconds": self.minimum,
+            "max_interval_seconds": self.maximum,
+            "activity": round(activity, 2) if activity is not None else None,
+            "volatility": round(volatility, 4) if volatility is not None else None,
+            "skipped_ticks": self.skipped_ticks,
+        }
+
+
+def _mean(values: deque[float]) -> float | None:
+    """Return the rounded mean of ``values``, or None if empty."""
+    if not values:
+        return None
+    return round(sum(values) / len(values), 1)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from ..const import (
@@ -659,6 +659,80 @@ def should_create_entity(
     return metric_key in capabilities
 
 
+def build_capability_index(
+    devices: Iterable[Mapping[str, Any]],
+    coordinator_data: Mapping[str, Any] | None = None,
+) -> dict[str, frozenset[str] | None]:
+    """Build a serial -> supported metrics index for one coordinator snapshot.
+
+    Platform setup asks "does this device support this metric?" for every
+    device and every entity description. Building the answer once per snapshot
+    keeps that loop to set lookups instead of re-deriving the model table and
+    rescanning the device's readings on each call.
+
+    For MT devices the result matches ``should_create_entity``: metrics
+    discovered in the readings (``noise.*`` normalized to ``noise``)
+    intersected with the model table, or the model table alone when nothing
+    was discovered. Other device types use discovered metrics, falling back to
+    the model table; like ``should_create_entity``, one with neither and no
+    model is not filtered at all, indexed as None.
+
+    Args:
+        devices: Devices to index
+        coordinator_data: Coordinator data keyed by serial (optional)
+
+    Returns:
+        Dictionary mapping device serial to its supported metric keys, or None
+        when every metric is allowed
+    """
+    model_tables: dict[tuple[str, str], frozenset[str]] = {}
+    index: dict[str, frozenset[str] | None] = {}
+
+    for device in devices:
+        serial = device.get("serial")
+        if not serial:
+            continue
+
+        device_type = determine_device_type(device) or ""
+        table_key = (device.get("model", ""), device_type)
+        model_capabilities = model_tables.get(table_key)
+        if model_capabilities is None:
+            model_capabilities = frozenset(create_device_capability_filter(*table_key))
+            model_tables[table_key] = model_capabilities
+
+        discovered = _discover_metrics(
+            coordinator_data.get(serial) if coordinator_data else None
+        )
+        if not discovered:
+            # Be permissive for devices with no model information, to avoid
+            # missing entities
+            unknown = (
+                device_type != SENSOR_TYPE_MT
+                and not model_capabilities
+                and not device.get("model")
+            )
+            index[serial] = None if unknown else model_capabilities
+        elif device_type == SENSOR_TYPE_MT:
+            index[serial] = discovered & model_capabilities
+        else:
+            index[serial] = discovered
+
+    return index
+
+
+def _discover_metrics(device_data: Any) -> frozenset[str]:
+    """Return the normalized metric keys present in one device's readings."""
+    if not isinstance(device_data, Mapping):
+        return frozenset()
+
+    metrics: set[str] = set()
+    for reading in device_data.get("readings") or ():
+        if metric := reading.get("metric"):
+            # Normalize metric names like "noise.ambient.level" to "noise"
+            metrics.add("noise" if metric.startswith("noise.") else metric)
+    return frozenset(metrics)
+
+
 def get_device_status_info(org_hub: Any, device_serial: str) -> dict[str, Any] | None:
     """Get status information for a specific device.
 
@@ -0,0 +1,105 @@
+"""Per-sensor reading freshness for MT staleness detection."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+
+class ReadingFreshnessIndex:
+    """Parsed reading times per serial and per metric.
+
+    Each reading's ISO ``ts`` is parsed once, when it first differs from the
+    last one seen for that (serial, metric), so availability checks only
+    compare floats. A serial's latest reading time across all metrics is kept
+    alongside for values that don't come from a reading of their own (gateway
+    RSSI, last seen).
+    """
+
+    def __init__(self, threshold: float = 0, exempt: Collection[str] = ()) -> None:
+        """Initialize an empty index.
+
+        Args:
+            threshold: Seconds after which a reading is stale; 0 disables it
+            exempt: Metrics that are never stale (event-driven readings)
+        """
+        self.threshold = float(threshold)
+        self.exempt = frozenset(exempt)
+        self._raw: dict[tuple[str, str], str] = {}
+        self._metric_times: dict[tuple[str, str], float] = {}
+        self._serial_times: dict[str, float] = {}
+
+    def known(self, serial: str, metric: str) -> bool:
+        """Return True if a reading has been seen for this serial and metric."""
+        return (serial, metric) in self._raw
+
+    def observe(self, serial: str, metric: str, timestamp: str) -> bool:
+        """Record a reading timestamp.
+
+        Args:
+            serial: Device serial
+            metric: Reading metric
+            timestamp: ISO 8601 ``ts`` of the reading
+
+        Returns:
+            True if the timestamp differs from the last one seen for this
+            serial and metric.
+        """
+        key = (serial, metric)
+        if self._raw.get(key) == timestamp:
+            return False
+        self._raw[key] = timestamp
+
+        parsed = dt_util.parse_datetime(timestamp)
+        if parsed is None:
+            self._metric_times.pop(key, None)
+            return True
+
+        reading_time = parsed.timestamp()
+        self._metric_times[key] = reading_time
+        if reading_time > self._serial_times.get(serial, 0.0):
+            self._serial_times[serial] = reading_time
+        return True
+
+    def reading_time(self, serial: str, metric: str | None = None) -> float | None:
+        """Return the epoch time of the latest reading, or None if unknown.
+
+        Args:
+            serial: Device serial
+            metric: Reading metric, or None for the serial's latest reading
+        """
+        if metric is None:
+            return self._serial_times.get(serial)
+        return self._metric_times.get((serial, metric))
+
+    def is_stale(self, serial: str, metric: str | None, now: float) -> bool:
+        """Return True if the reading is older than the staleness threshold.
+
+        Unknown sensors, exempt metrics and a disabled threshold are never
+        stale. Metrics without a reading of their own use the sensor's latest
+        reading.
+        """
+        if self.threshold <= 0 or metric in self.exempt:
+            return False
+        reading_time = self.reading_time(serial, metric)
+        if reading_time is None:
+            # Values without a reading of their own (gateway RSSI, last seen)
+            # follow the sensor's latest reading.
+            reading_time = self.reading_time(serial)
+        if reading_time is None:
+            return False
+        return now - reading_time > self.threshold
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return a diagnostics summary."""
+        ages = [now - reading_time for reading_time in self._serial_times.values()]
+        return {
+            "stale_threshold_seconds": self.threshold or None,
+            "tracked_sensors": len(self._serial_times),
+            "stale_sensors": (
+                sum(age > self.threshold for age in ages) if self.threshold > 0 else 0
+            ),
+            "oldest_reading_age_seconds": round(max(ages), 1) if ages else None,
+        }
@@ -63,6 +63,9 @@ class MerakiRateLimiter:
 
         self._lock = asyncio.Lock()
 
+        # Callbacks run whenever queue depth or call/throttle metrics change
+        self._listeners: list[Callable[[], None]] = []
+
     @property
     def queue_depth(self) -> int:
         """Return the current queue depth."""
@@ -97,6 +100,24 @@ class MerakiRateLimiter:
         )
         return len(self._throttle_events)
 
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback run whenever the limiter's metrics change.
+
+        Returns a callable that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _notify_listeners(self) -> None:
+        """Tell listeners that queue depth or call metrics changed."""
+        for listener in list(self._listeners):
+            listener()
+
     async def start(self) -> None:
         """Start worker tasks for queued calls."""
         if self._running:
@@ -134,6 +155,7 @@ class MerakiRateLimiter:
         await self._queue.put(
             (priority, self._next_sequence(), (func, args, kwargs, future))
         )
+        self._notify_listeners()
         return await future
 
     async def _worker(self) -> None:
@@ -160,6 +182,7 @@ class MerakiRateLimiter:
                     future.set_exception(err)
             finally:
                 self._queue.task_done()
+                self._notify_listeners()
 
     async def _wait_for_token(self) -> tuple[float, bool]:
         """Wait until an API call token is available."""
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Microbenchmark ``EventThrottle`` at a sustained event rate.
+
+Feeds ``--events`` events spread evenly over one simulated minute across
+``--keys`` distinct event keys, driving the throttle from a synthetic
+monotonic clock so the run is independent of how fast the host is. Reports
+the real time spent per event, how many events were allowed, and the most
+keys the throttle tracked at once.
+
+Usage::
+
+    uv run python scripts/bench_event_throttle.py --events 100000 --keys 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.meraki_dashboard.services.event_service import (  # noqa: E402
+    EventThrottle,
+)
+
+
+def main() -> None:
+    """Run the benchmark and print a JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--min-interval", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = [f"door_opened:Q2XX-{index:04X}-0001" for index in range(args.keys)]
+    stream = [rng.choice(keys) for _ in range(args.events)]
+    step = args.window / args.events
+
+    now = 0.0
+    throttle = EventThrottle(args.min_interval, clock=lambda: now)
+    allowed = 0
+    peak_entries = 0
+    started = time.perf_counter()
+    for key in stream:
+        now += step
+        allowed += throttle.should_allow(key)
+        peak_entries = max(peak_entries, len(throttle._last_event_times))
+    elapsed = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "events": args.events,
+                "keys": args.keys,
+                "allowed": allowed,
+                "peak_tracked_keys": peak_entries,
+                "max_entries": throttle.max_entries,
+                "microseconds_per_event": round(elapsed / args.events * 1e6, 2),
+                "events_per_second": round(args.events / elapsed),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
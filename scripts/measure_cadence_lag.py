@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Estimate MT sample-to-state lag with fixed vs cadence-aligned polling.
+
+Simulates a network of sensors that report on a shared cadence (every
+``--interval`` seconds at a common phase, with per-sample jitter) and a
+coordinator polling the org-wide readings endpoint. Lag is the time from a
+reading's ``ts`` to the poll that first delivers it, plus ``--publish-delay``
+for the Dashboard API to expose the sample.
+
+Two modes are compared:
+
+* ``before``: a free-running timer every ``--interval`` seconds.
+* ``after``: the coordinator's ``CadenceTracker`` schedule, which falls back to
+  the fixed interval until it has learned the reporting phase.
+
+Usage::
+
+    uv run python scripts/measure_cadence_lag.py --sensors 50 --interval 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.meraki_dashboard.utils.cadence import (  # noqa: E402
+    CadenceTracker,
+)
+
+
+def _samples(
+    rng: random.Random, args: argparse.Namespace, phase: float
+) -> list[tuple[float, float]]:
+    """Return sorted ``(ts, published_at)`` pairs for every sensor sample."""
+    samples = []
+    for _sensor in range(args.sensors):
+        for cycle in range(int(args.duration // args.interval)):
+            ts = cycle * args.interval + phase + rng.uniform(0, args.jitter)
+            samples.append((ts, ts + args.publish_delay))
+    samples.sort()
+    return samples
+
+
+def _simulate(
+    samples: list[tuple[float, float]], args: argparse.Namespace, aligned: bool
+) -> dict[str, float]:
+    """Poll the samples and return lag statistics in seconds."""
+    tracker = CadenceTracker(args.interval)
+    delivered = 0
+    lags: list[float] = []
+    now = args.start_offset
+    seen_first = False
+    while now < args.duration:
+        new_times = []
+        while delivered < len(samples) and samples[delivered][1] <= now:
+            new_times.append(samples[delivered][0])
+            delivered += 1
+        if seen_first:
+            lags.extend(now - ts for ts in new_times)
+            tracker.observe(new_times, now)
+        seen_first = seen_first or bool(new_times)
+        now += tracker.next_delay(now) if aligned else args.interval
+
+    lags.sort()
+    return {
+        "mean_lag_seconds": round(sum(lags) / len(lags), 1),
+        "p95_lag_seconds": round(lags[int(len(lags) * 0.95)], 1),
+        "polls_per_hour": round(3600 / args.interval, 1),
+    }
+
+
+def main() -> None:
+    """Run the simulation and print a JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=60.0)
+    parser.add_argument("--duration", type=float, default=6 * 3600.0)
+    parser.add_argument("--jitter", type=float, default=3.0)
+    parser.add_argument("--publish-delay", type=float, default=2.0)
+    parser.add_argument("--start-offset", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    phase = rng.uniform(0, args.interval)
+    if args.start_offset is None:
+        args.start_offset = rng.uniform(0, args.interval)
+    samples = _samples(rng, args, phase)
+
+    report = {
+        "reporting_phase_seconds": round(phase, 1),
+        "before": _simulate(samples, args, aligned=False),
+        "after": _simulate(samples, args, aligned=True),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
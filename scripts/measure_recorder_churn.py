@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Estimate recorder rows written per hour for a synthetic MT organization.
+
+Drives the integration's MT sensor entities with synthetic readings and counts
+the rows Home Assistant's recorder would write:
+
+* ``states``: one row whenever an entity's state or any attribute changes
+  (every ``state_changed`` event is recorded).
+* ``state_attributes``: one row whenever the recorded attribute payload has not
+  been seen before (the recorder deduplicates identical payloads).
+
+Three modes are compared:
+
+* ``before``: every attribute is recorded (no ``_unrecorded_attributes``).
+* ``unrecorded``: the entities' ``_unrecorded_attributes`` are honoured.
+* ``entities``: volatile attributes are exposed as diagnostic entities
+  (``volatile_attribute_entities`` option enabled).
+
+Usage::
+
+    uv run python scripts/measure_recorder_churn.py --sensors 1000 --interval 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.meraki_dashboard.const import (  # noqa: E402
+    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
+    MT_SENSOR_HUMIDITY,
+    MT_SENSOR_TEMPERATURE,
+)
+from custom_components.meraki_dashboard.devices.mt import (  # noqa: E402
+    MT_SENSOR_DESCRIPTIONS,
+    MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS,
+    MerakiMTSensor,
+    MerakiMTVolatileAttributeSensor,
+)
+
+MODES = ("before", "unrecorded", "entities")
+
+
+def _build_readings(
+    serial_state: dict[str, float], timestamp: datetime
+) -> list[dict[str, Any]]:
+    """Build one tick of readings for a single sensor."""
+    ts = timestamp.isoformat().replace("+00:00", "Z")
+    celsius = round(serial_state["temperature"], 1)
+    return [
+        {
+            "ts": ts,
+            "metric": MT_SENSOR_TEMPERATURE,
+            MT_SENSOR_TEMPERATURE: {
+                "celsius": celsius,
+                "fahrenheit": round(celsius * 9 / 5 + 32, 1),
+            },
+        },
+        {
+            "ts": ts,
+            "metric": MT_SENSOR_HUMIDITY,
+            MT_SENSOR_HUMIDITY: {"relativePercentage": round(serial_state["humidity"])},
+        },
+    ]
+
+
+def _build_entities(
+    coordinator: Any, devices: list[dict[str, Any]], mode: str
+) -> list[Any]:
+    """Create the MT entities a real setup would create for the given mode."""
+    network_hub = SimpleNamespace(network_name="Synthetic Network")
+    entities: list[Any] = []
+    for device in devices:
+        for key in (MT_SENSOR_TEMPERATURE, MT_SENSOR_HUMIDITY):
+            entities.append(
+                MerakiMTSensor(
+                    coordinator,
+                    device,
+                    MT_SENSOR_DESCRIPTIONS[key],
+                    "synthetic_entry",
+                    network_hub,
+                )
+            )
+        if mode == "entities":
+            for description in MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS.values():
+                entities.append(
+                    MerakiMTVolatileAttributeSensor(
+                        coordinator,
+                        device,
+                        description,
+                        "synthetic_entry",
+                        network_hub,
+                    )
+                )
+    return entities
+
+
+def measure(sensors: int, interval: int, seed: int, mode: str) -> dict[str, int]:
+    """Simulate one hour of polling and count recorder rows for one mode."""
+    rng = random.Random(seed)
+    devices = [
+        {
+            "serial": f"Q2MT-{index:04d}-SYN",
+            "model": "MT10",
+            "networkId": "N_synthetic",
+            "mac": f"00:18:0a:00:{index // 256:02x}:{index % 256:02x}",
+        }
+        for index in range(sensors)
+    ]
+    values = {
+        device["serial"]: {
+            "temperature": rng.uniform(18.0, 26.0),
+            "humidity": rng.uniform(30.0, 60.0),
+        }
+        for device in devices
+    }
+    coordinator = SimpleNamespace(
+        data={},
+        last_update_success=True,
+        config_entry=SimpleNamespace(
+            options={CONF_VOLATILE_ATTRIBUTE_ENTITIES: mode == "entities"}
+        ),
+    )
+    entities = _build_entities(coordinator, devices, mode)
+
+    previous: dict[int, tuple[str, str]] = {}
+    seen_attributes: set[str] = set()
+    states_rows = 0
+    attributes_rows = 0
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+
+    for tick in range(3600 // interval):
+        timestamp = start + timedelta(seconds=tick * interval)
+        for state in values.values():
+            state["temperature"] += rng.gauss(0, 0.05)
+            state["humidity"] += rng.gauss(0, 0.2)
+        coordinator.data = {
+            serial: {"serial": serial, "readings": _build_readings(state, timestamp)}
+            for serial, state in values.items()
+        }
+
+        for index, entity in enumerate(entities):
+            attributes = entity.extra_state_attributes
+            excluded = (
+                frozenset() if mode == "before" else type(entity)._unrecorded_attributes
+            )
+            recorded = json.dumps(
+                {k: v for k, v in attributes.items() if k not in excluded},
+                sort_keys=True,
+                default=str,
+            )
+            current = (
+                str(entity.native_value),
+                json.dumps(attributes, sort_keys=True, default=str),
+            )
+            if previous.get(index) != current:
+                states_rows += 1
+                previous[index] = current
+                if recorded not in seen_attributes:
+                    seen_attributes.add(recorded)
+                    attributes_rows += 1
+
+    return {
+        "entities": len(entities),
+        "states_rows_per_hour": states_rows,
+        "state_attributes_rows_per_hour": attributes_rows,
+    }
+
+
+def main() -> None:
+    """Run the measurement for every mode and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=1000)
+    parser.add_argument("--interval", type=int, default=30, help="seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'entities':>10}{'states/h':>12}{'attributes/h':>15}")
+    for mode in MODES:
+        result = measure(args.sensors, args.interval, args.seed, mode)
+        print(
+            f"{mode:<12}{result['entities']:>10}"
+            f"{result['states_rows_per_hour']:>12}"
+            f"{result['state_attributes_rows_per_hour']:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Measure how long building the org readings snapshot blocks the event loop.
+
+Generates a synthetic ``getOrganizationSensorReadingsLatest`` response for
+``--sensors`` sensors spread over ``--networks`` networks, then runs one
+readings tick (org snapshot build plus every network hub's gateway merge)
+while a heartbeat task measures the longest gap between its wakeups.
+
+Two modes are compared:
+
+* ``before``: the snapshot is built on the loop and every network hub walks
+  the whole org snapshot, merging gateway data into the shared entries.
+* ``after``: above ``READINGS_EXECUTOR_THRESHOLD`` the snapshot is built in
+  the executor and each hub walks only its own serials, copying the entries
+  it merges into.
+
+Usage::
+
+    uv run python scripts/measure_snapshot_loop_block.py --sensors 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.meraki_dashboard.hubs.organization import (  # noqa: E402
+    READINGS_EXECUTOR_THRESHOLD,
+    _build_readings_snapshot,
+)
+
+HEARTBEAT_SECONDS = 0.001
+
+
+def _rows(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Return a synthetic org-wide readings response."""
+    rows = []
+    for index in range(args.sensors):
+        readings = [
+            {
+                "ts": "2026-01-01T00:00:00Z",
+                "metric": metric,
+                metric: {"value": index},
+            }
+            for metric in ("temperature", "humidity", "battery", "co2")
+        ]
+        rows.append(
+            {
+                "serial": f"Q2XX-{index:04X}-0001",
+                "network": {"id": f"N{index % args.networks}"},
+                "readings": readings,
+            }
+        )
+    return rows
+
+
+def _hub_serials(rows: list[dict[str, Any]], networks: int) -> list[dict[str, Any]]:
+    """Return each network hub's ``{serial: device}`` index."""
+    hubs: list[dict[str, Any]] = [{} for _ in range(networks)]
+    for row in rows:
+        network = int(row["network"]["id"][1:])
+        hubs[network][row["serial"]] = {"serial": row["serial"]}
+    return hubs
+
+
+def _merge_before(
+    snapshot: dict[str, Any], by_serial: dict[str, Any], gateways: dict[str, Any]
+) -> dict[str, Any]:
+    """Per-hub merge walking the whole org snapshot, mutating shared entries."""
+    result = {}
+    for serial, reading in snapshot.items():
+        if serial not in by_serial:
+            continue
+        gateway = dict(gateways.get(serial) or {})
+        reading["rssi"] = gateway.get("rssi")
+        reading["last_connected_at"] = gateway.get("last_connected_at")
+        result[serial] = reading
+    return result
+
+
+def _merge_after(
+    snapshot: dict[str, Any], by_serial: dict[str, Any], gateways: dict[str, Any]
+) -> dict[str, Any]:
+    """Per-hub merge walking only the hub's serials, copying entries."""
+    result = {}
+    for serial in by_serial:
+        reading = snapshot.get(serial)
+        if reading is None:
+            continue
+        gateway = dict(gateways.get(serial) or {})
+        result[serial] = {
+            **reading,
+            "rssi": gateway.get("rssi"),
+            "last_connected_at": gateway.get("last_connected_at"),
+        }
+    return result
+
+
+async def _tick(args: argparse.Namespace, after: bool) -> dict[str, float]:
+    """Run one readings tick and return loop-block statistics in milliseconds."""
+    loop = asyncio.get_running_loop()
+    rows = _rows(args)
+    hubs = _hub_serials(rows, args.networks)
+    gateways = {row["serial"]: {"rssi": -60} for row in rows}
+    gaps: list[float] = []
+    running = True
+
+    async def _heartbeat() -> None:
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            now = time.perf_counter()
+            gaps.append(now - last - HEARTBEAT_SECONDS)
+            last = now
+
+    heartbeat = asyncio.create_task(_heartbeat())
+    await asyncio.sleep(0.05)
+    gaps.clear()
+
+    started = time.perf_counter()
+    if after and len(rows) >= READINGS_EXECUTOR_THRESHOLD:
+        snapshot = await loop.run_in_executor(None, _build_readings_snapshot, rows)
+    else:
+        snapshot = _build_readings_snapshot(rows)
+    merge = _merge_after if after else _merge_before
+    for by_serial in hubs:
+        # Each network hub's coordinator runs as its own loop callback.
+        merge(snapshot, by_serial, gateways)
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    await asyncio.sleep(0.05)
+    running = False
+    await heartbeat
+    return {
+        "max_loop_block_ms": round(max(gaps) * 1000, 1),
+        "total_loop_block_ms": round(sum(gap for gap in gaps if gap > 0) * 1000, 1),
+        "tick_ms": round(elapsed * 1000, 1),
+    }
+
+
+def main() -> None:
+    """Run both modes and print a JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=20000)
+    parser.add_argument("--networks", type=int, default=50)
+    args = parser.parse_args()
+
+    report = {
+        "sensors": args.sensors,
+        "networks": args.networks,
+        "before": asyncio.run(_tick(args, after=False)),
+        "after": asyncio.run(_tick(args, after=True)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import re
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
@@ -44,22 +45,20 @@ def clear_cache():
 
 
 @pytest.fixture(autouse=True)
-def block_mt_action_batch():
-    """Stop the MT refresh service from making a real action-batch HTTP call.
-
-    ``MTRefreshService._send_action_batch`` posts directly via ``aiohttp`` (it does
-    not go through the mocked Meraki SDK), so any test that fully sets up the
-    integration with MT15/MT40 devices would otherwise open a real socket — which
-    the Home Assistant test harness blocks. No test exercises the real method (the
-    dedicated tests patch it per-instance, which still overrides this), so a no-op
-    default keeps integration-setup tests hermetic.
+def block_mt_action_batch(aioclient_mock):
+    """Accept MT refresh action batches without a real HTTP call.
+
+    ``MTRefreshScheduler`` posts action batches on Home Assistant's client
+    session rather than through the mocked Meraki SDK, so any test that fully
+    sets up the integration with MT15/MT40 devices would otherwise open a real
+    socket — which the Home Assistant test harness blocks. Answering every
+    ``actionBatches`` POST through ``aioclient_mock`` keeps those tests
+    hermetic while still running the real request path. Tests needing another
+    response call ``aioclient_mock.clear_requests()`` and register their own.
     """
-    with patch(
-        "custom_components.meraki_dashboard.services.mt_refresh_service."
-        "MTRefreshService._send_action_batch",
-        new_callable=AsyncMock,
-    ):
-        yield
+    aioclient_mock.post(
+        re.compile(r"/actionBatches$"), status=201, text='{"id": "batch"}'
+    )
 
 
 @pytest.fixture(autouse=True)
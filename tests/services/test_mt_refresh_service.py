@@ -1,14 +1,21 @@
 """Tests for MT refresh service."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.meraki_dashboard.const import MT_REFRESH_COMMAND_INTERVAL
+from custom_components.meraki_dashboard.const import (
+    API_PRIORITY_MT_REFRESH,
+    MT_REFRESH_COMMAND_INTERVAL,
+)
+from custom_components.meraki_dashboard.exceptions import MerakiApiError
 from custom_components.meraki_dashboard.services.mt_refresh_service import (
+    ACTION_BATCH_MAX_CONCURRENT,
+    MTRefreshScheduler,
     MTRefreshService,
+    _async_post_action_batch,
 )
 
 
@@ -26,18 +33,31 @@ class TestMTRefreshService:
             {"serial": "Q2XX-TEST-0003", "model": "MT14"},  # Not MT15/MT40
         ]
         hub.dashboard = Mock()
+        hub.get_devices_by_model.side_effect = lambda *models: [
+            d for d in hub.devices if d["model"] in models
+        ]
+        hub.sensor_data = {}
+        hub.gateway_connections = {}
+        hub.organization_hub.unwatched_serials = frozenset()
         return hub
 
+    @pytest.fixture
+    def mock_scheduler(self):
+        """Create a mock org-wide refresh scheduler."""
+        return Mock(spec=MTRefreshScheduler)
+
     @pytest.fixture
     async def mt_refresh_service(
-        self, hass: HomeAssistant, mock_network_hub
+        self, hass: HomeAssistant, mock_network_hub, mock_scheduler
     ) -> MTRefreshService:
         """Create an MT refresh service instance."""
-        return MTRefreshService(hass, mock_network_hub)
+        return MTRefreshService(hass, mock_network_hub, mock_scheduler)
 
-    def test_init_default_interval(self, hass: HomeAssistant, mock_network_hub):
+    def test_init_default_interval(
+        self, hass: HomeAssistant, mock_network_hub, mock_scheduler
+    ):
         """Test initialization with default interval."""
-        service = MTRefreshService(hass, mock_network_hub)
+        service = MTRefreshService(hass, mock_network_hub, mock_scheduler)
 
         assert service.hass == hass
         assert service.network_hub == mock_network_hub
@@ -48,9 +68,11 @@ class TestMTRefreshService:
         assert service._batch_successes == 0
         assert service._batch_failures == 0
 
-    def test_init_custom_interval(self, hass: HomeAssistant, mock_network_hub):
+    def test_init_custom_interval(
+        self, hass: HomeAssistant, mock_network_hub, mock_scheduler
+    ):
         """Test initialization with custom interval."""
-        service = MTRefreshService(hass, mock_network_hub, interval=15)
+        service = MTRefreshService(hass, mock_network_hub, mock_scheduler, interval=15)
 
         assert service._refresh_interval == 15
 
@@ -66,161 +88,71 @@ class TestMTRefreshService:
         assert mt_devices[1]["serial"] == "Q2XX-TEST-0002"
 
     async def test_get_mt15_mt40_devices_empty(
-        self, hass: HomeAssistant, mock_network_hub
+        self, mt_refresh_service: MTRefreshService, mock_network_hub
     ):
         """Test filtering when no MT15/MT40 devices exist."""
         mock_network_hub.devices = [
             {"serial": "Q2XX-TEST-0003", "model": "MT14"},
             {"serial": "Q2XX-TEST-0004", "model": "MT12"},
         ]
-        service = MTRefreshService(hass, mock_network_hub)
 
-        mt_devices = service._get_mt15_mt40_devices()
+        mt_devices = mt_refresh_service._get_mt15_mt40_devices()
 
         assert len(mt_devices) == 0
 
     async def test_async_start_default_interval(
-        self, hass: HomeAssistant, mock_network_hub
+        self, mt_refresh_service: MTRefreshService, mock_scheduler
     ):
-        """Test starting the service with default interval."""
-        service = MTRefreshService(hass, mock_network_hub)
-
-        with patch.object(
-            service, "_async_refresh_devices", new_callable=AsyncMock
-        ) as mock_refresh:
-            await service.async_start()
+        """Starting registers the network with the scheduler."""
+        await mt_refresh_service.async_start()
 
-            assert service._running is True
-            assert service._refresh_timer is not None
-            assert service._refresh_interval == MT_REFRESH_COMMAND_INTERVAL
-            mock_refresh.assert_called_once()
-
-        # Cancel the scheduled interval timer so the HA harness does not flag a
-        # lingering timer at teardown.
-        await service.async_stop()
+        assert mt_refresh_service._running is True
+        assert mt_refresh_service._refresh_interval == MT_REFRESH_COMMAND_INTERVAL
+        assert (
+            mt_refresh_service._unregister is mock_scheduler.async_register.return_value
+        )
+        mock_scheduler.async_register.assert_called_once_with(
+            mt_refresh_service, MT_REFRESH_COMMAND_INTERVAL
+        )
 
     async def test_async_start_custom_interval(
-        self, hass: HomeAssistant, mock_network_hub
+        self, mt_refresh_service: MTRefreshService, mock_scheduler
     ):
         """Test starting the service with custom interval."""
-        service = MTRefreshService(hass, mock_network_hub)
+        await mt_refresh_service.async_start(interval=10)
 
-        with patch.object(
-            service, "_async_refresh_devices", new_callable=AsyncMock
-        ) as mock_refresh:
-            await service.async_start(interval=10)
-
-            assert service._running is True
-            assert service._refresh_interval == 10
-            mock_refresh.assert_called_once()
-
-        # Cancel the scheduled interval timer so the HA harness does not flag a
-        # lingering timer at teardown.
-        await service.async_stop()
+        assert mt_refresh_service._running is True
+        assert mt_refresh_service._refresh_interval == 10
+        mock_scheduler.async_register.assert_called_once_with(mt_refresh_service, 10)
 
     async def test_async_start_already_running(
-        self, hass: HomeAssistant, mock_network_hub
+        self, mt_refresh_service: MTRefreshService, mock_scheduler
     ):
         """Test starting the service when it's already running."""
-        service = MTRefreshService(hass, mock_network_hub)
-        service._running = True
-
-        with patch.object(
-            service, "_async_refresh_devices", new_callable=AsyncMock
-        ) as mock_refresh:
-            await service.async_start()
-
-            # Should not call refresh again
-            mock_refresh.assert_not_called()
-
-    async def test_async_stop(self, hass: HomeAssistant, mock_network_hub):
-        """Test stopping the service."""
-        service = MTRefreshService(hass, mock_network_hub)
-
-        with patch.object(service, "_async_refresh_devices", new_callable=AsyncMock):
-            await service.async_start()
-            assert service._running is True
-
-            await service.async_stop()
-            assert service._running is False
-            assert service._refresh_timer is None
-
-    async def test_async_stop_not_running(self, hass: HomeAssistant, mock_network_hub):
-        """Test stopping the service when it's not running."""
-        service = MTRefreshService(hass, mock_network_hub)
-        service._running = False
-
-        await service.async_stop()
-        # Should not raise an error
-        assert service._running is False
-
-    # NOTE: The following tests were removed because the implementation changed
-    # from per-device refresh to batch-based refresh using Action Batches API.
-    # The old methods _send_refresh_command, _async_refresh_single_device, and
-    # _handle_refresh_error no longer exist.
-
-    async def test_async_refresh_devices(
-        self, mt_refresh_service: MTRefreshService, mock_network_hub
-    ):
-        """Test refreshing all MT15/MT40 devices using batch API."""
-        # Mock the organization hub for batch API
-        org_hub = Mock()
-        org_hub._api_key = "test_api_key"
-        org_hub.organization_id = "test_org"
-        org_hub.base_url = "https://api.meraki.com/api/v1"
-        mock_network_hub.organization_hub = org_hub
-
         mt_refresh_service._running = True
 
-        # Mock the _send_action_batch method to simulate successful batch
-        async def mock_send_batch(devices):
-            mt_refresh_service._batch_attempts += 1
-            mt_refresh_service._batch_successes += 1
-
-        with patch.object(
-            mt_refresh_service, "_send_action_batch", side_effect=mock_send_batch
-        ):
-            await mt_refresh_service._async_refresh_devices(datetime.now(UTC))
+        await mt_refresh_service.async_start()
 
-        # Should have attempted one batch with 2 devices (MT15 and MT40)
-        assert mt_refresh_service._batch_attempts == 1
-        assert mt_refresh_service._batch_successes == 1
+        # Should not register again
+        mock_scheduler.async_register.assert_not_called()
 
-    async def test_async_refresh_devices_not_running(
-        self, mt_refresh_service: MTRefreshService, mock_network_hub
+    async def test_async_stop(
+        self, mt_refresh_service: MTRefreshService, mock_scheduler
     ):
-        """Test that refresh doesn't happen when service is not running."""
-        mt_refresh_service._running = False
-        await mt_refresh_service._async_refresh_devices(datetime.now(UTC))
+        """Stopping removes the network from the scheduler."""
+        await mt_refresh_service.async_start()
+        assert mt_refresh_service._running is True
 
-        # Should not have attempted any batches
-        assert mt_refresh_service._batch_attempts == 0
-
-    async def test_async_refresh_devices_no_dashboard(
-        self, hass: HomeAssistant, mock_network_hub
-    ):
-        """Test refresh when dashboard is None."""
-        mock_network_hub.dashboard = None
-        service = MTRefreshService(hass, mock_network_hub)
-        service._running = True
+        await mt_refresh_service.async_stop()
+        assert mt_refresh_service._running is False
+        assert mt_refresh_service._unregister is None
+        mock_scheduler.async_register.return_value.assert_called_once_with()
 
-        await service._async_refresh_devices(datetime.now(UTC))
-
-        # Should not crash, just return early
-        assert service._batch_attempts == 0
-
-    async def test_async_refresh_devices_no_mt_devices(
-        self, hass: HomeAssistant, mock_network_hub
-    ):
-        """Test refresh when no MT15/MT40 devices exist."""
-        mock_network_hub.devices = [{"serial": "Q2XX-TEST-0003", "model": "MT14"}]
-        service = MTRefreshService(hass, mock_network_hub)
-        service._running = True
-
-        await service._async_refresh_devices(datetime.now(UTC))
-
-        # Should not attempt any refreshes
-        assert service._batch_attempts == 0
+    async def test_async_stop_not_running(self, mt_refresh_service: MTRefreshService):
+        """Test stopping the service when it's not running."""
+        await mt_refresh_service.async_stop()
+        # Should not raise an error
+        assert mt_refresh_service._running is False
 
     def test_success_rate_no_attempts(self, mt_refresh_service: MTRefreshService):
         """Test success rate calculation with no attempts."""
@@ -242,6 +174,22 @@ class TestMTRefreshService:
 
         assert mt_refresh_service.success_rate == 0.0
 
+    def test_record_refresh_cycle_counts_attempts(
+        self, mt_refresh_service: MTRefreshService
+    ):
+        """Each recorded cycle counts as one attempt, whatever its batch count."""
+        devices = [{"serial": "Q2XX-TEST-0001", "model": "MT15"}]
+
+        mt_refresh_service.record_refresh_cycle(
+            [(201, '{"id":"batch1"}', devices), (201, '{"id":"batch2"}', devices)]
+        )
+        mt_refresh_service.record_refresh_cycle([(500, "error", devices)])
+
+        assert mt_refresh_service._batch_attempts == 2
+        assert mt_refresh_service._batch_successes == 1
+        assert mt_refresh_service._batch_failures == 1
+        assert mt_refresh_service.success_rate == 50.0
+
     def test_gateway_unavailable_logs_debug_not_error(
         self, mt_refresh_service: MTRefreshService, caplog
     ):
@@ -252,7 +200,7 @@ class TestMTRefreshService:
         body = '{"errors":["A suitable gateway was not available for sending this command."]}'
 
         with caplog.at_level(logging.DEBUG):
-            mt_refresh_service._handle_batch_response(400, body, devices)
+            mt_refresh_service.record_refresh_cycle([(400, body, devices)])
 
         assert mt_refresh_service._batch_failures == 1
         assert mt_refresh_service._consecutive_gateway_failures == 1
@@ -274,26 +222,11 @@ class TestMTRefreshService:
 
         with caplog.at_level(logging.WARNING):
             for _ in range(CONSECUTIVE_FAILURE_THRESHOLD + 5):
-                mt_refresh_service._handle_batch_response(400, body, devices)
+                mt_refresh_service.record_refresh_cycle([(400, body, devices)])
 
         warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
         assert len(warnings) == 1
 
-    def test_non_gateway_failure_still_logs_error(
-        self, mt_refresh_service: MTRefreshService, caplog
-    ):
-        """Genuine API errors (not the gateway case) still surface as ERROR."""
-        import logging
-
-        devices = [{"serial": "Q2XX-TEST-0001", "model": "MT15"}]
-
-        with caplog.at_level(logging.DEBUG):
-            mt_refresh_service._handle_batch_response(
-                403, '{"errors":["Invalid API key"]}', devices
-            )
-
-        assert [r for r in caplog.records if r.levelno >= logging.ERROR]
-
     def test_batch_success_resets_gateway_streak(
         self, mt_refresh_service: MTRefreshService
     ):
@@ -301,13 +234,110 @@ class TestMTRefreshService:
         devices = [{"serial": "Q2XX-TEST-0001", "model": "MT15"}]
         body = '{"errors":["A suitable gateway was not available for sending this command."]}'
 
-        mt_refresh_service._handle_batch_response(400, body, devices)
+        mt_refresh_service.record_refresh_cycle([(400, body, devices)])
         assert mt_refresh_service._consecutive_gateway_failures == 1
 
-        mt_refresh_service._handle_batch_response(201, '{"id":"batch123"}', devices)
+        mt_refresh_service.record_refresh_cycle([(201, '{"id":"batch123"}', devices)])
         assert mt_refresh_service._consecutive_gateway_failures == 0
         assert mt_refresh_service._batch_successes == 1
 
+    def test_plan_skips_fresh_unreachable_and_unwatched(
+        self, mt_refresh_service: MTRefreshService, mock_network_hub
+    ):
+        """Only sensors a refresh command would help are planned."""
+        now = datetime.now(UTC)
+
+        def _reading(age: int) -> dict:
+            ts = (now - timedelta(seconds=age)).isoformat()
+            return {"readings": [{"ts": ts, "metric": "temperature"}]}
+
+        serials = [f"Q2XX-PLAN-{index:04d}" for index in range(5)]
+        mock_network_hub.devices = [
+            {"serial": serial, "model": "MT15"} for serial in serials
+        ]
+        mock_network_hub.sensor_data = {
+            serials[0]: _reading(5),  # reported within half an interval
+            serials[1]: _reading(300),
+            serials[2]: _reading(300),
+            serials[3]: _reading(300),
+        }
+        mock_network_hub.gateway_connections = {
+            serial: {"rssi": -60} for serial in serials
+        }
+        mock_network_hub.gateway_connections[serials[2]] = {"rssi": None}
+        mock_network_hub.organization_hub.unwatched_serials = frozenset({serials[3]})
+
+        targets = mt_refresh_service.plan_refresh_targets()
+
+        # Stale and never-seen sensors are refreshed
+        assert [device["serial"] for device in targets] == [serials[1], serials[4]]
+        assert dict(mt_refresh_service._skipped_refreshes) == {
+            "fresh": 1,
+            "no_gateway": 1,
+            "unwatched": 1,
+        }
+
+        # Unknown gateway connectivity doesn't exclude anyone
+        mock_network_hub.gateway_connections = {}
+        targets = mt_refresh_service.plan_refresh_targets()
+        assert [device["serial"] for device in targets] == [
+            serials[1],
+            serials[2],
+            serials[4],
+        ]
+
+        # Nor does a sensor missing from otherwise known connectivity
+        mock_network_hub.gateway_connections = {serials[1]: {"rssi": -60}}
+        targets = mt_refresh_service.plan_refresh_targets()
+        assert [device["serial"] for device in targets] == [
+            serials[1],
+            serials[2],
+            serials[4],
+        ]
+
+    def test_plan_backs_off_failing_sensors(self, mt_refresh_service: MTRefreshService):
+        """Repeated failures make a sensor sit out a growing number of cycles."""
+        devices = [{"serial": "Q2XX-TEST-0001", "model": "MT15"}]
+
+        def _planned() -> list[bool]:
+            return [
+                "Q2XX-TEST-0001"
+                in [d["serial"] for d in mt_refresh_service.plan_refresh_targets()]
+                for _ in range(4)
+            ]
+
+        mt_refresh_service.record_refresh_cycle([(500, "error", devices)])
+        assert _planned() == [True, True, True, True]
+
+        mt_refresh_service.record_refresh_cycle([(500, "error", devices)])
+        mt_refresh_service.record_refresh_cycle([(500, "error", devices)])
+        assert _planned() == [False, False, False, True]
+
+        # A successful batch lifts the backoff
+        mt_refresh_service.record_refresh_cycle([(500, "error", devices)])
+        mt_refresh_service.record_refresh_cycle([(201, '{"id":"batch123"}', devices)])
+        assert _planned() == [True, True, True, True]
+
+    def test_gateway_unavailable_does_not_back_off(
+        self, mt_refresh_service: MTRefreshService
+    ):
+        """A "no suitable gateway" batch rejection doesn't back off its sensors."""
+        devices = [
+            {"serial": "Q2XX-TEST-0001", "model": "MT15"},
+            {"serial": "Q2XX-TEST-0002", "model": "MT40"},
+        ]
+        body = '{"errors":["A suitable gateway was not available for sending this command."]}'
+
+        for _ in range(3):
+            mt_refresh_service.record_refresh_cycle([(400, body, devices)])
+
+        assert not mt_refresh_service._failure_counts
+        assert [d["serial"] for d in mt_refresh_service.plan_refresh_targets()] == [
+            "Q2XX-TEST-0001",
+            "Q2XX-TEST-0002",
+        ]
+        assert mt_refresh_service._batch_failures == 3
+
     def test_is_running_property(self, mt_refresh_service: MTRefreshService):
         """Test is_running property."""
         assert mt_refresh_service.is_running is False
@@ -319,44 +349,273 @@ class TestMTRefreshService:
         assert mt_refresh_service.is_running is False
 
 
-class TestMTRefreshServiceIntegration:
-    """Integration tests for MT refresh service with network hub."""
-
-    async def test_service_with_real_hub_setup(self, hass: HomeAssistant):
-        """Test MT refresh service integration with network hub."""
-        # This would require a full hub setup, which is more complex
-        # For now, we test the service independently
-        # In a real scenario, you'd use HubBuilder to create a full network hub
-        pass
+class TestMTRefreshScheduler:
+    """Test the org-wide MT refresh scheduler."""
 
-    async def test_concurrent_refresh_commands(self, hass: HomeAssistant):
-        """Test that batch refresh command is sent for multiple devices."""
-        # Create a fresh mock hub
-        mock_hub = Mock()
-        mock_hub.network_name = "Test Network"
-        mock_hub.devices = [
-            {"serial": f"Q2XX-TEST-{i:04d}", "model": "MT15"} for i in range(10)
+    @staticmethod
+    def _network_hub(name: str, serials: list[str]) -> Mock:
+        """Create a mock network hub with MT15 sensors."""
+        hub = Mock()
+        hub.network_name = name
+        hub.dashboard = Mock()
+        hub.get_devices_by_model.return_value = [
+            {"serial": serial, "model": "MT15"} for serial in serials
         ]
-        mock_hub.dashboard = Mock()
+        hub.sensor_data = {}
+        hub.gateway_connections = {}
+        hub.organization_hub.unwatched_serials = frozenset()
+        return hub
+
+    @staticmethod
+    def _org_hub() -> Mock:
+        """Create a mock org hub that runs API calls immediately."""
+
+        async def _api_call(func, *args, priority, **kwargs):
+            return await func(*args, **kwargs)
 
-        # Mock the organization hub for batch API
         org_hub = Mock()
-        org_hub._api_key = "test_api_key"
-        org_hub.organization_id = "test_org"
-        org_hub.base_url = "https://api.meraki.com/api/v1"
-        mock_hub.organization_hub = org_hub
+        org_hub.async_api_call = AsyncMock(side_effect=_api_call)
+        return org_hub
+
+    async def _start_services(self, hass: HomeAssistant, scheduler):
+        """Start one refresh service per network through the scheduler."""
+        services = [
+            MTRefreshService(hass, self._network_hub(name, serials), scheduler)
+            for name, serials in (
+                ("Office", ["Q2XX-TEST-0001", "Q2XX-TEST-0002"]),
+                ("Warehouse", ["Q2XX-TEST-0003"]),
+            )
+        ]
+        for service in services:
+            await service.async_start(interval=30)
+        return services
 
-        service = MTRefreshService(hass, mock_hub)
-        service._running = True
+    async def test_one_batch_for_all_networks(self, hass: HomeAssistant):
+        """Every registered network's sensors go out in a single action batch."""
+        scheduler = MTRefreshScheduler(hass, self._org_hub())
+        services = await self._start_services(hass, scheduler)
 
-        # Mock the _send_action_batch method to simulate successful batch
-        async def mock_send_batch(devices):
-            service._batch_attempts += 1
-            service._batch_successes += 1
+        with patch.object(
+            scheduler,
+            "_send_action_batch",
+            new_callable=AsyncMock,
+            return_value='{"id": "batch123"}',
+        ) as mock_send:
+            await scheduler.async_refresh()
+
+        mock_send.assert_awaited_once()
+        actions = mock_send.call_args.args[0]
+        assert [action["resource"] for action in actions] == [
+            "/devices/Q2XX-TEST-0001/sensor/commands",
+            "/devices/Q2XX-TEST-0002/sensor/commands",
+            "/devices/Q2XX-TEST-0003/sensor/commands",
+        ]
+        for service in services:
+            assert service._batch_attempts == 1
+            assert service._batch_successes == 1
 
-        with patch.object(service, "_send_action_batch", side_effect=mock_send_batch):
-            await service._async_refresh_devices(datetime.now(UTC))
+        for service in services:
+            await service.async_stop()
+        assert scheduler._refresh_timer is None
+        assert scheduler._pending_refresh is None
 
-        # Should have attempted one batch with 10 devices
+    async def test_failure_attributed_to_each_network(self, hass: HomeAssistant):
+        """A failed batch counts against each network's own sensors."""
+        scheduler = MTRefreshScheduler(hass, self._org_hub())
+        office, warehouse = await self._start_services(hass, scheduler)
+        await warehouse.async_stop()
+
+        with patch.object(
+            scheduler,
+            "_send_action_batch",
+            new_callable=AsyncMock,
+            side_effect=MerakiApiError(
+                "Action batch rejected with status 500",
+                status_code=500,
+                response_text="Internal Server Error",
+            ),
+        ):
+            await scheduler.async_refresh()
+
+        assert office._batch_failures == 1
+        assert dict(office._failure_counts) == {
+            "Q2XX-TEST-0001": 1,
+            "Q2XX-TEST-0002": 1,
+        }
+        # Stopped networks are left out of the batch and its accounting
+        assert warehouse._batch_attempts == 0
+        assert scheduler.batch_failures == 1
+
+        await office.async_stop()
+
+    async def test_large_networks_split_into_batches(self, hass: HomeAssistant):
+        """Sensors beyond Meraki's per-batch limit go out in further batches."""
+        org_hub = self._org_hub()
+        scheduler = MTRefreshScheduler(hass, org_hub)
+        serials = [f"Q2XX-TEST-{index:04d}" for index in range(250)]
+        service = MTRefreshService(
+            hass, self._network_hub("Campus", serials), scheduler
+        )
+        await service.async_start(interval=30)
+        gateway_body = '{"errors":["A suitable gateway was not available."]}'
+
+        async def _send(actions):
+            if "Q2XX-TEST-0100" in actions[0]["resource"]:
+                raise MerakiApiError(
+                    "Action batch rejected with status 400",
+                    status_code=400,
+                    response_text=gateway_body,
+                )
+            return '{"id": "batch"}'
+
+        with patch.object(scheduler, "_send_action_batch", side_effect=_send):
+            await scheduler.async_refresh()
+
+        api_calls = org_hub.async_api_call.call_args_list
+        assert [len(call.args[1]) for call in api_calls] == [100, 100, 50]
+        assert {call.kwargs["priority"] for call in api_calls} == {
+            API_PRIORITY_MT_REFRESH
+        }
+        # One refresh cycle, failed because one of its batches was rejected
         assert service._batch_attempts == 1
-        assert service._batch_successes == 1
+        assert service._batch_failures == 1
+        assert service._consecutive_gateway_failures == 1
+        # The rejection doesn't say which sensor lacked a gateway, so nobody
+        # in the rejected batch is backed off
+        assert not service._failure_counts
+        assert scheduler.batch_attempts == 3
+        assert scheduler.batch_failures == 1
+
+        await service.async_stop()
+
+    async def test_batches_per_cycle_capped_and_rotated(self, hass: HomeAssistant):
+        """Sensors beyond the concurrent-batch limit wait for the next cycle."""
+        org_hub = self._org_hub()
+        scheduler = MTRefreshScheduler(hass, org_hub)
+        serials = [f"Q2XX-TEST-{index:04d}" for index in range(700)]
+        service = MTRefreshService(
+            hass, self._network_hub("Campus", serials), scheduler
+        )
+        await service.async_start(interval=30)
+        sent: list[list[str]] = []
+
+        async def _send(actions):
+            return '{"id": "batch"}'
+
+        with patch.object(scheduler, "_send_action_batch", side_effect=_send):
+            for _ in range(2):
+                org_hub.async_api_call.reset_mock()
+                await scheduler.async_refresh()
+                sent.append(
+                    [
+                        action["resource"].split("/")[2]
+                        for call in org_hub.async_api_call.call_args_list
+                        for action in call.args[1]
+                    ]
+                )
+
+        capacity = ACTION_BATCH_MAX_CONCURRENT * 100
+        assert sent[0] == serials[:capacity]
+        # The next cycle picks up where the last stopped, wrapping around
+        assert sent[1] == serials[capacity:] + serials[: 2 * capacity - len(serials)]
+        assert scheduler.batch_attempts == 2 * ACTION_BATCH_MAX_CONCURRENT
+        assert service._batch_attempts == 2
+        assert service._batch_successes == 2
+
+        await service.async_stop()
+
+    async def test_refresh_skips_idle_networks(self, hass: HomeAssistant):
+        """Stopped, dashboard-less and MT15/MT40-less networks send nothing."""
+        scheduler = MTRefreshScheduler(hass, self._org_hub())
+        office, warehouse = await self._start_services(hass, scheduler)
+        office.dashboard = None
+        warehouse.network_hub.get_devices_by_model.return_value = []
+
+        with patch.object(
+            scheduler, "_send_action_batch", new_callable=AsyncMock
+        ) as mock_send:
+            await scheduler.async_refresh()
+            await warehouse.async_stop()
+            await scheduler.async_refresh()
+
+        mock_send.assert_not_awaited()
+        assert office._batch_attempts == 0
+        assert warehouse._batch_attempts == 0
+        assert scheduler.batch_attempts == 0
+
+        await office.async_stop()
+
+    async def test_genuine_failure_logged_once_per_cycle(
+        self, hass: HomeAssistant, caplog
+    ):
+        """Genuine API errors surface as one ERROR for the whole cycle."""
+        import logging
+
+        scheduler = MTRefreshScheduler(hass, self._org_hub())
+        services = await self._start_services(hass, scheduler)
+
+        with (
+            patch.object(
+                scheduler,
+                "_send_action_batch",
+                new_callable=AsyncMock,
+                side_effect=MerakiApiError(
+                    "Action batch rejected with status 403",
+                    status_code=403,
+                    response_text='{"errors":["Invalid API key"]}',
+                ),
+            ),
+            caplog.at_level(logging.DEBUG),
+        ):
+            await scheduler.async_refresh()
+
+        assert len([r for r in caplog.records if r.levelno >= logging.ERROR]) == 1
+        for service in services:
+            assert service._batch_failures == 1
+            await service.async_stop()
+
+    async def test_action_batch_posted_on_shared_session(
+        self, hass: HomeAssistant, aioclient_mock
+    ):
+        """Batches go out on Home Assistant's client session and raise on rejection."""
+        org_hub = Mock()
+        org_hub.base_url = "https://api.meraki.com/api/v1"
+        org_hub.organization_id = "123"
+        org_hub._api_key = "test_api_key"
+        url = "https://api.meraki.com/api/v1/organizations/123/actionBatches"
+        actions = [{"resource": "/devices/Q2XX-TEST-0001/sensor/commands"}]
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(url, status=400, text='{"errors": ["bad request"]}')
+
+        with pytest.raises(MerakiApiError) as err:
+            await _async_post_action_batch(hass, org_hub, actions)
+
+        assert err.value.status_code == 400
+        assert err.value.context["response_text"] == '{"errors": ["bad request"]}'
+        assert aioclient_mock.call_count == 1
+        method, called_url, payload, headers = aioclient_mock.mock_calls[0]
+        assert (method, str(called_url)) == ("post", url)
+        assert payload == {"confirmed": True, "synchronous": False, "actions": actions}
+        assert headers["X-Cisco-Meraki-API-Key"] == "test_api_key"
+
+    async def test_rate_limited_batch_carries_retry_after(
+        self, hass: HomeAssistant, aioclient_mock
+    ):
+        """A 429 keeps its Retry-After so the org hub's retry can honour it."""
+        org_hub = Mock()
+        org_hub.base_url = "https://api.meraki.com/api/v1"
+        org_hub.organization_id = "123"
+        org_hub._api_key = "test_api_key"
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(
+            "https://api.meraki.com/api/v1/organizations/123/actionBatches",
+            status=429,
+            text='{"errors": ["Too many concurrently executing batches"]}',
+            headers={"Retry-After": "2"},
+        )
+
+        with pytest.raises(MerakiApiError) as err:
+            await _async_post_action_batch(hass, org_hub, [])
+
+        assert err.value.status_code == 429
+        assert err.value.context["retry_after"] == "2"
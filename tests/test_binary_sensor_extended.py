@@ -447,6 +447,7 @@ class TestBinarySensorAvailability:
             }
         }
         coordinator.last_update_success = True
+        coordinator.reading_is_stale.return_value = False
 
         network_hub = MagicMock()
 
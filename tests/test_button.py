@@ -58,6 +58,7 @@ class TestMerakiUpdateSensorDataButton:
         """Test button press with coordinators available."""
         # Set up mock hass data
         mock_org_hub.hass = hass
+        mock_org_hub.async_force_refresh = AsyncMock()
         hass.data[DOMAIN] = {
             mock_config_entry.entry_id: {"coordinators": {"coord1": mock_coordinator}}
         }
@@ -67,8 +68,9 @@ class TestMerakiUpdateSensorDataButton:
         # Press the button
         await button.async_press()
 
-        # Verify coordinator was refreshed
-        mock_coordinator.async_request_refresh.assert_called_once()
+        # Verify one forced org fetch fanned out to the coordinator
+        mock_org_hub.async_force_refresh.assert_awaited_once_with([mock_coordinator])
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     async def test_press_no_coordinators(self, mock_org_hub, mock_config_entry, hass):
         """Test button press with no coordinators."""
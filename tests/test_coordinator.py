@@ -1,12 +1,23 @@
 """Test the Meraki Dashboard coordinator."""
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
-
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.meraki_dashboard.const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MAX,
+    CONF_ADAPTIVE_SCAN_INTERVAL_MIN,
+    CONF_STALE_READING_THRESHOLD,
+    DOMAIN,
+)
 from custom_components.meraki_dashboard.coordinator import MerakiSensorCoordinator
+from custom_components.meraki_dashboard.utils.cadence import CadenceTracker
 from tests.fixtures.meraki_api import MOCK_PROCESSED_SENSOR_DATA
 
 
@@ -17,6 +28,8 @@ def mock_hub():
     hub.hub_name = "Test Hub"
     hub.device_type = "MT"
     hub.async_get_sensor_data = AsyncMock(return_value=MOCK_PROCESSED_SENSOR_DATA)
+    hub.organization_hub.readings_cadence.side_effect = CadenceTracker
+    hub.organization_hub.sensor_readings_fresh = False
     return hub
 
 
@@ -236,3 +249,137 @@ class TestMerakiSensorCoordinator:
         assert data == partial_data
         assert "Q2XX-XXXX-XXXX" in data
         assert "Q2YY-YYYY-YYYY" not in data
+
+    async def test_update_aligns_to_reporting_phase(self, coordinator, mock_hub):
+        """Regular sample timestamps move the next fetch just after the phase."""
+        minute = dt_util.utcnow().replace(second=0, microsecond=0)
+        for cycle in range(12, 0, -1):
+            ts = minute - timedelta(minutes=cycle) + timedelta(seconds=12)
+            mock_hub.async_get_sensor_data.return_value = {
+                "Q2XX-XXXX-XXXX": {
+                    "readings": [
+                        {
+                            "metric": "temperature",
+                            "ts": ts.isoformat().replace("+00:00", "Z"),
+                            "temperature": {"celsius": 21.0},
+                        }
+                    ]
+                }
+            }
+            await coordinator._async_update_data()
+
+        assert coordinator.cadence.phase == pytest.approx(12)
+        assert coordinator.cadence.aligned is True
+        assert 1 <= coordinator.update_interval.total_seconds() <= 60
+        assert mock_hub.async_get_sensor_data.call_args.kwargs["max_age"] is not None
+
+    async def test_unchanged_timestamps_keep_fixed_interval(
+        self, coordinator, mock_hub
+    ):
+        """Repeated timestamps add no samples, so the fixed interval is kept."""
+        mock_hub.async_get_sensor_data.return_value = {
+            "Q2XX-XXXX-XXXX": {
+                "readings": [
+                    {"metric": "temperature", "ts": "2024-01-01T12:00:12Z"},
+                ]
+            }
+        }
+        for _ in range(12):
+            await coordinator._async_update_data()
+
+        assert coordinator.cadence.phase is None
+        assert coordinator.update_interval.total_seconds() == 60
+        mock_hub.async_get_sensor_data.assert_called_with(max_age=None)
+
+    async def test_stale_readings_past_threshold(
+        self, hass: HomeAssistant, mock_hub, mock_devices
+    ):
+        """Readings older than the staleness threshold are reported stale."""
+        entry = MockConfigEntry(
+            domain=DOMAIN, data={}, options={CONF_STALE_READING_THRESHOLD: 600}
+        )
+        coordinator = MerakiSensorCoordinator(
+            hass=hass,
+            hub=mock_hub,
+            devices=mock_devices,
+            scan_interval=60,
+            config_entry=entry,
+        )
+        now = dt_util.utcnow()
+        mock_hub.async_get_sensor_data.return_value = {
+            "Q2XX-XXXX-XXXX": {
+                "readings": [
+                    {
+                        "metric": "temperature",
+                        "ts": (now - timedelta(hours=2)).isoformat(),
+                        "temperature": {"celsius": 21.0},
+                    },
+                    {
+                        "metric": "humidity",
+                        "ts": (now - timedelta(minutes=1)).isoformat(),
+                        "humidity": {"relativePercentage": 40},
+                    },
+                ]
+            },
+            "Q2YY-YYYY-YYYY": {
+                "readings": [
+                    {
+                        "metric": "door",
+                        "ts": (now - timedelta(days=1)).isoformat(),
+                        "door": {"open": False},
+                    }
+                ]
+            },
+        }
+        await coordinator._async_update_data()
+
+        assert coordinator.reading_is_stale("Q2XX-XXXX-XXXX", "temperature") is True
+        assert coordinator.reading_is_stale("Q2XX-XXXX-XXXX", "humidity") is False
+        assert coordinator.reading_is_stale("Q2XX-XXXX-XXXX") is False
+        # Door readings are only sent on change
+        assert coordinator.reading_is_stale("Q2YY-YYYY-YYYY", "door") is False
+
+    async def test_staleness_disabled_by_default(self, coordinator, mock_hub):
+        """Without a threshold no reading is stale."""
+        mock_hub.async_get_sensor_data.return_value = {
+            "Q2XX-XXXX-XXXX": {
+                "readings": [{"metric": "temperature", "ts": "2020-01-01T00:00:00Z"}]
+            }
+        }
+        await coordinator._async_update_data()
+
+        assert coordinator.reading_is_stale("Q2XX-XXXX-XXXX", "temperature") is False
+
+    async def test_adaptive_interval_skips_ticks_until_due(
+        self, hass: HomeAssistant, mock_hub, mock_devices
+    ):
+        """Adaptive mode ticks at the minimum and skips fetches not yet due."""
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={},
+            options={
+                CONF_ADAPTIVE_SCAN_INTERVAL_ENABLED: True,
+                CONF_ADAPTIVE_SCAN_INTERVAL_MIN: 30,
+                CONF_ADAPTIVE_SCAN_INTERVAL_MAX: 300,
+            },
+        )
+        mock_hub.organization_hub.sensor_readings_fresh = False
+        coordinator = MerakiSensorCoordinator(
+            hass=hass,
+            hub=mock_hub,
+            devices=mock_devices,
+            scan_interval=60,
+            config_entry=entry,
+        )
+        assert coordinator.update_interval.total_seconds() == 30
+        assert coordinator.adaptive_interval.interval == 60
+
+        coordinator.data = await coordinator._async_update_data()
+        assert await coordinator._async_update_data() is coordinator.data
+        assert mock_hub.async_get_sensor_data.await_count == 1
+        assert coordinator.adaptive_interval.skipped_ticks == 1
+
+        # Another hub already fetched the org snapshot: fetching is free.
+        mock_hub.organization_hub.sensor_readings_fresh = True
+        await coordinator._async_update_data()
+        assert mock_hub.async_get_sensor_data.await_count == 2
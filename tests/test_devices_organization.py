@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock
 
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
 from custom_components.meraki_dashboard.const import (
     ORG_SENSOR_API_CALLS_PER_MINUTE,
     ORG_SENSOR_API_RATE_LIMIT_QUEUE_DEPTH,
@@ -69,3 +74,81 @@ def test_org_rate_limit_sensors_report_values() -> None:
     assert attrs["window_minutes"] == 60
     assert attrs["total_throttle_events"] == 12
     assert attrs["last_throttle_wait_seconds"] == 1.5
+
+
+async def test_org_metrics_sensor_writes_only_on_change_rate_limited(
+    hass: HomeAssistant,
+) -> None:
+    org_hub = _make_org_hub()
+    org_hub.diagnostic_update_interval = 10.0
+    listeners: list = []
+
+    def _add_listener(listener):
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    org_hub.async_add_metrics_listener = _add_listener
+    queue_depth = MerakiHubApiRateLimitQueueDepthSensor(
+        org_hub,
+        ORG_HUB_SENSOR_DESCRIPTIONS[ORG_SENSOR_API_RATE_LIMIT_QUEUE_DEPTH],
+        "test_entry",
+    )
+    queue_depth.hass = hass
+    queue_depth.entity_id = "sensor.test_organization_api_rate_limit_queue_depth"
+    queue_depth.async_write_ha_state = MagicMock()
+    await queue_depth.async_added_to_hass()
+    assert queue_depth.should_poll is False
+    assert len(listeners) == 1
+
+    # Unchanged value: no write
+    listeners[0]()
+    queue_depth.async_write_ha_state.assert_not_called()
+
+    # Changes inside the write interval coalesce into one deferred write
+    org_hub.api_rate_limit_queue_depth = 8
+    listeners[0]()
+    org_hub.api_rate_limit_queue_depth = 9
+    listeners[0]()
+    queue_depth.async_write_ha_state.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    queue_depth.async_write_ha_state.assert_called_once()
+    assert queue_depth.native_value == 9
+
+    await queue_depth.async_remove()
+    assert listeners == []
+
+
+async def test_org_metrics_sensor_decay_recheck_does_not_delay_changes(
+    hass: HomeAssistant,
+) -> None:
+    org_hub = _make_org_hub()
+    org_hub.diagnostic_update_interval = 10.0
+    listeners: list = []
+
+    def _add_listener(listener):
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    org_hub.async_add_metrics_listener = _add_listener
+    calls_per_minute = MerakiHubApiCallsPerMinuteSensor(
+        org_hub,
+        ORG_HUB_SENSOR_DESCRIPTIONS[ORG_SENSOR_API_CALLS_PER_MINUTE],
+        "test_entry",
+    )
+    calls_per_minute.hass = hass
+    calls_per_minute.entity_id = "sensor.test_organization_api_calls_per_minute"
+    calls_per_minute.async_write_ha_state = MagicMock()
+    await calls_per_minute.async_added_to_hass()
+
+    # A decay re-check is pending for the non-zero value, but a change once
+    # the write interval has passed is written straight away
+    assert calls_per_minute._pending_decay_recheck is not None
+    calls_per_minute._last_write_time -= 11
+    org_hub.api_calls_per_minute = 43
+    listeners[0]()
+    calls_per_minute.async_write_ha_state.assert_called_once()
+
+    await calls_per_minute.async_remove()
+    assert calls_per_minute._pending_decay_recheck is None
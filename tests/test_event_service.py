@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.meraki_dashboard.const import (
+    DOMAIN,
     EVENT_DEVICE_ID,
     EVENT_DEVICE_SERIAL,
     EVENT_SENSOR_TYPE,
+    EVENT_TIMESTAMP,
     EVENT_TYPE,
     EVENT_VALUE,
     MT_SENSOR_BUTTON,
@@ -23,6 +26,7 @@ from custom_components.meraki_dashboard.services import (
     EventThrottle,
     MerakiEventService,
 )
+from custom_components.meraki_dashboard.services import event_service as event_module
 
 
 class TestEventSubscriber(EventSubscriber):
@@ -37,6 +41,14 @@ class TestEventSubscriber(EventSubscriber):
         self.events_received.append({"type": event_type, "data": data})
 
 
+class SlowEventSubscriber(EventSubscriber):
+    """Subscriber that never finishes handling an event in time."""
+
+    async def handle_event(self, event_type: str, data: dict) -> None:
+        """Handle an incoming event slowly."""
+        await asyncio.sleep(10)
+
+
 class TestEventFilter:
     """Test event filtering functionality."""
 
@@ -132,6 +144,32 @@ class TestEventThrottle:
 
         assert len(throttle._last_event_times) == 0
 
+    def test_throttle_expires_on_monotonic_clock(self):
+        """Keys are released and forgotten once their window has passed."""
+        now = 0.0
+        throttle = EventThrottle(min_interval_seconds=1.0, clock=lambda: now)
+
+        assert throttle.should_allow("key1")
+        now = 0.5
+        assert not throttle.should_allow("key1")
+        now = 1.0
+        assert throttle.should_allow("key2")
+        # key1's window closed, so it was dropped while handling key2
+        assert list(throttle._last_event_times) == ["key2"]
+        assert throttle.should_allow("key1")
+
+    def test_throttle_memory_bounded(self):
+        """The oldest keys are dropped beyond max_entries."""
+        throttle = EventThrottle(
+            min_interval_seconds=60.0, max_entries=2, clock=lambda: 0.0
+        )
+
+        for key in ("key1", "key2", "key3"):
+            assert throttle.should_allow(key)
+
+        assert len(throttle._last_event_times) == 2
+        assert "key1" not in throttle._last_event_times
+
 
 class TestMerakiEventService:
     """Test the Meraki event service."""
@@ -221,6 +259,53 @@ class TestMerakiEventService:
         assert len(subscriber1.events_received) == 1  # No new event
         assert len(subscriber2.events_received) == 2  # New event
 
+    async def test_publish_event_routes_by_serial(self, event_service):
+        """Only subscriptions routed to the event's serial are checked."""
+        other_filter = MagicMock(wraps=EventFilter(device_serials=["XYZ789"]))
+        other_filter.device_serials = {"XYZ789"}
+        other_filter.sensor_types = None
+        event_service.subscribe("button_pressed", TestEventSubscriber(), other_filter)
+        by_serial = TestEventSubscriber()
+        event_service.subscribe(
+            "button_pressed", by_serial, EventFilter(device_serials=["ABC123"])
+        )
+        by_sensor = TestEventSubscriber()
+        event_service.subscribe(
+            "button_pressed", by_sensor, EventFilter(sensor_types=[MT_SENSOR_BUTTON])
+        )
+        door_only = TestEventSubscriber()
+        event_service.subscribe(
+            "button_pressed", door_only, EventFilter(sensor_types=[MT_SENSOR_DOOR])
+        )
+
+        await event_service.publish_event(
+            "button_pressed",
+            {EVENT_DEVICE_SERIAL: "ABC123", EVENT_SENSOR_TYPE: MT_SENSOR_BUTTON},
+        )
+
+        other_filter.matches.assert_not_called()
+        assert len(by_serial.events_received) == 1
+        assert len(by_sensor.events_received) == 1
+        assert door_only.events_received == []
+
+    async def test_unsubscribe_removes_routes(self, event_service):
+        """Unsubscribing drops the subscription from every routing bucket."""
+        subscriber = TestEventSubscriber()
+        unsubscribe = event_service.subscribe(
+            "door_opened", subscriber, EventFilter(device_serials=["A", "B"])
+        )
+        keep = event_service.subscribe("door_opened", TestEventSubscriber())
+        assert len(event_service._routes) == 3
+
+        unsubscribe()
+        unsubscribe()
+
+        assert list(event_service._routes) == [("door_opened", None, None)]
+        assert len(event_service._subscribers["door_opened"]) == 1
+        keep()
+        assert event_service._routes == {}
+        assert "door_opened" not in event_service._subscribers
+
     async def test_event_throttling(self, event_service, hass):
         """Test event throttling."""
         # Publish same event rapidly
@@ -234,6 +319,27 @@ class TestMerakiEventService:
         # Only first event should be fired
         assert hass.bus.async_fire.call_count == 1
 
+    async def test_event_throttling_keys_on_state_not_time(self, event_service, hass):
+        """Repeats of one state are throttled even with distinct timestamps."""
+        for value, timestamp in (
+            ("short", "2026-01-01T00:00:05Z"),
+            ("short", "2026-01-01T00:00:06Z"),
+            ("long", "2026-01-01T00:00:07Z"),
+        ):
+            await event_service.publish_event(
+                "button_pressed",
+                {
+                    EVENT_DEVICE_SERIAL: "ABC123",
+                    EVENT_VALUE: value,
+                    EVENT_TIMESTAMP: timestamp,
+                },
+            )
+
+        fired = [
+            call.args[1][EVENT_VALUE] for call in hass.bus.async_fire.call_args_list
+        ]
+        assert fired == ["short", "long"]
+
     async def test_track_sensor_changes_no_device(self, event_service):
         """Test tracking sensor changes with no device in registry."""
         with patch(
@@ -302,6 +408,364 @@ class TestMerakiEventService:
             assert call_args[1][EVENT_DEVICE_ID] == "device_123"
             assert not call_args[1][EVENT_VALUE]
 
+    async def test_device_id_index_seeded_once(self, event_service):
+        """Serials resolve from one registry scan, including prefixed identifiers."""
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            device = MagicMock(id="device_123", identifiers={(DOMAIN, "entry_ABC123")})
+            mock_registry = MagicMock()
+            mock_registry.devices.values.return_value = [device]
+            mock_dr.async_get.return_value = mock_registry
+
+            for _ in range(3):
+                assert (
+                    await event_service._get_device_id("ABC123", {"domain": DOMAIN})
+                    == "device_123"
+                )
+
+            mock_registry.devices.values.assert_called_once()
+            mock_registry.async_get_device.assert_not_called()
+
+    async def test_device_id_miss_cached_until_registry_changes(self, event_service):
+        """Unregistered serials are looked up once until a device is added."""
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_registry = MagicMock()
+            mock_registry.devices.values.return_value = []
+            mock_registry.async_get_device.return_value = None
+            mock_dr.async_get.return_value = mock_registry
+
+            assert await event_service._get_device_id("ABC123", {}) is None
+            assert await event_service._get_device_id("ABC123", {}) is None
+            assert mock_registry.async_get_device.call_count == 1
+
+            # A device registered later is picked up from the registry event
+            mock_registry.async_get.return_value = MagicMock(
+                identifiers={(DOMAIN, "entry_ABC123")}
+            )
+            event = MagicMock(data={"action": "create", "device_id": "device_new"})
+            event_service._async_handle_device_registry_updated(event)
+            assert await event_service._get_device_id("ABC123", {}) == "device_new"
+
+            # Removing it drops the mapping again
+            event = MagicMock(data={"action": "remove", "device_id": "device_new"})
+            event_service._async_handle_device_registry_updated(event)
+            assert await event_service._get_device_id("ABC123", {}) is None
+
+    async def test_stop_removes_registry_listener(self, event_service, hass):
+        """Stopping the service unsubscribes from device registry events."""
+        unsub = MagicMock()
+        hass.bus.async_listen.return_value = unsub
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.devices.values.return_value = []
+            await event_service._get_device_id("ABC123", {})
+
+        await event_service.async_stop()
+
+        unsub.assert_called_once()
+
+    async def test_backfill_replays_transitions_between_polls(self, hass):
+        """Presses and door cycles hidden between two polls are replayed."""
+
+        def door(ts, is_open):
+            return {
+                "metric": MT_SENSOR_DOOR,
+                "ts": ts,
+                MT_SENSOR_DOOR: {"open": is_open},
+            }
+
+        def button(ts, press_type="short"):
+            return {
+                "metric": MT_SENSOR_BUTTON,
+                "ts": ts,
+                MT_SENSOR_BUTTON: {"pressType": press_type},
+            }
+
+        fetch_history = AsyncMock(
+            return_value=[
+                {"serial": "ABC123", **door("2026-01-01T00:00:10Z", True)},
+                {"serial": "ABC123", **door("2026-01-01T00:00:20Z", False)},
+                {"serial": "ABC123", **button("2026-01-01T00:00:05Z")},
+                {"serial": "ABC123", **button("2026-01-01T00:00:25Z", "long")},
+            ]
+        )
+        hass.async_create_background_task.side_effect = lambda target, name: (
+            asyncio.create_task(target)
+        )
+        event_service = MerakiEventService(hass, fetch_history=fetch_history)
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            await event_service.track_sensor_changes(
+                "ABC123",
+                [door("2026-01-01T00:00:00Z", False), button("2026-01-01T00:00:00Z")],
+                {"domain": DOMAIN},
+            )
+            await event_service.track_sensor_changes(
+                "ABC123",
+                [
+                    door("2026-01-01T00:00:30Z", False),
+                    button("2026-01-01T00:00:25Z", "long"),
+                ],
+                {"domain": DOMAIN},
+            )
+
+        # Held for the background task, which fetches in one call from the
+        # oldest poll
+        assert hass.bus.async_fire.call_count == 0
+        hass.async_create_background_task.assert_called_once()
+        await event_service._backfill_task
+        fetch_history.assert_awaited_once_with(
+            ["ABC123"], [MT_SENSOR_BUTTON, MT_SENSOR_DOOR], "2026-01-01T00:00:00Z"
+        )
+
+        fired = [
+            (call.args[1][EVENT_TYPE], call.args[1][EVENT_TIMESTAMP])
+            for call in hass.bus.async_fire.call_args_list
+        ]
+        assert sorted(fired) == [
+            ("button_pressed", "2026-01-01T00:00:05Z"),
+            ("button_pressed", "2026-01-01T00:00:25Z"),
+            ("door_closed", "2026-01-01T00:00:20Z"),
+            ("door_opened", "2026-01-01T00:00:10Z"),
+        ]
+
+    async def test_backfill_replays_repeated_presses(self, hass):
+        """Each replayed press is published even though the value repeats."""
+
+        def button(ts):
+            return {
+                "metric": MT_SENSOR_BUTTON,
+                "ts": ts,
+                MT_SENSOR_BUTTON: {"pressType": "short"},
+            }
+
+        fetch_history = AsyncMock(
+            return_value=[
+                {"serial": "ABC123", **button("2026-01-01T00:00:05Z")},
+                {"serial": "ABC123", **button("2026-01-01T00:00:15Z")},
+            ]
+        )
+        hass.async_create_background_task.side_effect = lambda target, name: (
+            asyncio.create_task(target)
+        )
+        event_service = MerakiEventService(hass, fetch_history=fetch_history)
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            await event_service.track_sensor_changes(
+                "ABC123", [button("2026-01-01T00:00:00Z")], {"domain": DOMAIN}
+            )
+            await event_service.track_sensor_changes(
+                "ABC123", [button("2026-01-01T00:00:25Z")], {"domain": DOMAIN}
+            )
+        await event_service._backfill_task
+
+        fired = [
+            call.args[1][EVENT_TIMESTAMP] for call in hass.bus.async_fire.call_args_list
+        ]
+        assert fired == [
+            "2026-01-01T00:00:05Z",
+            "2026-01-01T00:00:15Z",
+            "2026-01-01T00:00:25Z",
+        ]
+
+    async def test_backfill_failure_publishes_latest_change(self, hass):
+        """A failed history call still publishes the change between polls."""
+        fetch_history = AsyncMock(side_effect=Exception("rate limited"))
+        hass.async_create_background_task.side_effect = lambda target, name: (
+            asyncio.create_task(target)
+        )
+        event_service = MerakiEventService(hass, fetch_history=fetch_history)
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            for ts, is_open in (
+                ("2026-01-01T00:00:00Z", False),
+                ("2026-01-01T00:00:30Z", True),
+            ):
+                await event_service.track_sensor_changes(
+                    "ABC123",
+                    [
+                        {
+                            "metric": MT_SENSOR_DOOR,
+                            "ts": ts,
+                            MT_SENSOR_DOOR: {"open": is_open},
+                        }
+                    ],
+                    {"domain": DOMAIN},
+                )
+
+        await event_service._backfill_task
+
+        hass.bus.async_fire.assert_called_once()
+        assert hass.bus.async_fire.call_args.args[1][EVENT_TYPE] == "door_opened"
+
+    async def test_no_backfill_within_one_fetch_interval(self, hass):
+        """A ts that moved by at most one fetch interval is published directly."""
+        fetch_history = AsyncMock(return_value=[])
+        event_service = MerakiEventService(
+            hass, fetch_history=fetch_history, fetch_interval=60
+        )
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            for ts, is_open in (
+                ("2026-01-01T00:00:00Z", False),
+                ("2026-01-01T00:01:00Z", True),
+            ):
+                await event_service.track_sensor_changes(
+                    "ABC123",
+                    [
+                        {
+                            "metric": MT_SENSOR_DOOR,
+                            "ts": ts,
+                            MT_SENSOR_DOOR: {"open": is_open},
+                        }
+                    ],
+                    {"domain": DOMAIN},
+                )
+
+        hass.async_create_background_task.assert_not_called()
+        fetch_history.assert_not_awaited()
+        hass.bus.async_fire.assert_called_once()
+        assert hass.bus.async_fire.call_args.args[1][EVENT_TYPE] == "door_opened"
+
+    async def test_started_service_publishes_from_queue(self, event_service, hass):
+        """Detected events are queued and published by the drain task."""
+        hass.async_create_background_task.side_effect = lambda target, name: (
+            asyncio.create_task(target)
+        )
+        event_service.async_start()
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            for value in (False, True):
+                await event_service.track_sensor_changes(
+                    "ABC123",
+                    [{"metric": MT_SENSOR_DOOR, "value": value}],
+                    {"domain": DOMAIN},
+                )
+
+        # Queued, not yet published by the tick that detected it
+        assert hass.bus.async_fire.call_count == 0
+        await asyncio.sleep(0)
+        assert hass.bus.async_fire.call_count == 1
+        assert hass.bus.async_fire.call_args[0][1][EVENT_TYPE] == "door_opened"
+
+        await event_service.async_stop()
+
+    async def test_event_queue_overflow_counted(self, event_service, hass, monkeypatch):
+        """Events beyond the queue bound are dropped and counted."""
+        monkeypatch.setattr(event_module, "EVENT_QUEUE_MAXSIZE", 1)
+        hass.async_create_background_task.side_effect = lambda target, name: (
+            asyncio.create_task(target)
+        )
+        event_service.async_start()
+
+        for serial in ("ABC123", "DEF456", "XYZ789"):
+            await event_service._async_emit(
+                "door_opened", {EVENT_DEVICE_SERIAL: serial}
+            )
+
+        assert event_service.dropped_events == 2
+        await event_service.async_stop()
+
+    async def test_slow_subscriber_times_out(self, event_service, monkeypatch):
+        """Subscribers run concurrently and a slow one is abandoned."""
+        monkeypatch.setattr(event_module, "EVENT_SUBSCRIBER_TIMEOUT_SECONDS", 0.01)
+        subscriber = TestEventSubscriber()
+        event_service.subscribe("button_pressed", SlowEventSubscriber())
+        event_service.subscribe("button_pressed", subscriber)
+
+        await event_service.publish_event(
+            "button_pressed", {EVENT_DEVICE_SERIAL: "ABC123"}
+        )
+
+        assert len(subscriber.events_received) == 1
+        assert event_service.subscriber_timeouts == 1
+
+    async def test_track_nested_reading_shape(self, event_service, hass):
+        """State is read from the API's nested payload, not a flat value."""
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            for is_open, ts in (
+                (False, "2024-01-01T00:00:00Z"),
+                (True, "2024-01-01T00:01:00Z"),
+            ):
+                await event_service.track_sensor_changes(
+                    "ABC123",
+                    [{"metric": MT_SENSOR_DOOR, "ts": ts, "door": {"open": is_open}}],
+                    {"domain": DOMAIN},
+                )
+
+        assert hass.bus.async_fire.call_count == 1
+        data = hass.bus.async_fire.call_args[0][1]
+        assert data[EVENT_TYPE] == "door_opened"
+        assert data[EVENT_VALUE] is True
+
+    async def test_repeated_button_press_detected(self, event_service, hass):
+        """Each new button reading is a press even though the value repeats."""
+        with patch(
+            "custom_components.meraki_dashboard.services.event_service.dr"
+        ) as mock_dr:
+            mock_dr.async_get.return_value.async_get_device.return_value = MagicMock(
+                id="device_123"
+            )
+            for ts in ("2024-01-01T00:00:00Z", "2024-01-01T00:01:00Z"):
+                await event_service.track_sensor_changes(
+                    "ABC123",
+                    [
+                        {
+                            "metric": MT_SENSOR_BUTTON,
+                            "ts": ts,
+                            "button": {"pressType": "short"},
+                        }
+                    ],
+                    {"domain": DOMAIN},
+                )
+
+        assert hass.bus.async_fire.call_count == 1
+        assert hass.bus.async_fire.call_args[0][1][EVENT_TYPE] == "button_pressed"
+
+    async def test_unchanged_snapshot_skipped(self, event_service):
+        """The same readings list from an unchanged snapshot is not re-diffed."""
+        readings = [{"metric": MT_SENSOR_DOOR, "door": {"open": False}}]
+        with patch.object(
+            event_service, "_get_device_id", return_value="device_123"
+        ) as get_device_id:
+            await event_service.track_sensor_changes("ABC123", readings, {})
+            await event_service.track_sensor_changes("ABC123", readings, {})
+
+        assert get_device_id.await_count == 1
+        assert event_service._previous_states[("ABC123", MT_SENSOR_DOOR)] == (
+            False,
+            None,
+        )
+
     def test_determine_event_type(self, event_service):
         """Test event type determination."""
         # Button events
@@ -345,16 +809,16 @@ class TestMerakiEventService:
     def test_clear_device_history(self, event_service):
         """Test clearing device history."""
         # Add some state
-        event_service._previous_states["ABC123_button"] = {"value": True}
-        event_service._previous_states["ABC123_door"] = {"value": False}
-        event_service._previous_states["XYZ789_button"] = {"value": True}
+        event_service._previous_states[("ABC123", "button")] = (True, None)
+        event_service._previous_states[("ABC123", "door")] = (False, None)
+        event_service._previous_states[("XYZ789", "button")] = (True, None)
         event_service._logged_missing_devices.add("ABC123")
 
         # Clear ABC123
         event_service.clear_device_history("ABC123")
 
         # Check only ABC123 entries were removed
-        assert "ABC123_button" not in event_service._previous_states
-        assert "ABC123_door" not in event_service._previous_states
-        assert "XYZ789_button" in event_service._previous_states
+        assert ("ABC123", "button") not in event_service._previous_states
+        assert ("ABC123", "door") not in event_service._previous_states
+        assert ("XYZ789", "button") in event_service._previous_states
         assert "ABC123" not in event_service._logged_missing_devices
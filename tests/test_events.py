@@ -175,8 +175,8 @@ class TestMerakiEventHandler:
             )
 
         # Should have separate state tracking for each device
-        assert "Q2XX-XXXX-XXXX_door" in event_handler._previous_states
-        assert "Q2YY-YYYY-YYYY_water" in event_handler._previous_states
+        assert ("Q2XX-XXXX-XXXX", "door") in event_handler._previous_states
+        assert ("Q2YY-YYYY-YYYY", "water") in event_handler._previous_states
         assert len(event_handler._previous_states) == 2
 
     def test_empty_sensor_readings(self, event_handler, sample_device_info):
@@ -251,7 +251,7 @@ class TestMerakiEventHandler:
             )
 
         # Verify state was stored
-        assert "Q2XX-XXXX-XXXX_door" in event_handler._previous_states
+        assert ("Q2XX-XXXX-XXXX", "door") in event_handler._previous_states
 
         # Different device should not interfere
         with patch("homeassistant.core.EventBus.async_fire"):
@@ -266,8 +266,8 @@ class TestMerakiEventHandler:
             )
 
         # Original device state should still be there
-        assert "Q2XX-XXXX-XXXX_door" in event_handler._previous_states
-        assert "Q2YY-YYYY-YYYY_door" in event_handler._previous_states
+        assert ("Q2XX-XXXX-XXXX", "door") in event_handler._previous_states
+        assert ("Q2YY-YYYY-YYYY", "door") in event_handler._previous_states
 
 
 class TestEventConstants:
@@ -0,0 +1,106 @@
+"""Tests for the forced org-wide readings refresh and its service."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.meraki_dashboard import async_register_services
+from custom_components.meraki_dashboard.const import DOMAIN, SERVICE_FORCE_REFRESH
+
+
+def _coordinator(network_id: str) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.hub.network_id = network_id
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_bypasses_cache_with_one_fetch(org_hub_factory):
+    """A forced refresh refetches inside the TTL, once, for every coordinator."""
+    hub = await org_hub_factory()
+    api = AsyncMock(return_value=[{"serial": "Q2XX-AAAA-0001", "readings": []}])
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = api
+    await hub.async_get_all_sensor_readings()
+    coordinators = [_coordinator("N1"), _coordinator("N2")]
+
+    await hub.async_force_refresh(coordinators)
+
+    assert api.await_count == 2
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_waits_for_prefetch_and_serves_coordinators(
+    org_hub_factory,
+):
+    """An in-flight prefetch lands first and coordinators reuse the forced fetch."""
+    hub = await org_hub_factory()
+    active = []
+    peak = 0
+
+    async def _fetch(*args, **kwargs):
+        nonlocal peak
+        active.append(None)
+        peak = max(peak, len(active))
+        await asyncio.sleep(0)
+        active.pop()
+        return [{"serial": "Q2XX-AAAA-0001", "readings": []}]
+
+    api = AsyncMock(side_effect=_fetch)
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = api
+
+    async def _refresh():
+        # A zero cache age would normally force a fetch of its own
+        await hub.async_get_all_sensor_readings(max_age=0)
+
+    coordinators = [_coordinator("N1"), _coordinator("N2")]
+    for coordinator in coordinators:
+        coordinator.async_refresh.side_effect = _refresh
+
+    hub._start_readings_prefetch()
+    await hub.async_force_refresh(coordinators)
+
+    assert api.await_count == 2
+    assert peak == 1
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_awaited_once()
+
+
+async def test_force_refresh_service_scoped_to_network(hass: HomeAssistant):
+    """The service refreshes only the coordinators of the requested network."""
+    org_hub = MagicMock()
+    org_hub.async_force_refresh = AsyncMock()
+    office, warehouse = _coordinator("N1"), _coordinator("N2")
+    hass.data[DOMAIN] = {
+        "entry": {
+            "organization_hub": org_hub,
+            "coordinators": {"N1_MT": office, "N2_MT": warehouse},
+        }
+    }
+    await async_register_services(hass)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_FORCE_REFRESH, {"network_id": "N2"}, blocking=True
+    )
+    org_hub.async_force_refresh.assert_awaited_once_with([warehouse])
+
+    await hass.services.async_call(DOMAIN, SERVICE_FORCE_REFRESH, {}, blocking=True)
+    org_hub.async_force_refresh.assert_awaited_with([office, warehouse])
+
+
+async def test_force_refresh_service_unknown_network(hass: HomeAssistant):
+    """An unknown network ID is rejected."""
+    hass.data[DOMAIN] = {}
+    await async_register_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_FORCE_REFRESH, {"network_id": "N9"}, blocking=True
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -26,6 +27,9 @@ def mock_organization_hub():
     org_hub.hass = Mock()
     org_hub.hass.loop = Mock()
     org_hub.hass.loop.time = Mock(return_value=0.0)
+    org_hub.hass.async_create_task.side_effect = lambda target, name: (
+        asyncio.create_task(target)
+    )
     org_hub.dashboard = Mock()
     org_hub.organization_id = "test_org_id"
     org_hub.total_api_calls = 0
@@ -578,3 +582,50 @@ class TestNetworkHubEdgeCases:
         )  # Original name preserved
         assert network_hub.devices[0]["network_id"] == "test_network_id"
         assert network_hub.devices[0]["network_name"] == "Test Network"
+
+
+class TestNetworkHubDeviceIndex:
+    """Test the serial/model index maintained by the network hub."""
+
+    def test_index_follows_inventory(self, network_hub):
+        """Test assigning a new inventory rebuilds the index."""
+        network_hub.devices = [
+            {"serial": "Q2XX-0001", "model": "MT15"},
+            {"serial": "Q2XX-0002", "model": "mt40"},
+            {"serial": "Q2XX-0003", "model": "MT14"},
+        ]
+
+        assert network_hub.device_index.version == 1
+        assert network_hub.get_device("Q2XX-0003")["model"] == "MT14"
+        assert network_hub.get_device("missing") is None
+        by_model = network_hub.get_devices_by_model("MT15", "MT40")
+        assert [d["serial"] for d in by_model] == ["Q2XX-0001", "Q2XX-0002"]
+
+    def test_unchanged_inventory_keeps_version(self, network_hub):
+        """Test rediscovering the same inventory does not rebuild the index."""
+        network_hub.devices = [{"serial": "Q2XX-0001", "model": "MT15"}]
+        index = network_hub.device_index
+
+        network_hub.devices = [{"serial": "Q2XX-0001", "model": "MT15"}]
+
+        assert network_hub.device_index is index
+        assert index.version == 1
+
+    def test_is_device_online_uses_status_index(
+        self, network_hub, mock_organization_hub
+    ):
+        """Test device status lookups follow the org hub's status list."""
+        mock_organization_hub.device_statuses = [
+            {"serial": "Q2XX-0001", "status": "offline"},
+            {"serial": "Q2XX-0002", "status": "alerting"},
+        ]
+
+        assert not network_hub._is_device_online("Q2XX-0001")
+        assert network_hub._is_device_online("Q2XX-0002")
+        assert network_hub._is_device_online("Q2XX-9999")
+
+        mock_organization_hub.device_statuses = [
+            {"serial": "Q2XX-0001", "status": "online"},
+        ]
+
+        assert network_hub._is_device_online("Q2XX-0001")
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
-from custom_components.meraki_dashboard.const import DEFAULT_BASE_URL, DOMAIN
+from custom_components.meraki_dashboard.const import (
+    CONF_GATEWAY_CONNECTIONS_INTERVAL,
+    DEFAULT_BASE_URL,
+    DOMAIN,
+)
 from custom_components.meraki_dashboard.exceptions import MerakiApiError
+from custom_components.meraki_dashboard.hubs import network as network_module
 from custom_components.meraki_dashboard.hubs.network import MerakiNetworkHub
 
 
@@ -118,7 +124,32 @@ async def test_sensor_data_survives_gateway_connections_failure(org_hub_factory)
     assert result["Q2XX-AAAA-0001"]["last_connected_at"] is None
 
 
-def _make_config_entry():
+@pytest.mark.asyncio
+async def test_sensor_data_does_not_mutate_org_snapshot(org_hub_factory):
+    """Gateway data is merged into per-hub copies, never the shared snapshot."""
+    org_hub = await org_hub_factory()
+    entry = _make_config_entry()
+
+    net_hub = MerakiNetworkHub(org_hub, "N1", "Net 1", "MT", entry)
+    net_hub.devices = [{"serial": "Q2XX-AAAA-0001", "model": "MT14"}]
+
+    snapshot = {
+        "Q2XX-AAAA-0001": {"serial": "Q2XX-AAAA-0001", "readings": []},
+        "Q2XX-BBBB-0001": {"serial": "Q2XX-BBBB-0001", "readings": []},
+    }
+    org_hub.async_get_all_sensor_readings = AsyncMock(return_value=snapshot)
+    org_hub.async_get_all_gateway_connections = AsyncMock(
+        return_value={"Q2XX-AAAA-0001": {"rssi": -60, "last_connected_at": None}}
+    )
+
+    result = await net_hub.async_get_sensor_data()
+
+    assert set(result) == {"Q2XX-AAAA-0001"}
+    assert result["Q2XX-AAAA-0001"]["rssi"] == -60
+    assert "rssi" not in snapshot["Q2XX-AAAA-0001"]
+
+
+def _make_config_entry(options=None):
     from pytest_homeassistant_custom_component.common import MockConfigEntry
 
     from custom_components.meraki_dashboard.const import (
@@ -134,7 +165,7 @@ def _make_config_entry():
             CONF_BASE_URL: DEFAULT_BASE_URL,
             CONF_ORGANIZATION_ID: "test_org_123",
         },
-        options={},
+        options=options or {},
         unique_id="test_org_123",
     )
 
@@ -207,3 +238,127 @@ async def test_sensor_data_filters_to_hub_devices(org_hub_factory):
     result = await net_hub.async_get_sensor_data()
 
     assert set(result) == {"Q2XX-AAAA-0001"}
+
+
+@pytest.mark.asyncio
+async def test_sensor_data_fetches_readings_and_gateways_concurrently(org_hub_factory):
+    """Both org-wide fetches are in flight together on a cold tick."""
+    org_hub = await org_hub_factory()
+    entry = _make_config_entry()
+
+    net_hub = MerakiNetworkHub(org_hub, "N1", "Net 1", "MT", entry)
+    net_hub.devices = [{"serial": "Q2XX-AAAA-0001", "model": "MT14"}]
+
+    gateway_started = asyncio.Event()
+
+    async def _gateways():
+        gateway_started.set()
+        return {"Q2XX-AAAA-0001": {"rssi": -61, "last_connected_at": None}}
+
+    async def _readings(max_age=None):
+        # Readings only resolve once the gateway fetch has started.
+        await asyncio.wait_for(gateway_started.wait(), timeout=1)
+        return {"Q2XX-AAAA-0001": {"serial": "Q2XX-AAAA-0001", "readings": []}}
+
+    org_hub.async_get_all_sensor_readings = _readings
+    org_hub.async_get_all_gateway_connections = _gateways
+
+    result = await net_hub.async_get_sensor_data()
+
+    assert result["Q2XX-AAAA-0001"]["rssi"] == -61
+
+
+@pytest.mark.asyncio
+async def test_slow_gateway_fetch_merged_on_next_tick(org_hub_factory, monkeypatch):
+    """A gateway fetch over budget doesn't hold the tick; it lands next tick."""
+    monkeypatch.setattr(
+        network_module, "GATEWAY_CONNECTIONS_LATENCY_BUDGET_SECONDS", 0.01
+    )
+    org_hub = await org_hub_factory()
+    entry = _make_config_entry()
+
+    net_hub = MerakiNetworkHub(org_hub, "N1", "Net 1", "MT", entry)
+    net_hub.devices = [{"serial": "Q2XX-AAAA-0001", "model": "MT14"}]
+
+    release = asyncio.Event()
+    gateway_calls = 0
+
+    async def _gateways():
+        nonlocal gateway_calls
+        gateway_calls += 1
+        await release.wait()
+        return {"Q2XX-AAAA-0001": {"rssi": -70, "last_connected_at": None}}
+
+    org_hub.async_get_all_sensor_readings = AsyncMock(
+        return_value={
+            "Q2XX-AAAA-0001": {"serial": "Q2XX-AAAA-0001", "readings": []},
+        }
+    )
+    org_hub.async_get_all_gateway_connections = _gateways
+
+    first = await net_hub.async_get_sensor_data()
+    assert first["Q2XX-AAAA-0001"]["rssi"] is None
+
+    release.set()
+    await asyncio.sleep(0)
+
+    second = await net_hub.async_get_sensor_data()
+    assert second["Q2XX-AAAA-0001"]["rssi"] == -70
+    # The overrunning fetch was reused rather than issued again
+    assert gateway_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_connections_own_refresh_tier(org_hub_factory, monkeypatch):
+    """Gateway data is cached for its own interval, not the readings TTL."""
+    hub = await org_hub_factory()
+    api = hub.dashboard.sensor
+    api.getOrganizationSensorGatewaysConnectionsLatest = AsyncMock(return_value=[])
+
+    # Default tier is 5 minutes: 120s is past the readings TTL but still cached.
+    times = iter([0.0, 120.0, 301.0])
+    monkeypatch.setattr(hub, "_cache_now", lambda: next(times))
+
+    await hub.async_get_all_gateway_connections()  # now=0   -> fetch
+    await hub.async_get_all_gateway_connections()  # now=120 -> cache hit
+    await hub.async_get_all_gateway_connections()  # now=301 -> fetch again
+
+    assert api.getOrganizationSensorGatewaysConnectionsLatest.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_connections_interval_option(org_hub_factory):
+    """The configured interval drives the tier, floored at the readings TTL."""
+    hub = await org_hub_factory(
+        config_entry=_make_config_entry({CONF_GATEWAY_CONNECTIONS_INTERVAL: 600})
+    )
+    assert hub._get_gateway_connections_ttl() == 600
+
+    hub = await org_hub_factory(
+        config_entry=_make_config_entry({CONF_GATEWAY_CONNECTIONS_INTERVAL: 1})
+    )
+    assert hub._get_gateway_connections_ttl() == hub._org_cache_ttl
+
+
+@pytest.mark.asyncio
+async def test_gateway_connections_concurrent_callers_share_fetch(org_hub_factory):
+    """Hubs ticking while a gateway fetch is in flight share that one call."""
+    hub = await org_hub_factory()
+    release = asyncio.Event()
+
+    async def _rows(*_args, **_kwargs):
+        await release.wait()
+        return [{"sensor": {"serial": "Q2XX-AAAA-0001"}, "rssi": -55}]
+
+    api = hub.dashboard.sensor
+    api.getOrganizationSensorGatewaysConnectionsLatest = AsyncMock(side_effect=_rows)
+
+    callers = [
+        asyncio.ensure_future(hub.async_get_all_gateway_connections()) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert api.getOrganizationSensorGatewaysConnectionsLatest.await_count == 1
+    assert all(result["Q2XX-AAAA-0001"]["rssi"] == -55 for result in results)
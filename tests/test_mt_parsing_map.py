@@ -53,6 +53,13 @@ def test_water_bool_coercion(mt_raw_readings_factory):
     assert out["water"] is True
 
 
+def test_water_present_field(mt_raw_readings_factory):
+    out = _transform(
+        [{"metric": "water", "water": {"present": True}}], mt_raw_readings_factory
+    )
+    assert out["water"] is True
+
+
 def test_downstream_power_bool_coercion(mt_raw_readings_factory):
     out = _transform(
         [{"metric": "downstreamPower", "downstreamPower": {"enabled": True}}],
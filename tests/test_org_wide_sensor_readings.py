@@ -8,11 +8,13 @@ non-list guard that raises instead of silently returning ``{}``.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from custom_components.meraki_dashboard.exceptions import MerakiApiError
+from custom_components.meraki_dashboard.hubs import organization as organization_module
 
 
 @pytest.mark.asyncio
@@ -53,6 +55,34 @@ async def test_org_wide_readings_skips_rows_without_serial(org_hub_factory):
     assert set(result) == {"Q2XX-AAAA-0001"}
 
 
+@pytest.mark.asyncio
+async def test_large_readings_snapshot_built_in_executor(
+    hass, org_hub_factory, monkeypatch
+):
+    """Responses above the size threshold are turned into a snapshot off-loop."""
+    hub = await org_hub_factory()
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = AsyncMock(
+        return_value=[
+            {"serial": "Q2XX-AAAA-0001", "readings": []},
+            {"serial": "Q2XX-AAAA-0002", "readings": []},
+        ]
+    )
+    monkeypatch.setattr(organization_module, "READINGS_EXECUTOR_THRESHOLD", 2)
+    jobs = []
+    add_executor_job = hass.async_add_executor_job
+
+    def _track_job(target, *args):
+        jobs.append(target)
+        return add_executor_job(target, *args)
+
+    monkeypatch.setattr(hass, "async_add_executor_job", _track_job)
+
+    result = await hub.async_get_all_sensor_readings()
+
+    assert set(result) == {"Q2XX-AAAA-0001", "Q2XX-AAAA-0002"}
+    assert jobs == [organization_module._build_readings_snapshot]
+
+
 @pytest.mark.asyncio
 async def test_org_wide_readings_cached_within_ttl(org_hub_factory, monkeypatch):
     """Back-to-back calls within the TTL coalesce to ONE API call."""
@@ -73,6 +103,36 @@ async def test_org_wide_readings_cached_within_ttl(org_hub_factory, monkeypatch)
     assert sensor_api.getOrganizationSensorReadingsLatest.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_prefetch_lead_not_counted_against_max_age(org_hub_factory, monkeypatch):
+    """A snapshot prefetched ahead of its tick still serves an aligned tick."""
+    hub = await org_hub_factory()
+    sensor_api = hub.dashboard.sensor
+    sensor_api.getOrganizationSensorReadingsLatest = AsyncMock(return_value=[])
+
+    times = iter([0.0, 8.0, 8.0])
+    monkeypatch.setattr(hub, "_cache_now", lambda: next(times))
+
+    # Prefetched 6s ahead of the tick, which then allows 5s since the sample
+    await hub._async_fetch_sensor_readings(0.0, lead=6.0)
+    await hub.async_get_all_sensor_readings(max_age=5.0)  # now=8 -> cache hit
+    assert sensor_api.getOrganizationSensorReadingsLatest.await_count == 1
+
+    # A snapshot a tick fetched itself gets no such allowance
+    await hub._async_fetch_sensor_readings(0.0)
+    await hub.async_get_all_sensor_readings(max_age=5.0)  # now=8 -> fetch
+    assert sensor_api.getOrganizationSensorReadingsLatest.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_readings_cadence_shared_per_interval(org_hub_factory):
+    """Hubs polling at the same interval learn one reporting phase."""
+    hub = await org_hub_factory()
+
+    assert hub.readings_cadence(60) is hub.readings_cadence(60)
+    assert hub.readings_cadence(30) is not hub.readings_cadence(60)
+
+
 @pytest.mark.asyncio
 async def test_org_wide_readings_non_list_raises(org_hub_factory):
     """The SDK's exhausted-retry ``{"errors": [...]}`` dict must raise, not return {}."""
@@ -92,3 +152,358 @@ async def test_org_wide_readings_no_dashboard_returns_empty(org_hub_factory):
     hub.dashboard = None
 
     assert await hub.async_get_all_sensor_readings() == {}
+
+
+def _fast_lane_entry():
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.meraki_dashboard.const import (
+        CONF_API_KEY,
+        CONF_BASE_URL,
+        CONF_BINARY_FAST_LANE_ENABLED,
+        CONF_BINARY_FAST_LANE_INTERVAL,
+        CONF_ORGANIZATION_ID,
+        DEFAULT_BASE_URL,
+        DOMAIN,
+    )
+
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_API_KEY: "a1b2c3d4e5f6789012345678901234567890abcd",
+            CONF_BASE_URL: DEFAULT_BASE_URL,
+            CONF_ORGANIZATION_ID: "test_org_123",
+        },
+        options={
+            CONF_BINARY_FAST_LANE_ENABLED: True,
+            CONF_BINARY_FAST_LANE_INTERVAL: 10,
+        },
+        unique_id="test_org_123",
+    )
+
+
+@pytest.mark.asyncio
+async def test_binary_fast_lane_merges_over_full_snapshot(org_hub_factory, monkeypatch):
+    """Between full fetches, a metrics-filtered call refreshes door/water/button."""
+    hub = await org_hub_factory(config_entry=_fast_lane_entry())
+    full_rows = [
+        {
+            "serial": "Q2XX-AAAA-0001",
+            "readings": [
+                {
+                    "ts": "2026-01-01T00:00:00Z",
+                    "metric": "door",
+                    "door": {"open": False},
+                },
+                {
+                    "ts": "2026-01-01T00:00:00Z",
+                    "metric": "temperature",
+                    "temperature": {"celsius": 21.0},
+                },
+            ],
+        },
+        {
+            "serial": "Q2XX-AAAA-0002",
+            "readings": [{"ts": "2026-01-01T00:00:00Z", "metric": "humidity"}],
+        },
+    ]
+    fast_rows = [
+        {
+            "serial": "Q2XX-AAAA-0001",
+            "readings": [
+                {"ts": "2026-01-01T00:00:12Z", "metric": "door", "door": {"open": True}}
+            ],
+        }
+    ]
+
+    async def _latest(*_args, **kwargs):
+        return fast_rows if "metrics" in kwargs else full_rows
+
+    api = hub.dashboard.sensor
+    api.getOrganizationSensorReadingsLatest = AsyncMock(side_effect=_latest)
+
+    times = iter([0.0, 5.0, 12.0, 15.0])
+    monkeypatch.setattr(hub, "_cache_now", lambda: next(times))
+
+    first = await hub.async_get_all_sensor_readings()  # full fetch
+    assert await hub.async_get_all_sensor_readings() is first  # within fast lane
+    merged = await hub.async_get_all_sensor_readings()  # fast-lane fetch
+    assert await hub.async_get_all_sensor_readings() is merged  # cached merge
+
+    assert api.getOrganizationSensorReadingsLatest.await_count == 2
+    _, kwargs = api.getOrganizationSensorReadingsLatest.call_args
+    assert kwargs["metrics"] == ["door"]
+
+    readings = {r["metric"]: r for r in merged["Q2XX-AAAA-0001"]["readings"]}
+    assert readings["door"]["door"] == {"open": True}
+    assert readings["temperature"]["temperature"] == {"celsius": 21.0}
+    # The cached full snapshot is left untouched
+    assert first["Q2XX-AAAA-0001"]["readings"][0]["door"] == {"open": False}
+    assert merged["Q2XX-AAAA-0002"] is first["Q2XX-AAAA-0002"]
+
+
+@pytest.mark.asyncio
+async def test_binary_fast_lane_skipped_without_binary_metrics(
+    org_hub_factory, monkeypatch
+):
+    """No fast-lane call is made when no sensor in the fleet reports one."""
+    hub = await org_hub_factory(config_entry=_fast_lane_entry())
+    api = hub.dashboard.sensor
+    api.getOrganizationSensorReadingsLatest = AsyncMock(
+        return_value=[
+            {"serial": "Q2XX-AAAA-0001", "readings": [{"metric": "temperature"}]}
+        ]
+    )
+
+    times = iter([0.0, 12.0])
+    monkeypatch.setattr(hub, "_cache_now", lambda: next(times))
+
+    await hub.async_get_all_sensor_readings()
+    await hub.async_get_all_sensor_readings()
+
+    assert api.getOrganizationSensorReadingsLatest.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_readings_request_only_metrics_with_enabled_entities(
+    hass, org_hub_factory
+):
+    """Metrics whose entities are all disabled are left out of the request."""
+    from homeassistant.helpers import entity_registry as er
+
+    hub = await org_hub_factory()
+    entry_id = hub.config_entry.entry_id
+    registry = er.async_get(hass)
+    unsub = hub.async_track_enabled_metrics()
+    assert hub.enabled_metrics is None
+
+    registry.async_get_or_create(
+        "sensor",
+        "meraki_dashboard",
+        f"{entry_id}_Q2XX-AAAA-0001_temperature",
+        config_entry=hub.config_entry,
+    )
+    tvoc = registry.async_get_or_create(
+        "sensor",
+        "meraki_dashboard",
+        f"{entry_id}_Q2XX-AAAA-0001_tvoc",
+        config_entry=hub.config_entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    await hass.async_block_till_done()
+
+    assert hub.enabled_metrics is not None
+    assert "tvoc" not in hub.enabled_metrics
+    assert "temperature" in hub.enabled_metrics
+    # Event metrics are always requested
+    assert "button" in hub.enabled_metrics
+
+    api = hub.dashboard.sensor
+    api.getOrganizationSensorReadingsLatest = AsyncMock(return_value=[])
+    await hub.async_get_all_sensor_readings()
+    _, kwargs = api.getOrganizationSensorReadingsLatest.call_args
+    assert kwargs["metrics"] == list(hub.enabled_metrics)
+
+    # Re-enabling the entity drops the filter again
+    registry.async_update_entity(tvoc.entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+    assert hub.enabled_metrics is None
+
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_sensors_with_all_entities_disabled_are_unwatched(hass, org_hub_factory):
+    """A sensor is unwatched only when every readings entity it has is disabled."""
+    from homeassistant.helpers import entity_registry as er
+
+    hub = await org_hub_factory()
+    entry_id = hub.config_entry.entry_id
+    registry = er.async_get(hass)
+    unsub = hub.async_track_enabled_metrics()
+    assert hub.unwatched_serials == frozenset()
+
+    for serial, key, disabled_by in (
+        ("Q2XX-AAAA-0001", "temperature", er.RegistryEntryDisabler.USER),
+        ("Q2XX-AAAA-0001", "rssi", None),
+        ("Q2XX-AAAA-0002", "temperature", er.RegistryEntryDisabler.USER),
+        ("Q2XX-AAAA-0002", "humidity", None),
+    ):
+        registry.async_get_or_create(
+            "sensor",
+            "meraki_dashboard",
+            f"{entry_id}_{serial}_{key}",
+            config_entry=hub.config_entry,
+            disabled_by=disabled_by,
+        )
+    await hass.async_block_till_done()
+
+    # An enabled RSSI entity doesn't need fresh readings
+    assert hub.unwatched_serials == frozenset({"Q2XX-AAAA-0001"})
+
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_enabled_metrics_tracked_without_rescanning_registry(
+    hass, org_hub_factory, monkeypatch
+):
+    """Registry events update the counts for one entity, not the whole registry."""
+    from homeassistant.helpers import entity_registry as er
+
+    hub = await org_hub_factory()
+    entry_id = hub.config_entry.entry_id
+    registry = er.async_get(hass)
+    scans = []
+    entries_for_config_entry = er.async_entries_for_config_entry
+    monkeypatch.setattr(
+        er,
+        "async_entries_for_config_entry",
+        lambda *args: scans.append(args) or entries_for_config_entry(*args),
+    )
+    unsub = hub.async_track_enabled_metrics()
+
+    entities = [
+        registry.async_get_or_create(
+            "sensor",
+            "meraki_dashboard",
+            f"{entry_id}_Q2XX-AAAA-{index:04}_tvoc",
+            config_entry=hub.config_entry,
+            disabled_by=er.RegistryEntryDisabler.USER,
+        )
+        for index in range(3)
+    ]
+    await hass.async_block_till_done()
+    assert "tvoc" not in hub.enabled_metrics
+    assert len(hub.unwatched_serials) == 3
+
+    # Removing the entities drops their share of the counts
+    for entity in entities:
+        registry.async_remove(entity.entity_id)
+    await hass.async_block_till_done()
+    assert hub.enabled_metrics is None
+    assert hub.unwatched_serials == frozenset()
+    assert len(scans) == 1
+
+    unsub()
+
+
+def _expire_readings_cache(hub, hass) -> None:
+    """Age the cached readings snapshot well past its TTL."""
+    _fetched_at, snapshot = hub._sensor_readings_cache
+    hub._sensor_readings_cache = (hass.loop.time() - 3600, snapshot)
+
+
+@pytest.mark.asyncio
+async def test_readings_prefetched_ahead_of_tick(hass, org_hub_factory):
+    """A registered tick gets a warm snapshot fetched shortly before it."""
+    hub = await org_hub_factory()
+    api = AsyncMock(return_value=[{"serial": "Q2XX-AAAA-0001", "readings": []}])
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = api
+    await hub.async_get_all_sensor_readings()  # seeds the fetch durations
+    _expire_readings_cache(hub, hass)
+
+    # Lead is ~1s (fast fetches + margin), so the prefetch fires right away.
+    hub.async_schedule_readings_prefetch(hass.loop.time() + 1.05)
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+    assert api.await_count == 2
+
+    await hub.async_get_all_sensor_readings()  # the tick: warm cache
+    assert api.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_readings_prefetch_skipped_when_snapshot_covers_tick(
+    hass, org_hub_factory
+):
+    """No prefetch is armed for a tick the current snapshot still covers."""
+    hub = await org_hub_factory()
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = AsyncMock(
+        return_value=[]
+    )
+    await hub.async_get_all_sensor_readings()
+
+    hub.async_schedule_readings_prefetch(hass.loop.time() + 5)
+
+    assert hub._readings_prefetch_handle is None
+    assert hub._readings_prefetch_ticks == []
+
+
+@pytest.mark.asyncio
+async def test_tick_shares_in_flight_prefetch(hass, org_hub_factory):
+    """A tick landing while the prefetch runs awaits it instead of refetching."""
+    hub = await org_hub_factory()
+    rows = [{"serial": "Q2XX-AAAA-0001", "readings": []}]
+    release = asyncio.Event()
+
+    async def _readings(*_args, **_kwargs):
+        await release.wait()
+        return rows
+
+    api = AsyncMock(side_effect=_readings)
+    hub.dashboard.sensor.getOrganizationSensorReadingsLatest = api
+    release.set()
+    await hub.async_get_all_sensor_readings()
+    _expire_readings_cache(hub, hass)
+    release.clear()
+
+    hub._start_readings_prefetch()
+    await asyncio.sleep(0)
+    tick = asyncio.ensure_future(hub.async_get_all_sensor_readings())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert set(await tick) == {"Q2XX-AAAA-0001"}
+    assert api.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_readings_history_scoped_to_serials_and_metrics(
+    org_hub_factory, monkeypatch
+):
+    """History backfill is one call filtered by serials, metrics and t0."""
+    monkeypatch.setattr(organization_module, "READINGS_HISTORY_COALESCE_SECONDS", 0)
+    hub = await org_hub_factory()
+    row = {"serial": "Q2XX-AAAA-0001", "metric": "door", "ts": "2026-01-01T00:00:10Z"}
+    sensor_api = hub.dashboard.sensor
+    sensor_api.getOrganizationSensorReadingsHistory = AsyncMock(
+        return_value={"items": [row, "junk"], "meta": {}}
+    )
+
+    rows = await hub.async_get_sensor_readings_history(
+        ["Q2XX-AAAA-0001"], ["door"], "2026-01-01T00:00:00Z"
+    )
+
+    assert rows == [row]
+    _, kwargs = sensor_api.getOrganizationSensorReadingsHistory.call_args
+    assert kwargs["serials"] == ["Q2XX-AAAA-0001"]
+    assert kwargs["metrics"] == ["door"]
+    assert kwargs["t0"] == "2026-01-01T00:00:00Z"
+    assert kwargs["total_pages"] == "all"
+
+
+@pytest.mark.asyncio
+async def test_readings_history_requests_merged_across_hubs(
+    org_hub_factory, monkeypatch
+):
+    """History requests made together share one org-wide call."""
+    monkeypatch.setattr(organization_module, "READINGS_HISTORY_COALESCE_SECONDS", 0)
+    hub = await org_hub_factory()
+    sensor_api = hub.dashboard.sensor
+    sensor_api.getOrganizationSensorReadingsHistory = AsyncMock(return_value=[])
+
+    await asyncio.gather(
+        hub.async_get_sensor_readings_history(
+            ["Q2XX-AAAA-0002"], ["door"], "2026-01-01T00:00:20Z"
+        ),
+        hub.async_get_sensor_readings_history(
+            ["Q2XX-AAAA-0001"], ["button"], "2026-01-01T00:00:10Z"
+        ),
+    )
+
+    sensor_api.getOrganizationSensorReadingsHistory.assert_awaited_once()
+    _, kwargs = sensor_api.getOrganizationSensorReadingsHistory.call_args
+    assert kwargs["serials"] == ["Q2XX-AAAA-0001", "Q2XX-AAAA-0002"]
+    assert kwargs["metrics"] == ["button", "door"]
+    assert kwargs["t0"] == "2026-01-01T00:00:10Z"
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from meraki.exceptions import APIError
 
+from custom_components.meraki_dashboard.exceptions import MerakiApiError
 from custom_components.meraki_dashboard.utils.rate_limiter import MerakiRateLimiter
 
 
@@ -106,6 +107,41 @@ async def test_non_429_not_retried(org_hub_factory, monkeypatch):
     assert calls["n"] == 1
 
 
+@pytest.mark.asyncio
+async def test_action_batch_429_retried_after_retry_after(org_hub_factory, monkeypatch):
+    """Our own 429 ``MerakiApiError`` (action batches) gets the same retry."""
+    hub = await org_hub_factory()
+
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(
+        "custom_components.meraki_dashboard.hubs.organization.asyncio.sleep",
+        fake_sleep,
+    )
+
+    calls = {"n": 0}
+
+    async def post_batch():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise MerakiApiError(
+                "Action batch rejected with status 429",
+                status_code=429,
+                response_text='{"errors": ["Too many requests"]}',
+                retry_after="1",
+            )
+        return '{"id": "batch"}'
+
+    result = await hub._api_call_with_retry(post_batch, max_retries=1, cap_seconds=2)
+
+    assert result == '{"id": "batch"}'
+    assert calls["n"] == 2
+    assert slept == [1.0]
+
+
 def test_budget_fraction_reduces_effective_rate():
     """budget_fraction scales max_calls_per_second by ~80%, floored at 1."""
     limiter = MerakiRateLimiter(
@@ -130,3 +166,21 @@ def test_budget_fraction_default_is_08():
     """Default budget_fraction leaves headroom (80%)."""
     limiter = MerakiRateLimiter(max_calls_per_second=10, max_concurrent=5)
     assert limiter._max_calls_per_second == 8
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_notifies_listeners_on_queue_changes():
+    """Listeners run when a call is queued and again when it completes."""
+    limiter = MerakiRateLimiter(max_calls_per_second=10, max_concurrent=1)
+    depths: list[int] = []
+    remove = limiter.add_listener(lambda: depths.append(limiter.queue_depth))
+
+    try:
+        assert await limiter.submit(lambda: "ok", priority=0) == "ok"
+    finally:
+        await limiter.stop()
+
+    assert len(depths) >= 2
+    assert depths[-1] == 0
+    remove()
+    assert limiter._listeners == []
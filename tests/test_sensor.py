@@ -5,8 +5,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.meraki_dashboard.const import (
+    ATTR_LAST_REPORTED_AT,
+    ATTR_TEMPERATURE_FAHRENHEIT,
+    CONF_DEADBAND_ENABLED,
+    CONF_DEADBAND_MAX_AGE,
+    CONF_METRIC_DEADBANDS,
+    CONF_VOLATILE_ATTRIBUTE_ENTITIES,
     DOMAIN,
     MT_SENSOR_BATTERY,
     MT_SENSOR_CO2,
@@ -16,8 +23,10 @@ from custom_components.meraki_dashboard.const import (
 )
 from custom_components.meraki_dashboard.devices.mt import (
     MT_SENSOR_DESCRIPTIONS,
+    MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS,
     MerakiMTEnergySensor,
     MerakiMTSensor,
+    MerakiMTVolatileAttributeSensor,
 )
 from custom_components.meraki_dashboard.sensor import async_setup_entry
 from tests.fixtures.meraki_api import MOCK_PROCESSED_SENSOR_DATA
@@ -28,6 +37,8 @@ def mock_coordinator():
     """Mock sensor coordinator."""
     coordinator = MagicMock()
     coordinator.data = MOCK_PROCESSED_SENSOR_DATA
+    coordinator.config_entry.options = {}
+    coordinator.reading_is_stale.return_value = False
     coordinator.async_request_refresh = AsyncMock()
     return coordinator
 
@@ -632,6 +643,41 @@ class TestSensorSetup:
         # Should handle gracefully and call add_entities with empty list
         add_entities_mock.assert_called_once_with([], True)
 
+    async def test_async_setup_entry_unfiltered_device(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test a device with unknown capabilities gets every MT sensor."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data=dict(mock_config_entry.data),
+            options={CONF_VOLATILE_ATTRIBUTE_ENTITIES: True},
+        )
+        mock_network_hub = MagicMock()
+        mock_network_hub.device_type = "MT"
+        mock_network_hub.devices = [{"serial": "Q2XX-0001", "name": "Unknown"}]
+        mock_coordinator = MagicMock()
+        mock_coordinator.network_hub = mock_network_hub
+        mock_coordinator.data = {}
+
+        hass.data[DOMAIN] = {
+            config_entry.entry_id: {
+                "organization_hub": MagicMock(),
+                "network_hubs": {"hub1": mock_network_hub},
+                "coordinators": {"hub1": mock_coordinator},
+            }
+        }
+        add_entities_mock = MagicMock()
+
+        await async_setup_entry(hass, config_entry, add_entities_mock)
+
+        entities = add_entities_mock.call_args[0][0]
+        assert any(isinstance(e, MerakiMTEnergySensor) for e in entities)
+        assert any(
+            isinstance(e, MerakiMTVolatileAttributeSensor)
+            and e.entity_description.key == ATTR_TEMPERATURE_FAHRENHEIT
+            for e in entities
+        )
+
 
 class TestSensorDescriptions:
     """Test sensor description dictionaries."""
@@ -1010,6 +1056,177 @@ class TestSensorExtraStateAttributes:
         assert attrs["temperature_fahrenheit"] == 72.5
 
 
+class TestVolatileAttributes:
+    """Test recorder handling of per-reading attributes."""
+
+    @pytest.fixture
+    def temperature_data(self):
+        """Coordinator data with a single temperature reading."""
+        return {
+            "Q2XX-XXXX-XXXX": {
+                "readings": [
+                    {
+                        "metric": "temperature",
+                        "ts": "2024-01-01T12:00:00.000000Z",
+                        "temperature": {"celsius": 22.5, "fahrenheit": 72.5},
+                    }
+                ]
+            }
+        }
+
+    def test_volatile_attributes_are_unrecorded(self):
+        """Test per-reading attributes are excluded from the recorder."""
+        assert ATTR_LAST_REPORTED_AT in MerakiMTSensor._unrecorded_attributes
+        assert ATTR_TEMPERATURE_FAHRENHEIT in MerakiMTSensor._unrecorded_attributes
+
+    def test_attributes_omitted_when_exposed_as_entities(
+        self, mock_coordinator, mock_device_info, mock_network_hub, temperature_data
+    ):
+        """Test attributes move off the sensor when the option is enabled."""
+        mock_coordinator.data = temperature_data
+        mock_coordinator.config_entry.options = {CONF_VOLATILE_ATTRIBUTE_ENTITIES: True}
+        sensor = MerakiMTSensor(
+            coordinator=mock_coordinator,
+            device=mock_device_info,
+            description=MT_SENSOR_DESCRIPTIONS[MT_SENSOR_TEMPERATURE],
+            config_entry_id="test_entry",
+            network_hub=mock_network_hub,
+        )
+
+        attrs = sensor.extra_state_attributes
+        assert ATTR_LAST_REPORTED_AT not in attrs
+        assert ATTR_TEMPERATURE_FAHRENHEIT not in attrs
+
+    def test_volatile_attribute_sensor_values(
+        self, mock_coordinator, mock_device_info, mock_network_hub, temperature_data
+    ):
+        """Test diagnostic entities report the former attribute values."""
+        mock_coordinator.data = temperature_data
+        last_reported = MerakiMTVolatileAttributeSensor(
+            coordinator=mock_coordinator,
+            device=mock_device_info,
+            description=MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS[
+                ATTR_LAST_REPORTED_AT
+            ],
+            config_entry_id="test_entry",
+            network_hub=mock_network_hub,
+        )
+        fahrenheit = MerakiMTVolatileAttributeSensor(
+            coordinator=mock_coordinator,
+            device=mock_device_info,
+            description=MT_VOLATILE_ATTRIBUTE_SENSOR_DESCRIPTIONS[
+                ATTR_TEMPERATURE_FAHRENHEIT
+            ],
+            config_entry_id="test_entry",
+            network_hub=mock_network_hub,
+        )
+
+        assert last_reported.native_value.isoformat() == "2024-01-01T12:00:00+00:00"
+        assert fahrenheit.native_value == 72.5
+
+        mock_coordinator.data = {"Q2XX-XXXX-XXXX": {"readings": []}}
+        assert fahrenheit.native_value is None
+        assert not fahrenheit.available
+
+
+class TestSignificantChangeFilter:
+    """Test deadband filtering of MT sensor state writes."""
+
+    @staticmethod
+    def _readings(celsius):
+        return {
+            "Q2XX-XXXX-XXXX": {
+                "readings": [
+                    {
+                        "metric": "temperature",
+                        "ts": "2024-01-01T12:00:00.000000Z",
+                        "temperature": {"celsius": celsius},
+                    }
+                ]
+            }
+        }
+
+    @pytest.fixture
+    def sensor(self, mock_coordinator, mock_device_info, mock_network_hub):
+        """Temperature sensor with deadband filtering enabled."""
+        mock_coordinator.last_update_success = True
+        mock_coordinator.config_entry.options = {
+            CONF_DEADBAND_ENABLED: True,
+            CONF_DEADBAND_MAX_AGE: 300,
+        }
+        sensor = MerakiMTSensor(
+            coordinator=mock_coordinator,
+            device=mock_device_info,
+            description=MT_SENSOR_DESCRIPTIONS[MT_SENSOR_TEMPERATURE],
+            config_entry_id="test_entry",
+            network_hub=mock_network_hub,
+        )
+        sensor.async_write_ha_state = MagicMock()
+        return sensor
+
+    def test_jitter_within_deadband_is_not_written(
+        self, sensor, mock_coordinator, monkeypatch
+    ):
+        """Test jitter around a setpoint does not produce state writes."""
+        now = 1000.0
+        monkeypatch.setattr(
+            "custom_components.meraki_dashboard.devices.mt.time.monotonic",
+            lambda: now,
+        )
+
+        for celsius in (22.0, 22.1, 21.9, 22.1, 22.0):
+            mock_coordinator.data = self._readings(celsius)
+            sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 1
+
+        mock_coordinator.data = self._readings(22.3)
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_heartbeat_forces_write(self, sensor, mock_coordinator, monkeypatch):
+        """Test a held value is written once the max age has passed."""
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(
+            "custom_components.meraki_dashboard.devices.mt.time.monotonic",
+            lambda: clock["now"],
+        )
+
+        mock_coordinator.data = self._readings(22.0)
+        sensor._handle_coordinator_update()
+        mock_coordinator.data = self._readings(22.1)
+        clock["now"] += 299
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        clock["now"] += 1
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_per_metric_override(self, sensor, mock_coordinator):
+        """Test a configured per-metric deadband replaces the class default."""
+        mock_coordinator.config_entry.options[CONF_METRIC_DEADBANDS] = {
+            MT_SENSOR_TEMPERATURE: 1.0
+        }
+
+        mock_coordinator.data = self._readings(22.0)
+        sensor._handle_coordinator_update()
+        mock_coordinator.data = self._readings(22.5)
+        sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 1
+
+    def test_disabled_writes_every_update(self, sensor, mock_coordinator):
+        """Test every update is written when filtering is disabled."""
+        mock_coordinator.config_entry.options[CONF_DEADBAND_ENABLED] = False
+
+        for celsius in (22.0, 22.1, 22.0):
+            mock_coordinator.data = self._readings(celsius)
+            sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 3
+
+
 class TestSensorAvailability:
     """Test sensor availability functionality."""
 
@@ -194,6 +194,7 @@ class TestSensorEntityStates:
             }
         }
         coordinator.last_update_success = True
+        coordinator.reading_is_stale.return_value = False
 
         network_hub = MagicMock()
 
@@ -186,6 +186,24 @@ class TestTransformerRegistry:
         result = transformer_registry.transform_device_data("MT", test_data)
         assert result["temperature"] == 22.0
 
+    def test_transform_with_metric_parse_set(self):
+        """Test only the requested metrics are parsed."""
+        test_data = {
+            "rssi": -60,
+            "readings": [
+                {"metric": "temperature", "temperature": {"celsius": 22.0}},
+                {"metric": "humidity", "humidity": {"relativePercentage": 40}},
+            ],
+        }
+
+        result = transformer_registry.transform_device_data(
+            "MT", test_data, ("humidity",)
+        )
+        assert result["humidity"] == 40
+        assert "temperature" not in result
+        # Gateway values merged onto the device are not readings metrics
+        assert result["signalStrength"] == -60
+
     def test_transform_unknown_device_type(self):
         """Test transformation with unknown device type."""
         test_data = {"some": "data"}
@@ -13,13 +13,21 @@ from custom_components.meraki_dashboard.utils.cache import (
     clear_api_cache,
     get_cached_api_response,
 )
+from custom_components.meraki_dashboard.utils.cadence import (
+    ADAPTIVE_MIN_FETCHES,
+    CADENCE_MIN_SAMPLES,
+    AdaptiveIntervalController,
+    CadenceTracker,
+)
 from custom_components.meraki_dashboard.utils.device_info import (
+    build_capability_index,
     create_device_capability_filter,
     determine_device_type,
     device_matches_type,
     get_device_status_info,
     should_create_entity,
 )
+from custom_components.meraki_dashboard.utils.freshness import ReadingFreshnessIndex
 from custom_components.meraki_dashboard.utils.helpers import batch_api_calls
 from custom_components.meraki_dashboard.utils.performance import (
     get_performance_metrics,
@@ -920,6 +928,229 @@ class TestShouldCreateEntity:
         assert should_create_entity(device, None) is False
 
 
+class TestBuildCapabilityIndex:
+    """Test the per-snapshot capability index."""
+
+    def test_model_table_without_readings(self):
+        """Test devices without readings fall back to the model table."""
+        devices = [{"model": "MT12", "serial": "Q2XX-0001", "productType": "mt"}]
+
+        index = build_capability_index(devices)
+
+        assert isinstance(index["Q2XX-0001"], frozenset)
+        assert index["Q2XX-0001"] == frozenset(
+            create_device_capability_filter("MT12", SENSOR_TYPE_MT)
+        )
+
+    def test_discovered_metrics_intersect_model_table(self):
+        """Test discovered metrics are normalized and limited to the model."""
+        devices = [{"model": "MT15", "serial": "Q2XX-0001", "productType": "mt"}]
+        coordinator_data = {
+            "Q2XX-0001": {
+                "readings": [
+                    {"metric": "temperature"},
+                    {"metric": "noise.ambient.level"},
+                    {"metric": "water"},
+                ]
+            }
+        }
+
+        index = build_capability_index(devices, coordinator_data)
+
+        assert index["Q2XX-0001"] == frozenset({"temperature", "noise"})
+
+    def test_matches_should_create_entity(self):
+        """Test the index agrees with should_create_entity for MT devices."""
+        devices = [
+            {"model": "MT11", "serial": "Q2XX-0001", "productType": "mt"},
+            {"model": "MT30", "serial": "Q2XX-0002", "productType": "mt"},
+            {"model": "MT40", "serial": "Q2XX-0003", "productType": "mt"},
+        ]
+        coordinator_data = {
+            "Q2XX-0001": {"readings": [{"metric": "temperature"}]},
+            "Q2XX-0003": {"readings": [{"metric": "realPower"}]},
+        }
+        metrics = create_device_capability_filter("", SENSOR_TYPE_MT)
+
+        index = build_capability_index(devices, coordinator_data)
+
+        for device in devices:
+            for metric in metrics:
+                assert (metric in index[device["serial"]]) is should_create_entity(
+                    device, metric, coordinator_data
+                )
+
+    def test_device_without_model_not_filtered(self):
+        """Test a non-MT device nothing is known about allows every metric."""
+        device = {"serial": "Q2XX-0001"}
+
+        index = build_capability_index([device])
+
+        assert index["Q2XX-0001"] is None
+        assert should_create_entity(device, "temperature") is True
+
+    def test_skips_devices_without_serial(self):
+        """Test devices without a serial are not indexed."""
+        index = build_capability_index([{"model": "MT11", "productType": "mt"}])
+
+        assert index == {}
+
+
+class TestCadenceTracker:
+    """Test reporting-phase learning for cadence-aligned polling."""
+
+    def test_falls_back_to_fixed_interval_without_history(self):
+        """Too few samples keep the fixed interval."""
+        tracker = CadenceTracker(60)
+        tracker.observe([12.0, 72.0], fetched_at=80.0)
+
+        assert tracker.phase is None
+        assert tracker.next_delay(100.0) == 60
+        assert tracker.aligned is False
+        assert tracker.max_cache_age(100.0) is None
+
+    def test_learns_clustered_phase(self):
+        """Samples at a common offset schedule the fetch just after it."""
+        tracker = CadenceTracker(60, margin=5)
+        tracker.observe(
+            [cycle * 60 + 12 for cycle in range(CADENCE_MIN_SAMPLES)], 1000.0
+        )
+
+        assert tracker.phase == pytest.approx(12)
+        # now=1200 is offset 0 -> next fetch at offset 17
+        assert tracker.next_delay(1200.0) == pytest.approx(17)
+        assert tracker.aligned is True
+        assert tracker.max_cache_age(1200.0) == pytest.approx(48)
+
+    def test_phase_wraps_around_interval(self):
+        """Samples straddling the interval boundary average across it."""
+        tracker = CadenceTracker(60)
+        tracker.observe(
+            [cycle * 60 + (58 if cycle % 2 else 62) for cycle in range(10)], 1000.0
+        )
+
+        phase = tracker.phase
+        assert phase is not None
+        assert min(phase, 60 - phase) == pytest.approx(0, abs=0.01)
+
+    def test_spread_samples_keep_fixed_interval(self):
+        """Sensors reporting uniformly across the interval are not aligned."""
+        tracker = CadenceTracker(60)
+        tracker.observe([index * 6.0 for index in range(20)], 1000.0)
+
+        assert tracker.phase is None
+        assert tracker.next_delay(1000.0) == 60
+
+    def test_lag_split_by_scheduling_mode(self):
+        """Lag is reported separately for fixed and aligned fetches."""
+        tracker = CadenceTracker(60, margin=5)
+        tracker.observe([cycle * 60 + 12 for cycle in range(10)], 600.0)
+        tracker.next_delay(600.0)
+        tracker.observe([612.0], 617.0)
+
+        summary = tracker.as_dict()
+        assert summary["aligned"] is True
+        assert summary["phase_seconds"] == pytest.approx(12)
+        assert summary["mean_lag_aligned_seconds"] == 5.0
+        assert summary["mean_lag_fixed_seconds"] > 5.0
+
+
+class TestAdaptiveIntervalController:
+    """Test the adaptive per-hub scan interval controller."""
+
+    def test_initial_interval_clamped_to_bounds(self):
+        """The starting interval respects the configured bounds."""
+        assert AdaptiveIntervalController(10, 60, 900).interval == 60
+        assert AdaptiveIntervalController(1200, 60, 900).interval == 900
+
+    def test_quiet_hub_stretches_to_maximum(self):
+        """Fetches that bring nothing new stretch the interval up to the max."""
+        controller = AdaptiveIntervalController(60, 60, 300)
+        for _ in range(20):
+            controller.record(False, {})
+
+        assert controller.interval == 300
+        assert controller.activity == 0.0
+
+    def test_busy_volatile_hub_shrinks_to_minimum(self):
+        """New, changing values every fetch shrink the interval to the min."""
+        controller = AdaptiveIntervalController(600, 60, 900)
+        for step in range(20):
+            controller.record(True, {("Q2XX", "co2"): 400.0 + 40 * (step % 2)})
+
+        assert controller.interval == 60
+        assert controller.volatility > 0.01
+
+    def test_stable_values_stretch_even_when_reporting(self):
+        """New samples with unchanged values still count as quiet."""
+        controller = AdaptiveIntervalController(60, 60, 900)
+        for _ in range(ADAPTIVE_MIN_FETCHES):
+            controller.record(True, {("Q2XX", "temperature"): 4.0})
+
+        assert controller.interval == 90
+
+    def test_should_fetch(self):
+        """Ticks are skipped until due unless the org snapshot is already warm."""
+        controller = AdaptiveIntervalController(120, 30, 900)
+
+        assert controller.should_fetch(60, 30, snapshot_fresh=False) is False
+        assert controller.should_fetch(60, 30, snapshot_fresh=True) is True
+        assert controller.should_fetch(105, 30, snapshot_fresh=False) is True
+        assert controller.as_dict()["skipped_ticks"] == 1
+
+
+class TestReadingFreshnessIndex:
+    """Test per-sensor reading freshness and staleness."""
+
+    def test_parses_each_timestamp_once(self):
+        """Repeated timestamps are not parsed again."""
+        index = ReadingFreshnessIndex()
+        assert index.known("Q2XX", "temperature") is False
+        assert index.observe("Q2XX", "temperature", "2024-01-01T12:00:00Z") is True
+        assert index.known("Q2XX", "temperature") is True
+        assert index.observe("Q2XX", "temperature", "2024-01-01T12:00:00Z") is False
+        assert index.reading_time("Q2XX", "temperature") == 1704110400.0
+
+    def test_serial_time_is_latest_metric(self):
+        """The serial's reading time is its newest reading across metrics."""
+        index = ReadingFreshnessIndex()
+        index.observe("Q2XX", "temperature", "2024-01-01T12:00:00Z")
+        index.observe("Q2XX", "battery", "2024-01-01T11:00:00Z")
+
+        assert index.reading_time("Q2XX") == 1704110400.0
+        assert index.reading_time("Q2XX", "humidity") is None
+
+    def test_staleness_policy(self):
+        """Readings past the threshold are stale unless exempt or unknown."""
+        index = ReadingFreshnessIndex(threshold=600, exempt={"door"})
+        index.observe("Q2XX", "temperature", "2024-01-01T12:00:00Z")
+        index.observe("Q2XX", "door", "2024-01-01T08:00:00Z")
+        now = 1704110400.0 + 601
+
+        assert index.is_stale("Q2XX", "temperature", now) is True
+        assert index.is_stale("Q2XX", "temperature", now - 2) is False
+        assert index.is_stale("Q2XX", "door", now) is False
+        # No reading of its own: follows the sensor's latest reading
+        assert index.is_stale("Q2XX", "signalStrength", now) is True
+        assert index.is_stale("Q2YY", "temperature", now) is False
+
+    def test_disabled_threshold_is_never_stale(self):
+        """A zero threshold disables staleness checks."""
+        index = ReadingFreshnessIndex()
+        index.observe("Q2XX", "temperature", "2024-01-01T12:00:00Z")
+
+        assert index.is_stale("Q2XX", "temperature", 1e12) is False
+        assert index.as_dict(1704110460.0)["stale_sensors"] == 0
+
+    def test_unparseable_timestamp(self):
+        """Invalid timestamps are tracked as seen but have no reading time."""
+        index = ReadingFreshnessIndex(threshold=60)
+        assert index.observe("Q2XX", "temperature", "not-a-date") is True
+
+        assert index.reading_time("Q2XX", "temperature") is None
+        assert index.is_stale("Q2XX", "temperature", 1e12) is False
+
+
 class TestGetDeviceStatusInfo:
     """Test the get_device_status_info function."""
 